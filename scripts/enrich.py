@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Attach Semantic Scholar citation counts to the paper corpus.
+为论文语料补全 Semantic Scholar 引用数
+
+Usage:
+    python scripts/enrich.py --output ./reports/citations.csv
+    python scripts/enrich.py --data-root /path/to/papers --cache ./.cache/s2.sqlite --rps 1
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv  # noqa: E402
+
+from src.data.corpus import Corpus  # noqa: E402
+from src.enrichment.cache import DEFAULT_TTL_S, MetadataCache  # noqa: E402
+from src.enrichment.client import DEFAULT_BASE_URL, SemanticScholarClient  # noqa: E402
+from src.enrichment.enricher import CitationEnricher  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Fetch citation counts for every paper in the corpus",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--data-root", type=str, default=None, help="Papers data root (default: PAPERS_DATA_ROOT)"
+    )
+    parser.add_argument(
+        "--output", "-o", type=str, required=True, help="CSV with conference, id, citation_count"
+    )
+    parser.add_argument(
+        "--cache", type=str, default=".cache/semantic_scholar.sqlite", help="SQLite cache file"
+    )
+    parser.add_argument(
+        "--ttl-days", type=float, default=DEFAULT_TTL_S / 86400, help="Cache entry lifetime"
+    )
+    parser.add_argument("--rps", type=float, default=1.0, help="Requests per second")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace, corpus: Corpus) -> None:
+    """Enrich the corpus in place."""
+    cache = MetadataCache(args.cache, ttl_s=args.ttl_days * 86400)
+    async with SemanticScholarClient(
+        api_key=os.environ.get("SEMANTIC_SCHOLAR_API_KEY") or None,
+        base_url=os.environ.get("SEMANTIC_SCHOLAR_BASE_URL") or DEFAULT_BASE_URL,
+        rate_limit_rps=args.rps,
+    ) as client:
+        enricher = CitationEnricher(client, cache, concurrency=args.concurrency)
+        await enricher.enrich_corpus(corpus)
+    cache.close()
+    print(f"[INFO] {enricher.stats.model_dump_json()}", file=sys.stderr)
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+    load_dotenv()
+
+    corpus = Corpus.load(args.data_root)
+    print(f"[INFO] Enriching {len(corpus)} papers", file=sys.stderr)
+    asyncio.run(run(args, corpus))
+
+    columns = ["conference", "id", "title", "year", "citation_count"]
+    corpus.frame[columns].to_csv(args.output, index=False)
+    print(f"[INFO] Citation counts written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
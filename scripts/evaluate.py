@@ -6,12 +6,23 @@ Evaluate a research direction using the P-F-C model.
 Usage:
     python scripts/evaluate.py --direction "Video Generation"
     python scripts/evaluate.py --direction "RAG" --output ./reports/rag.md
+    python scripts/evaluate.py --directions-file directions.txt --output ./reports/batch
 """
 
 import argparse
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv  # noqa: E402
+
+from src.evaluation.engine import EvaluationEngine  # noqa: E402
+from src.llm.factory import LLMClientFactory  # noqa: E402
+from src.report.renderer import ReportRenderer  # noqa: E402
+from src.report.writer import BatchReportWriter  # noqa: E402
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -19,17 +30,25 @@ def parse_args() -> argparse.Namespace:
         description="Evaluate AI research direction using P-F-C model",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--direction", "-d",
         type=str,
-        required=True,
         help="Research direction to evaluate (e.g., 'Video Generation', 'RAG')",
     )
+    source.add_argument(
+        "--directions-file", "-f",
+        type=str,
+        help="Text file with one direction per line (blank lines and '#' comments skipped)",
+    )
     parser.add_argument(
         "--output", "-o",
         type=str,
         default=None,
-        help="Output file path for the evaluation report (default: stdout)",
+        help=(
+            "Report file (default: stdout); with --directions-file, the directory "
+            "receiving index, per-direction reports and indicator_matrix.npz"
+        ),
     )
     parser.add_argument(
         "--compute-budget",
@@ -37,6 +56,13 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Your compute budget constraint (e.g., 'single-4090', '8xA100')",
     )
+    parser.add_argument(
+        "--batch-mode",
+        type=str,
+        choices=["none", "dimension", "all"],
+        default="none",
+        help="Indicators scored per LLM call (default: none, one call per indicator)",
+    )
     parser.add_argument(
         "--language",
         type=str,
@@ -44,23 +70,93 @@ def parse_args() -> argparse.Namespace:
         default="both",
         help="Output language (default: both)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--formats",
+        type=str,
+        default="md",
+        help="Comma-separated batch report formats: md, html (default: md)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Directions evaluated concurrently in batch mode (default: 8)",
+    )
+    args = parser.parse_args()
+    if args.directions_file and not args.output:
+        parser.error("--output (a directory) is required with --directions-file")
+    return args
+
+
+def read_directions(path: str) -> Iterator[str]:
+    """Yield directions from a text file, one per non-empty, non-comment line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            direction = line.strip()
+            if direction and not direction.startswith("#"):
+                yield direction
+
+
+def run_batch(args: argparse.Namespace, engine: EvaluationEngine) -> int:
+    """
+    Stream batch evaluation results straight into the report writer.
+
+    Directions that fail are skipped; the index and matrix still cover the
+    rest, and the failures are listed on stderr.
+
+    Returns:
+        Exit code: 0 if every direction was evaluated, 1 otherwise
+    """
+    writer = BatchReportWriter(
+        Path(args.output),
+        language=args.language,
+        formats=[fmt.strip() for fmt in args.formats.split(",") if fmt.strip()],
+    )
+    summary = writer.write_batch(
+        engine.evaluate_batch(read_directions(args.directions_file), max_workers=args.workers)
+    )
+    usage = engine.usage
+    print(
+        f"[INFO] {summary.direction_count} directions, {usage.llm_calls} LLM calls; "
+        f"index: {', '.join(summary.index_paths.values())}; matrix: {summary.matrix_path}",
+        file=sys.stderr,
+    )
+    failures = engine.failures
+    for direction, error in failures.items():
+        print(f"[ERROR] {direction}: {error}", file=sys.stderr)
+    if failures:
+        print(f"[ERROR] {len(failures)} directions failed", file=sys.stderr)
+        return 1
+    return 0
 
 
 def main() -> int:
     """Main entry point."""
     args = parse_args()
+    load_dotenv()
+    
+    if args.directions_file:
+        print(f"[INFO] Evaluating directions from: {args.directions_file}", file=sys.stderr)
+    else:
+        print(f"[INFO] Evaluating research direction: {args.direction}", file=sys.stderr)
+    
+    with LLMClientFactory.create_from_env() as llm:
+        engine = EvaluationEngine(
+            llm=llm, compute_budget=args.compute_budget, batch_mode=args.batch_mode
+        )
+        if args.directions_file:
+            return run_batch(args, engine)
+        result = engine.evaluate(direction=args.direction)
     
-    print(f"[INFO] Evaluating research direction: {args.direction}")
-    print(f"[INFO] This is a placeholder. Implementation coming in Task 1.3.")
+    fmt = "html" if args.output and args.output.endswith(".html") else "md"
+    report = ReportRenderer(language=args.language).render(result, fmt=fmt)
     
-    # TODO: Implement actual evaluation logic in Task 1.3
-    # from src.evaluation import EvaluationEngine
-    # from src.llm import LLMClientFactory
-    # 
-    # llm = LLMClientFactory.create_from_env()
-    # engine = EvaluationEngine(llm=llm)
-    # result = engine.evaluate(direction=args.direction)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(report, encoding="utf-8")
+        print(f"[INFO] Report written to {args.output}", file=sys.stderr)
+    else:
+        print(report)
     
     return 0
 
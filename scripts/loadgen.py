@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Load-test the evaluation engine against the local fake LLM server.
+使用本地模拟 LLM 服务对评估引擎进行压测
+
+Usage:
+    python scripts/loadgen.py --directions 200 --concurrency 16 --latency-ms 300
+    python scripts/loadgen.py --provider anthropic --rate-limit-rps 50 --error-rate 0.02
+    python scripts/loadgen.py --compare none,dimension,all --batch-field-error-rate 0.05
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.evaluation.engine import EvaluationEngine  # noqa: E402
+from src.evaluation.loadgen import (  # noqa: E402
+    compare_batch_modes,
+    run_load_test,
+    synthetic_directions,
+)
+from src.llm.factory import LLMClientFactory  # noqa: E402
+from src.llm.fake_server import FakeLLMConfig, FakeLLMServer  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Load-test the P-F-C evaluation engine against a fake LLM server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--provider", choices=["openai", "anthropic"], default="openai")
+    parser.add_argument("--directions", type=int, default=100, help="Directions to evaluate")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent directions")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for directions and faults")
+    parser.add_argument(
+        "--latency-distribution",
+        choices=["fixed", "uniform", "normal", "lognormal", "exponential"],
+        default="lognormal",
+    )
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Mean latency per call")
+    parser.add_argument("--latency-jitter-ms", type=float, default=100.0, help="Latency spread")
+    parser.add_argument("--rate-limit-rps", type=float, default=None, help="Server rate limit")
+    parser.add_argument("--rate-limit-burst", type=int, default=10, help="Rate limit burst")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 503 replies")
+    parser.add_argument("--max-retries", type=int, default=5, help="Client retries per call")
+    parser.add_argument(
+        "--batch-mode",
+        choices=["none", "dimension", "all"],
+        default="none",
+        help="Indicators per LLM call (default: none, one call per indicator)",
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        default=None,
+        help="Comma-separated batch modes to compare (first is the agreement baseline)",
+    )
+    parser.add_argument(
+        "--batch-field-error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of invalid fields in batched replies (exercises fallback)",
+    )
+    parser.add_argument(
+        "--batch-score-drift",
+        type=int,
+        default=0,
+        help="Max score offset in batched replies (exercises agreement checks)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+
+    config = FakeLLMConfig(
+        latency_distribution=args.latency_distribution,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        rate_limit_rps=args.rate_limit_rps,
+        rate_limit_burst=args.rate_limit_burst,
+        error_rate=args.error_rate,
+        batch_field_error_rate=args.batch_field_error_rate,
+        batch_score_drift=args.batch_score_drift,
+        seed=args.seed,
+    )
+    directions = synthetic_directions(args.directions, seed=args.seed)
+
+    with FakeLLMServer(config) as server:
+        base_url = (
+            server.openai_base_url if args.provider == "openai" else server.anthropic_base_url
+        )
+        with LLMClientFactory.create(
+            args.provider,
+            api_key="fake",
+            base_url=base_url,
+            max_retries=args.max_retries,
+            max_connections=args.concurrency * 2,
+        ) as llm:
+            if args.compare:
+                comparisons = compare_batch_modes(
+                    llm,
+                    directions,
+                    modes=[m.strip() for m in args.compare.split(",")],
+                    concurrency=args.concurrency,
+                )
+                for comparison in comparisons:
+                    print(comparison.model_dump_json(indent=2))
+                return 0 if all(c.load.failed == 0 for c in comparisons) else 1
+
+            engine = EvaluationEngine(llm=llm, batch_mode=args.batch_mode)
+            report = run_load_test(engine.evaluate, directions, concurrency=args.concurrency)
+        stats = server.stats()
+
+    print(report.model_dump_json(indent=2))
+    print(engine.usage.model_dump_json(indent=2))
+    print(stats.model_dump_json(indent=2))
+    return 0 if report.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Rank-stability analysis of a batch run under alternative weights and thresholds.
+批量评估结果的权重/阈值敏感性分析
+
+Usage:
+    python scripts/sensitivity.py --matrix ./reports/batch/indicator_matrix.npz
+    python scripts/sensitivity.py --matrix m.npz --fuse-thresholds 2 3 4 --f1-shifts -2 0 2
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.evaluation.sensitivity import (  # noqa: E402
+    IndicatorMatrix,
+    Scenarios,
+    analyze,
+    dirichlet_weights,
+    simplex_weights,
+)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments (``sys.argv`` when ``argv`` is None)."""
+    parser = argparse.ArgumentParser(
+        description="Re-score a batch run under many weight/threshold scenarios",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--matrix", "-m", type=str, required=True, help="indicator_matrix.npz")
+    parser.add_argument(
+        "--weight-step",
+        type=float,
+        default=0.05,
+        help="Grid step of the P/F/C weight simplex (rounded to 1/n)",
+    )
+    parser.add_argument(
+        "--random-weights",
+        type=int,
+        default=0,
+        help="Use N Dirichlet samples around the default weights instead of a grid",
+    )
+    parser.add_argument(
+        "--fuse-thresholds",
+        type=float,
+        nargs="+",
+        default=[3.0],
+        help="Fuse thresholds to try, e.g. 2 3 4",
+    )
+    parser.add_argument(
+        "--f1-shifts",
+        type=float,
+        nargs="+",
+        default=[0.0],
+        help="F1 offsets approximating other compute budgets, e.g. -2 0 2",
+    )
+    parser.add_argument("--top-k", type=int, default=10, help="Size of the top set")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write JSON report here")
+    return parser.parse_args(argv)
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+
+    matrix = IndicatorMatrix.load(Path(args.matrix))
+    weights = (
+        dirichlet_weights(args.random_weights)
+        if args.random_weights
+        else simplex_weights(step=args.weight_step)
+    )
+    scenarios = Scenarios.grid(weights, args.fuse_thresholds, args.f1_shifts)
+    report = analyze(matrix, scenarios, top_k=args.top_k)
+
+    text = report.model_dump_json(indent=2)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+        print(f"[INFO] Sensitivity report written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
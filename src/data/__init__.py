@@ -4,7 +4,19 @@ Data loading and processing module.
 """
 
 from src.data.cleaner import clean_abstract, clean_keywords
+from src.data.corpus import (
+    Corpus,
+    Query,
+    all_papers,
+    conference,
+    keyword,
+    presentation,
+    term,
+    year,
+    year_range,
+)
 from src.data.loader import PapersLoader, SUPPORTED_CONFERENCES
+from src.data.matcher import AhoCorasick, TermMatcher, TermMatches
 from src.data.schema import ConferenceData, Paper
 
 __all__ = [
@@ -14,4 +26,16 @@ __all__ = [
     "SUPPORTED_CONFERENCES",
     "clean_keywords",
     "clean_abstract",
+    "AhoCorasick",
+    "TermMatcher",
+    "TermMatches",
+    "Corpus",
+    "Query",
+    "all_papers",
+    "conference",
+    "year",
+    "year_range",
+    "presentation",
+    "keyword",
+    "term",
 ]
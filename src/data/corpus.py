@@ -0,0 +1,482 @@
+"""
+Columnar paper corpus with bitmap facet indexes and composable queries.
+基于位图索引的论文语料库与组合查询
+
+Every facet value (conference, year, presentation type, keyword and,
+once indexed, matched terms) maps to a bitmap over corpus row ids.
+Queries combine facets with ``&`` / ``|`` / ``~`` and are evaluated as
+bitwise operations, so counts never build ``Paper`` objects::
+
+    orals = conference("ICLR", "NeurIPS") & year_range(2023, 2025) & presentation("Oral")
+    corpus.count(orals & keyword("diffusion models") & ~keyword("video generation"))
+"""
+
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.data.cleaner import clean_abstract, clean_keywords, clean_title, safe_int, safe_str
+from src.data.loader import SUPPORTED_CONFERENCES
+from src.data.matcher import TermMatcher, field_tokens
+from src.data.schema import ConferenceData, Paper
+from src.utils.exceptions import ConfigurationError, DataLoadError
+
+COLUMNS = (
+    "id",
+    "title",
+    "keywords",
+    "abstract",
+    "pdf",
+    "forum",
+    "year",
+    "presentation_type",
+    "conference",
+)
+
+FACETS = ("conference", "year", "presentation_type", "keyword", "term")
+
+# Values held by fewer than 1/_SPARSE_RATIO of the rows are kept as sorted row
+# arrays and expanded to a bitmap only when queried (most keywords are rare)
+_SPARSE_RATIO = 32
+
+_NORMALIZERS: dict[str, Callable[[Any], Hashable]] = {
+    "conference": lambda v: str(v).strip().upper(),
+    "year": int,
+    "presentation_type": lambda v: str(v).strip().lower(),
+    "keyword": lambda v: str(v).strip().lower(),
+    "term": lambda v: str(v).strip().lower(),
+}
+
+
+def rows_to_bitmap(rows: np.ndarray, size: int) -> int:
+    """
+    Build a bitmap (bit i set = row i) from row ids.
+
+    Args:
+        rows: Row ids
+        size: Number of rows in the corpus
+
+    Returns:
+        Bitmap as a Python integer
+    """
+    mask = np.zeros(size, dtype=bool)
+    mask[rows] = True
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def bitmap_to_rows(bitmap: int, size: int) -> np.ndarray:
+    """
+    Return the sorted row ids set in a bitmap.
+
+    Args:
+        bitmap: Bitmap as a Python integer
+        size: Number of rows in the corpus
+
+    Returns:
+        int64 array of row ids
+    """
+    if not bitmap:
+        return np.empty(0, dtype=np.int64)
+    raw = np.frombuffer(bitmap.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little")[:size])
+
+
+class Query(ABC):
+    """
+    Composable corpus query (``&`` AND, ``|`` OR, ``~`` NOT).
+    可组合的语料查询
+    """
+
+    @abstractmethod
+    def bitmap(self, corpus: "Corpus") -> int:
+        """Evaluate the query to a bitmap over the corpus rows."""
+
+    def __and__(self, other: "Query") -> "Query":
+        return _And(self, other)
+
+    def __or__(self, other: "Query") -> "Query":
+        return _Or(self, other)
+
+    def __invert__(self) -> "Query":
+        return _Not(self)
+
+
+class _Facet(Query):
+    def __init__(self, facet: str, values: Iterable[Any]):
+        self.facet = facet
+        self.values = tuple(values)
+
+    def bitmap(self, corpus: "Corpus") -> int:
+        result = 0
+        for value in self.values:
+            result |= corpus.facet_bitmap(self.facet, value)
+        return result
+
+    def __repr__(self) -> str:
+        return f"{self.facet}({', '.join(map(repr, self.values))})"
+
+
+class _And(Query):
+    def __init__(self, left: Query, right: Query):
+        self.left, self.right = left, right
+
+    def bitmap(self, corpus: "Corpus") -> int:
+        left = self.left.bitmap(corpus)
+        return left & self.right.bitmap(corpus) if left else 0
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} & {self.right!r})"
+
+
+class _Or(Query):
+    def __init__(self, left: Query, right: Query):
+        self.left, self.right = left, right
+
+    def bitmap(self, corpus: "Corpus") -> int:
+        return self.left.bitmap(corpus) | self.right.bitmap(corpus)
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} | {self.right!r})"
+
+
+class _Not(Query):
+    def __init__(self, inner: Query):
+        self.inner = inner
+
+    def bitmap(self, corpus: "Corpus") -> int:
+        return corpus.universe & ~self.inner.bitmap(corpus)
+
+    def __repr__(self) -> str:
+        return f"~{self.inner!r}"
+
+
+class _All(Query):
+    def bitmap(self, corpus: "Corpus") -> int:
+        return corpus.universe
+
+    def __repr__(self) -> str:
+        return "all_papers()"
+
+
+def all_papers() -> Query:
+    """Match every paper in the corpus."""
+    return _All()
+
+
+def conference(*names: str) -> Query:
+    """Papers from any of the given conferences (case-insensitive)."""
+    return _Facet("conference", names)
+
+
+def year(*years: int) -> Query:
+    """Papers published in any of the given years."""
+    return _Facet("year", years)
+
+
+def year_range(start: int, end: int) -> Query:
+    """Papers published between ``start`` and ``end`` (inclusive)."""
+    return _Facet("year", range(start, end + 1))
+
+
+def presentation(*types: str) -> Query:
+    """Papers with any of the given presentation types (Oral/Poster/Spotlight)."""
+    return _Facet("presentation_type", types)
+
+
+def keyword(*keywords: str) -> Query:
+    """Papers listing any of the given keywords (exact, case-insensitive)."""
+    return _Facet("keyword", keywords)
+
+
+def term(*terms: str) -> Query:
+    """Papers mentioning any of the given terms (see ``Corpus.index_terms``)."""
+    return _Facet("term", terms)
+
+
+def _clean_frame(df: pd.DataFrame, conference_name: str) -> pd.DataFrame:
+    """Apply the loader's per-field cleaning column-wise."""
+    df = df.astype(object).where(df.notna(), None)
+
+    def column(name: str) -> pd.Series:
+        return df[name] if name in df.columns else pd.Series([None] * len(df), dtype=object)
+
+    def optional(value: Any) -> str | None:
+        return safe_str(value) or None
+
+    cleaned: pd.DataFrame = pd.DataFrame(
+        {
+            "id": column("id").map(lambda v: safe_str(v, "unknown")).to_numpy(),
+            "title": column("title").map(clean_title).to_numpy(),
+            "keywords": column("keywords").map(clean_keywords).to_numpy(),
+            "abstract": column("abstract").map(clean_abstract).to_numpy(),
+            "pdf": column("pdf").map(optional).to_numpy(),
+            "forum": column("forum").map(optional).to_numpy(),
+            "year": column("year").map(lambda v: safe_int(v, 2024)).to_numpy(),
+            "presentation_type": column("presentation_type").map(optional).to_numpy(),
+            "conference": conference_name.upper(),
+        },
+        columns=list(COLUMNS),
+    )
+    return cleaned
+
+
+class Corpus:
+    """
+    Paper table (one row per paper) with bitmap facet indexes.
+    带位图分面索引的论文表
+
+    Rows live in a pandas DataFrame (``frame``) with the ``Paper`` fields
+    plus ``conference``; extra columns (e.g. citation counts) can be added.
+    ``Paper`` objects are built only by ``paper`` / ``papers``.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        """
+        Index a paper table.
+
+        Args:
+            frame: DataFrame with at least the columns in ``COLUMNS``
+
+        Raises:
+            ConfigurationError: If required columns are missing
+        """
+        missing = [c for c in COLUMNS if c not in frame.columns]
+        if missing:
+            raise ConfigurationError(f"Corpus frame is missing columns: {missing}")
+        self.frame = frame.reset_index(drop=True)
+        self.size = len(self.frame)
+        self.universe = (1 << self.size) - 1
+        self._facets: dict[str, dict[Hashable, int | np.ndarray]] = {}
+
+        frame = self.frame
+        for name in ("conference", "year", "presentation_type"):
+            values = frame[name].dropna()
+            self._set_facet(name, values.index.to_numpy(), values.to_numpy())
+        keywords = frame["keywords"].explode().dropna()
+        self._set_facet("keyword", keywords.index.to_numpy(), keywords.to_numpy())
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_conferences(cls, conferences: Mapping[str, ConferenceData]) -> "Corpus":
+        """
+        Build a corpus from loaded conferences (e.g. ``load_all_conferences``).
+
+        Args:
+            conferences: ConferenceData keyed by conference name
+
+        Returns:
+            Corpus
+        """
+        records = [
+            {**paper.model_dump(), "conference": name.upper()}
+            for name, data in conferences.items()
+            for paper in data.papers
+        ]
+        return cls(pd.DataFrame(records, columns=list(COLUMNS)))
+
+    @classmethod
+    def from_csv_files(cls, files: Mapping[str, Path]) -> "Corpus":
+        """
+        Build a corpus straight from conference CSV files (no ``Paper`` objects).
+
+        Args:
+            files: CSV path keyed by conference name
+
+        Returns:
+            Corpus
+
+        Raises:
+            DataLoadError: If a file is missing or cannot be parsed
+        """
+        frames = []
+        for name, path in files.items():
+            path = Path(path)
+            if not path.exists():
+                raise DataLoadError(f"CSV file not found: {path}", str(path))
+            try:
+                df = pd.read_csv(path)
+            except Exception as e:
+                raise DataLoadError(f"Failed to parse CSV: {e}", str(path)) from e
+            frames.append(_clean_frame(df, name))
+        frame = (
+            pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=list(COLUMNS))
+        )
+        return cls(frame)
+
+    @classmethod
+    def load(cls, data_root: str | None = None) -> "Corpus":
+        """
+        Load every supported conference found under the data root.
+
+        Args:
+            data_root: Root directory (defaults to PAPERS_DATA_ROOT)
+
+        Returns:
+            Corpus
+
+        Raises:
+            DataLoadError: If no data root is configured
+        """
+        root = data_root or os.environ.get("PAPERS_DATA_ROOT", "")
+        if not root:
+            raise DataLoadError(
+                "PAPERS_DATA_ROOT environment variable not set. "
+                "Please set it to the path containing conference data directories."
+            )
+        files = {
+            name.upper(): Path(root) / name.upper() / filename
+            for name, filename in SUPPORTED_CONFERENCES.items()
+        }
+        return cls.from_csv_files({name: path for name, path in files.items() if path.exists()})
+
+    def _set_facet(self, name: str, rows: np.ndarray, values: np.ndarray) -> None:
+        normalize = _NORMALIZERS[name]
+        raw_codes, raw_uniques = pd.factorize(pd.Series(values, dtype=object))
+        # Normalize each distinct raw value once, then merge values that collide
+        normalized = [normalize(v) if v != "" else None for v in raw_uniques.tolist()]
+        norm_codes, norm_uniques = pd.factorize(pd.Series(normalized, dtype=object))
+        codes = np.where(raw_codes >= 0, norm_codes[np.maximum(raw_codes, 0)], -1)
+
+        keep = codes >= 0
+        codes, rows = codes[keep], np.asarray(rows, dtype=np.int64)[keep]
+        order = np.lexsort((rows, codes))
+        codes, rows = codes[order], rows[order]
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+
+        facet: dict[Hashable, int | np.ndarray] = {}
+        if len(rows):
+            starts = np.concatenate([[0], bounds])
+            for start, group in zip(starts, np.split(rows, bounds), strict=True):
+                group = np.unique(group)
+                value = norm_uniques[codes[start]]
+                if len(group) * _SPARSE_RATIO >= self.size:
+                    facet[value] = rows_to_bitmap(group, self.size)
+                else:
+                    facet[value] = group.astype(np.int32)
+        self._facets[name] = facet
+
+    def facet_values(self, name: str) -> list[Hashable]:
+        """
+        Return the indexed values of a facet.
+
+        Args:
+            name: Facet name (see ``FACETS``)
+
+        Returns:
+            Sorted normalized values
+        """
+        return sorted(self._facet(name), key=str)
+
+    def _facet(self, name: str) -> dict[Hashable, int | np.ndarray]:
+        if name not in FACETS:
+            raise ConfigurationError(f"Unknown facet: {name}. Supported: {list(FACETS)}")
+        if name not in self._facets:
+            raise ConfigurationError(f"Facet '{name}' is not indexed; call index_terms first")
+        return self._facets[name]
+
+    def facet_bitmap(self, name: str, value: Any) -> int:
+        """
+        Return the bitmap of rows having a facet value.
+
+        Args:
+            name: Facet name (see ``FACETS``)
+            value: Facet value (normalized like the index)
+
+        Returns:
+            Bitmap (0 when the value is absent)
+        """
+        entry = self._facet(name).get(_NORMALIZERS[name](value))
+        if entry is None:
+            return 0
+        if isinstance(entry, int):
+            return entry
+        return rows_to_bitmap(entry, self.size)
+
+    def index_terms(self, matcher: TermMatcher) -> None:
+        """
+        Add a ``term`` facet from a TermMatcher scan of the corpus.
+
+        Args:
+            matcher: Compiled terms (its ``fields`` are scanned)
+        """
+        columns = [self.frame[name].tolist() for name in matcher.fields]
+        rows: list[int] = []
+        values: list[str] = []
+        for row, fields in enumerate(zip(*columns, strict=True)):
+            for tid in matcher.match_tokens(field_tokens(fields)):
+                rows.append(row)
+                values.append(matcher.terms[tid])
+        self._set_facet("term", np.asarray(rows, dtype=np.int64), np.asarray(values, dtype=object))
+
+    def bitmap(self, query: Query) -> int:
+        """Evaluate a query to a bitmap over the corpus rows."""
+        return query.bitmap(self)
+
+    def count(self, query: Query) -> int:
+        """Number of papers matching a query."""
+        return self.bitmap(query).bit_count()
+
+    def rows(self, query: Query) -> np.ndarray:
+        """Sorted row ids matching a query."""
+        return bitmap_to_rows(self.bitmap(query), self.size)
+
+    def ids(self, query: Query) -> list[str]:
+        """Paper IDs matching a query."""
+        ids: list[str] = self.frame["id"].to_numpy()[self.rows(query)].tolist()
+        return ids
+
+    def select(self, query: Query) -> pd.DataFrame:
+        """Rows of ``frame`` matching a query."""
+        selected: pd.DataFrame = self.frame.iloc[self.rows(query)]
+        return selected
+
+    def paper(self, row: int) -> Paper:
+        """Build the ``Paper`` stored at a row."""
+        return self._to_papers(self.frame.iloc[[row]])[0]
+
+    def papers(self, query: Query) -> list[Paper]:
+        """Build the ``Paper`` objects matching a query."""
+        return self._to_papers(self.select(query))
+
+    @staticmethod
+    def _to_papers(frame: pd.DataFrame) -> list[Paper]:
+        # pandas turns missing optional strings into NaN; Paper expects None
+        frame = frame.astype(object).where(frame.notna(), None)
+        return [Paper.model_validate(record) for record in frame.to_dict("records")]
+
+    def facet_counts(self, name: str, where: Query | None = None) -> dict[Hashable, int]:
+        """
+        Count matching papers per facet value (e.g. papers per year).
+
+        Args:
+            name: Facet name (see ``FACETS``)
+            where: Optional query restricting the papers counted
+
+        Returns:
+            Counts keyed by facet value, values with no match omitted
+        """
+        scope = self.bitmap(where) if where is not None else self.universe
+        # Sparse values are counted against a boolean mask of the scope
+        mask: np.ndarray | None = None
+        if scope != self.universe:
+            mask = np.zeros(self.size, dtype=bool)
+            mask[bitmap_to_rows(scope, self.size)] = True
+
+        counts: dict[Hashable, int] = {}
+        for value, entry in sorted(self._facet(name).items(), key=lambda item: str(item[0])):
+            if isinstance(entry, int):
+                n = (entry & scope).bit_count()
+            elif mask is None:
+                n = len(entry)
+            else:
+                n = int(np.count_nonzero(mask[entry]))
+            if n:
+                counts[value] = n
+        return counts
@@ -0,0 +1,311 @@
+"""
+Multi-pattern term matching over papers with an Aho-Corasick automaton.
+基于 Aho-Corasick 自动机的多模式论文术语匹配
+
+All terms and their aliases are compiled into a single automaton whose
+alphabet is lower-cased word tokens, so a paper's title, keywords and
+abstract are scanned once no matter how many terms are matched. Matching
+is case-insensitive, respects word boundaries ("RAG" does not match
+"storage") and ignores punctuation between words ("retrieval-augmented
+generation" matches "Retrieval Augmented Generation").
+"""
+
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from src.data.loader import PapersLoader
+from src.data.schema import Paper
+from src.utils.exceptions import ConfigurationError
+
+PAPER_FIELDS = ("title", "keywords", "abstract")
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Inserted between scanned fields; never a token, so matches cannot span fields
+_FIELD_SEPARATOR = ""
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower-cased word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def field_tokens(values: Iterable[str | list[str] | None]) -> list[str]:
+    """
+    Tokenize field values (strings or keyword lists) for matching.
+
+    A separator token is inserted after every value so that matches never
+    span two fields or two keywords.
+    """
+    tokens: list[str] = []
+    for value in values:
+        for part in value if isinstance(value, list) else [value]:
+            if part:
+                tokens.extend(tokenize(part))
+                tokens.append(_FIELD_SEPARATOR)
+    return tokens
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over token sequences.
+    Aho-Corasick 多模式匹配自动机
+
+    Symbols can be any hashable values; ``TermMatcher`` uses word tokens,
+    plain strings work as character sequences.
+    """
+
+    def __init__(self, patterns: Sequence[Sequence[str]]):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: Non-empty symbol sequences; a pattern's id is its position
+        """
+        self.patterns = list(patterns)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for pid, pattern in enumerate(self.patterns):
+            state = 0
+            for sym in pattern:
+                nxt = self._goto[state].get(sym)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][sym] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (pid,)
+
+        # Breadth-first failure links; outputs inherit the failure state's outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for sym, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and sym not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(sym, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def iter_matches(self, symbols: Iterable[str]) -> Iterator[tuple[int, int]]:
+        """
+        Yield every match in a symbol sequence.
+
+        Args:
+            symbols: Sequence to scan
+
+        Yields:
+            (end index exclusive, pattern id)
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, sym in enumerate(symbols):
+            while state and sym not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(sym, 0)
+            for pid in out[state]:
+                yield i + 1, pid
+
+    def match_ids(self, symbols: Iterable[str]) -> set[int]:
+        """Return the ids of all patterns occurring in a symbol sequence."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for sym in symbols:
+            while state and sym not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(sym, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class TermMatches(BaseModel):
+    """
+    Papers matched per term.
+    各术语命中的论文
+    """
+
+    hits: dict[str, list[str]] = Field(
+        default_factory=dict, description="Matched paper IDs keyed by term (every term present)"
+    )
+    papers_scanned: int = Field(default=0, description="Number of papers scanned")
+
+    def counts(self) -> dict[str, int]:
+        """Number of matched papers per term."""
+        return {term: len(ids) for term, ids in self.hits.items()}
+
+    def merge(self, other: "TermMatches") -> "TermMatches":
+        """
+        Combine the matches of two disjoint paper sets.
+
+        Args:
+            other: Matches over other papers
+
+        Returns:
+            New TermMatches
+        """
+        hits = {term: list(ids) for term, ids in self.hits.items()}
+        for term, ids in other.hits.items():
+            hits.setdefault(term, []).extend(ids)
+        return TermMatches(hits=hits, papers_scanned=self.papers_scanned + other.papers_scanned)
+
+
+class TermMatcher:
+    """
+    Match many terms (each with aliases) against papers in one pass.
+    多术语（含别名）单遍匹配器
+    """
+
+    def __init__(
+        self,
+        terms: Mapping[str, Iterable[str]] | Iterable[str],
+        fields: Sequence[str] = PAPER_FIELDS,
+    ):
+        """
+        Compile the terms.
+
+        Args:
+            terms: Term names, or a mapping of term name to aliases (the name
+                itself is always matched too)
+            fields: Paper fields to scan (title / keywords / abstract)
+
+        Raises:
+            ConfigurationError: If a field is unknown or no term is given
+        """
+        unknown = set(fields) - set(PAPER_FIELDS)
+        if unknown:
+            raise ConfigurationError(
+                f"Unknown paper fields: {sorted(unknown)}. Supported: {list(PAPER_FIELDS)}"
+            )
+        alias_map: dict[str, list[str]] = (
+            {name: [name, *aliases] for name, aliases in terms.items()}
+            if isinstance(terms, Mapping)
+            else {name: [name] for name in terms}
+        )
+        if not alias_map:
+            raise ConfigurationError("TermMatcher needs at least one term")
+
+        self.terms = list(alias_map)
+        self.fields = tuple(fields)
+
+        pattern_ids: dict[tuple[str, ...], int] = {}
+        pattern_terms: list[set[int]] = []
+        for tid, aliases in enumerate(alias_map.values()):
+            for alias in aliases:
+                pattern = tuple(tokenize(alias))
+                if not pattern:
+                    continue
+                if pattern not in pattern_ids:
+                    pattern_ids[pattern] = len(pattern_terms)
+                    pattern_terms.append(set())
+                pattern_terms[pattern_ids[pattern]].add(tid)
+
+        self._automaton = AhoCorasick(list(pattern_ids))
+        self._pattern_terms = [tuple(sorted(t)) for t in pattern_terms]
+
+    def paper_tokens(self, paper: Paper) -> list[str]:
+        """Word tokens scanned for a paper, with a separator between fields."""
+        return field_tokens(getattr(paper, name) for name in self.fields)
+
+    def match_tokens(self, tokens: Iterable[str]) -> set[int]:
+        """
+        Return the ids of terms occurring in a token sequence.
+
+        Args:
+            tokens: Tokens produced by ``tokenize`` / ``paper_tokens``
+
+        Returns:
+            Set of term indices into ``self.terms``
+        """
+        found: set[int] = set()
+        for pid in self._automaton.match_ids(tokens):
+            found.update(self._pattern_terms[pid])
+        return found
+
+    def match_paper(self, paper: Paper) -> list[str]:
+        """
+        Return the terms mentioned by a paper.
+
+        Args:
+            paper: Paper to scan
+
+        Returns:
+            Matched term names in term order
+        """
+        return [self.terms[tid] for tid in sorted(self.match_tokens(self.paper_tokens(paper)))]
+
+    def match_papers(self, papers: Iterable[Paper]) -> TermMatches:
+        """
+        Match all terms against papers.
+
+        Args:
+            papers: Papers to scan
+
+        Returns:
+            TermMatches with every term present (possibly with no hits)
+        """
+        hits: list[list[str]] = [[] for _ in self.terms]
+        scanned = 0
+        for paper in papers:
+            scanned += 1
+            for tid in self.match_tokens(self.paper_tokens(paper)):
+                hits[tid].append(paper.id)
+        return TermMatches(
+            hits=dict(zip(self.terms, hits, strict=True)),
+            papers_scanned=scanned,
+        )
+
+    def match_csv(self, csv_path: Path) -> TermMatches:
+        """
+        Load one conference CSV and match it.
+
+        Args:
+            csv_path: Paper CSV file
+
+        Returns:
+            TermMatches for the file
+
+        Raises:
+            DataLoadError: If the file cannot be loaded
+        """
+        return self.match_papers(PapersLoader().load_csv(csv_path))
+
+    def match_files(
+        self,
+        csv_paths: Sequence[Path],
+        max_workers: int | None = None,
+    ) -> dict[str, TermMatches]:
+        """
+        Match several conference CSV files in parallel processes.
+
+        Each worker loads and scans one file; the compiled matcher is
+        shipped to workers once per file.
+
+        Args:
+            csv_paths: Paper CSV files
+            max_workers: Worker processes (default: one per CPU); 1 runs inline
+
+        Returns:
+            TermMatches keyed by file path; combine with ``TermMatches.merge``
+
+        Raises:
+            DataLoadError: If a file cannot be loaded
+        """
+        paths = [Path(p) for p in csv_paths]
+        if max_workers == 1 or len(paths) <= 1:
+            return {str(path): self.match_csv(path) for path in paths}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.match_csv, paths)
+            return {str(path): result for path, result in zip(paths, results, strict=True)}
@@ -24,6 +24,9 @@ class Paper(BaseModel):
     presentation_type: Optional[str] = Field(
         default=None, description="Presentation type (Oral/Poster/Spotlight)"
     )
+    citation_count: Optional[int] = Field(
+        default=None, description="Citation count (filled by src.enrichment)"
+    )
 
     class Config:
         """Pydantic model configuration."""
@@ -0,0 +1,26 @@
+"""
+Paper metadata enrichment (citation counts from Semantic Scholar).
+论文元数据补全模块（Semantic Scholar 引用数据）
+"""
+
+from src.enrichment.cache import MetadataCache
+from src.enrichment.client import SemanticScholarClient, lookup_id
+from src.enrichment.enricher import (
+    CitationEnricher,
+    CitationRecord,
+    EnrichmentStats,
+    PaperLookup,
+)
+from src.enrichment.fake_server import FakeS2Config, FakeSemanticScholarServer
+
+__all__ = [
+    "SemanticScholarClient",
+    "lookup_id",
+    "MetadataCache",
+    "CitationEnricher",
+    "CitationRecord",
+    "EnrichmentStats",
+    "PaperLookup",
+    "FakeSemanticScholarServer",
+    "FakeS2Config",
+]
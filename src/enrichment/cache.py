@@ -0,0 +1,115 @@
+"""
+Local SQLite cache of enrichment results with a time-to-live.
+带过期时间的本地 SQLite 元数据缓存
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from src.utils.exceptions import DataLoadError
+
+DEFAULT_TTL_S = 7 * 24 * 3600.0
+
+
+class MetadataCache:
+    """
+    Key/value cache of JSON records, each stamped with its fetch time.
+    元数据缓存（按写入时间过期）
+
+    Negative results (paper not found) are cached too, so unknown papers are
+    not re-queried until their entry expires.
+    """
+
+    def __init__(self, path: Path | str = ":memory:", ttl_s: float = DEFAULT_TTL_S):
+        """
+        Open or create the cache.
+
+        Args:
+            path: SQLite file (``:memory:`` for a process-local cache)
+            ttl_s: Seconds after which an entry is considered stale
+
+        Raises:
+            DataLoadError: If the database cannot be opened
+        """
+        self.path = str(path)
+        self.ttl_s = ttl_s
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS records "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            raise DataLoadError(f"Failed to open metadata cache: {e}", self.path) from e
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM records").fetchone()
+        return int(count)
+
+    def get_many(self, keys: Sequence[str], now: float | None = None) -> dict[str, Any]:
+        """
+        Return the fresh records for the given keys.
+
+        Args:
+            keys: Cache keys
+            now: Current time (defaults to ``time.time()``)
+
+        Returns:
+            Decoded records keyed by cache key; missing or stale keys are absent
+        """
+        cutoff = (time.time() if now is None else now) - self.ttl_s
+        found: dict[str, Any] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = list(keys[start : start + 500])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT key, value FROM records WHERE fetched_at >= ? "
+                    f"AND key IN ({placeholders})",
+                    [cutoff, *chunk],
+                ).fetchall()
+                found.update((key, json.loads(value)) for key, value in rows)
+        return found
+
+    def put_many(self, records: Iterable[tuple[str, Any]], now: float | None = None) -> None:
+        """
+        Store records, replacing existing entries.
+
+        Args:
+            records: (key, JSON-serializable value) pairs
+            now: Fetch time stamped on the entries (defaults to ``time.time()``)
+        """
+        fetched_at = time.time() if now is None else now
+        rows = [(key, json.dumps(value), fetched_at) for key, value in records]
+        with self._lock:
+            self._db.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?)", rows)
+            self._db.commit()
+
+    def purge_expired(self, now: float | None = None) -> int:
+        """
+        Delete stale entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        cutoff = (time.time() if now is None else now) - self.ttl_s
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM records WHERE fetched_at < ?", (cutoff,))
+            self._db.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
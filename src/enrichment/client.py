@@ -0,0 +1,244 @@
+"""
+Async Semantic Scholar Graph API client with pooling, rate limiting and retries.
+Semantic Scholar 异步客户端（连接池、限流、重试）
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any
+
+import httpx
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from src.utils.exceptions import ConfigurationError, EnrichmentAPIError
+from src.utils.http import is_retryable, parse_retry_after, wait_retry_after
+
+DEFAULT_BASE_URL = "https://api.semanticscholar.org/graph/v1"
+
+# Maximum number of IDs accepted by POST /paper/batch
+BATCH_LIMIT = 500
+
+DEFAULT_FIELDS = ("paperId", "title", "year", "citationCount", "influentialCitationCount")
+
+_ARXIV_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})", re.IGNORECASE)
+_ACL_RE = re.compile(r"aclanthology\.org/([A-Za-z0-9.\-]+?)(?:\.pdf)?/?$", re.IGNORECASE)
+_DOI_RE = re.compile(r"doi\.org/(10\.\d{4,9}/\S+)", re.IGNORECASE)
+
+
+def lookup_id(*urls: str | None) -> str | None:
+    """
+    Derive a Semantic Scholar paper ID from a paper's PDF/forum URLs.
+
+    Recognizes arXiv, ACL Anthology and DOI links; OpenReview links have no
+    Semantic Scholar equivalent and yield None (use title matching).
+
+    Args:
+        urls: Candidate URLs (None entries are skipped)
+
+    Returns:
+        ID such as ``ARXIV:2106.09685`` or None
+    """
+    for url in urls:
+        if not isinstance(url, str) or not url:
+            continue
+        for pattern, prefix in ((_ARXIV_RE, "ARXIV"), (_ACL_RE, "ACL"), (_DOI_RE, "DOI")):
+            match = pattern.search(url)
+            if match:
+                return f"{prefix}:{match.group(1)}"
+    return None
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket pacing coroutines to a sustained request rate.
+    异步令牌桶限流器
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class SemanticScholarClient:
+    """
+    Async client for the Semantic Scholar Graph API paper endpoints.
+    Semantic Scholar 论文接口异步客户端
+
+    One pooled ``httpx.AsyncClient`` is shared by all requests; every
+    attempt (including retries) passes through the rate limiter.
+
+    Usage::
+
+        async with SemanticScholarClient(api_key=key) as client:
+            papers = await client.get_papers(["ARXIV:2106.09685"])
+    """
+
+    service = "semantic_scholar"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        rate_limit_rps: float = 1.0,
+        rate_limit_burst: int = 1,
+        max_connections: int = 8,
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        backoff_max: float = 60.0,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            api_key: Semantic Scholar API key (sent as ``x-api-key``)
+            base_url: Graph API root
+            rate_limit_rps: Sustained requests per second across all coroutines
+            rate_limit_burst: Requests allowed back to back
+            max_connections: Connection pool size
+            timeout: Per-request timeout (seconds)
+            max_retries: Retries after the first attempt for transient errors
+            backoff_max: Upper bound of any wait between attempts, including
+                server Retry-After hints (seconds)
+            fields: Paper fields requested
+        """
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff_max = backoff_max
+        self.fields = ",".join(fields)
+        self._limiter = AsyncRateLimiter(rate_limit_rps, rate_limit_burst)
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers={"x-api-key": api_key} if api_key else {},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Release pooled connections."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "SemanticScholarClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Perform one rate-limited attempt; 404 yields None."""
+        await self._limiter.acquire()
+        try:
+            resp = await self._http.request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            raise EnrichmentAPIError(self.service, f"HTTP transport error: {e}") from e
+
+        if resp.status_code == 404:
+            return None
+        if resp.status_code != 200:
+            raise EnrichmentAPIError(
+                self.service,
+                f"HTTP {resp.status_code}: {resp.text[:200]}",
+                retry_after=parse_retry_after(resp.headers),
+                status_code=resp.status_code,
+            )
+        try:
+            return resp.json()
+        except ValueError as e:
+            raise EnrichmentAPIError(
+                self.service, f"Invalid JSON body: {e}", status_code=resp.status_code
+            ) from e
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Send a request, retrying transient failures."""
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=wait_retry_after(
+                wait_random_exponential(multiplier=1.0, max=self.backoff_max),
+                max_wait=self.backoff_max,
+            ),
+            retry=retry_if_exception(is_retryable),
+            reraise=True,
+        )
+        async for attempt in retrying:
+            with attempt:
+                result = await self._send(method, path, **kwargs)
+        return result
+
+    async def get_papers(self, ids: Sequence[str]) -> list[dict[str, Any] | None]:
+        """
+        Fetch papers with one ``POST /paper/batch`` call.
+
+        Args:
+            ids: Up to ``BATCH_LIMIT`` paper IDs (``ARXIV:...``, ``DOI:...``, ...)
+
+        Returns:
+            One paper dict per ID (None when unknown), in input order
+
+        Raises:
+            ConfigurationError: If more than ``BATCH_LIMIT`` IDs are given
+            EnrichmentAPIError: If the call fails after all retries
+        """
+        if len(ids) > BATCH_LIMIT:
+            raise ConfigurationError(f"At most {BATCH_LIMIT} IDs per batch, got {len(ids)}")
+        if not ids:
+            return []
+        data = await self._request(
+            "POST", "/paper/batch", params={"fields": self.fields}, json={"ids": list(ids)}
+        )
+        if not isinstance(data, list) or len(data) != len(ids):
+            raise EnrichmentAPIError(self.service, "Batch response does not match the request")
+        return data
+
+    async def match_title(self, title: str) -> dict[str, Any] | None:
+        """
+        Find the paper best matching a title (``GET /paper/search/match``).
+
+        Args:
+            title: Paper title
+
+        Returns:
+            Paper dict, or None when nothing matches
+
+        Raises:
+            EnrichmentAPIError: If the call fails after all retries
+        """
+        data = await self._request(
+            "GET", "/paper/search/match", params={"query": title, "fields": self.fields}
+        )
+        if not data or not data.get("data"):
+            return None
+        match: dict[str, Any] = data["data"][0]
+        return match
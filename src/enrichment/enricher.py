@@ -0,0 +1,211 @@
+"""
+Citation enrichment of papers and corpora.
+论文引用数据补全
+
+Papers with an arXiv / ACL / DOI link are fetched through the batch
+endpoint (up to 500 per request); the rest, and IDs a batch did not
+find, fall back to title matching. Every result, including "not found",
+is cached; IDs of a failed batch request are not, so the next run
+retries them.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import pandas as pd
+from pydantic import BaseModel, Field
+
+from src.data.corpus import Corpus
+from src.enrichment.cache import MetadataCache
+from src.enrichment.client import BATCH_LIMIT, SemanticScholarClient, lookup_id
+from src.utils.exceptions import EnrichmentAPIError
+
+
+class PaperLookup(BaseModel):
+    """
+    How to find one paper in Semantic Scholar.
+    论文检索方式
+    """
+
+    s2_id: str | None = Field(default=None, description="External ID, e.g. ARXIV:2106.09685")
+    title: str = Field(default="", description="Title used when no ID is known or found")
+
+    @property
+    def key(self) -> str:
+        """Cache key (the external ID, else the normalized title)."""
+        return self.s2_id or "TITLE:" + " ".join(self.title.lower().split())
+
+
+class CitationRecord(BaseModel):
+    """
+    Citation data of one paper (``found`` False when Semantic Scholar has no match).
+    单篇论文的引用数据
+    """
+
+    found: bool = Field(default=False, description="Whether the paper was found")
+    paper_id: str | None = Field(default=None, description="Semantic Scholar paperId")
+    citation_count: int | None = Field(default=None, description="Total citations")
+    influential_citation_count: int | None = Field(
+        default=None, description="Highly influential citations"
+    )
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any] | None) -> "CitationRecord":
+        """Build a record from a Graph API paper object (None = not found)."""
+        if not data:
+            return cls()
+        return cls(
+            found=True,
+            paper_id=data.get("paperId"),
+            citation_count=data.get("citationCount"),
+            influential_citation_count=data.get("influentialCitationCount"),
+        )
+
+
+class EnrichmentStats(BaseModel):
+    """
+    Work done by one enrichment run.
+    补全统计
+    """
+
+    lookups: int = 0
+    unique_keys: int = 0
+    cache_hits: int = 0
+    batch_requests: int = 0
+    title_requests: int = 0
+    found: int = 0
+    not_found: int = 0
+    failed: int = 0
+
+
+class CitationEnricher:
+    """
+    Fetch citation counts for many papers with batching, concurrency and caching.
+    批量、并发、带缓存的引用数据补全
+    """
+
+    def __init__(
+        self,
+        client: SemanticScholarClient,
+        cache: MetadataCache | None = None,
+        batch_size: int = BATCH_LIMIT,
+        concurrency: int = 4,
+    ):
+        """
+        Initialize the enricher.
+
+        Args:
+            client: Semantic Scholar client (owns rate limiting and retries)
+            cache: Result cache (default: in-memory)
+            batch_size: IDs per batch request (at most ``BATCH_LIMIT``)
+            concurrency: Requests in flight at once
+        """
+        self.client = client
+        self.cache = cache if cache is not None else MetadataCache()
+        self.batch_size = min(batch_size, BATCH_LIMIT)
+        self.concurrency = concurrency
+        self.stats = EnrichmentStats()
+
+    async def _fetch_batch(
+        self, ids: list[str], semaphore: asyncio.Semaphore
+    ) -> list[dict[str, Any] | None] | None:
+        async with semaphore:
+            self.stats.batch_requests += 1
+            try:
+                return await self.client.get_papers(ids)
+            except EnrichmentAPIError:
+                return None
+
+    async def _fetch_title(
+        self, title: str, semaphore: asyncio.Semaphore
+    ) -> dict[str, Any] | None | EnrichmentAPIError:
+        async with semaphore:
+            self.stats.title_requests += 1
+            try:
+                return await self.client.match_title(title)
+            except EnrichmentAPIError as e:
+                return e
+
+    async def enrich(self, lookups: Sequence[PaperLookup]) -> list[CitationRecord | None]:
+        """
+        Resolve citation data for papers.
+
+        Args:
+            lookups: One lookup per paper (duplicates are fetched once)
+
+        Returns:
+            One record per lookup, in order; None where every attempt failed
+            (failures are not cached and are retried on the next run)
+        """
+        self.stats = EnrichmentStats(lookups=len(lookups))
+        by_key = {lookup.key: lookup for lookup in lookups}
+        self.stats.unique_keys = len(by_key)
+
+        results: dict[str, CitationRecord] = {
+            key: CitationRecord.model_validate(value)
+            for key, value in self.cache.get_many(list(by_key)).items()
+        }
+        self.stats.cache_hits = len(results)
+        missing = [key for key in by_key if key not in results]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        fetched: dict[str, CitationRecord] = {}
+
+        # 1. External IDs through the batch endpoint
+        id_keys = [key for key in missing if by_key[key].s2_id]
+        chunks = [id_keys[i : i + self.batch_size] for i in range(0, len(id_keys), self.batch_size)]
+        batches = await asyncio.gather(
+            *(
+                self._fetch_batch([by_key[key].s2_id or "" for key in chunk], semaphore)
+                for chunk in chunks
+            )
+        )
+        title_keys = [key for key in missing if not by_key[key].s2_id]
+        for chunk, papers in zip(chunks, batches, strict=True):
+            if papers is None:
+                # The whole request failed: leave these uncached for the next run
+                # rather than turning one transient error into a title call per ID
+                continue
+            for i, key in enumerate(chunk):
+                if papers[i]:
+                    fetched[key] = CitationRecord.from_api(papers[i])
+                elif by_key[key].title:
+                    title_keys.append(key)
+                else:
+                    fetched[key] = CitationRecord()
+
+        # 2. Title matching for the rest (and for IDs the batch did not find)
+        title_keys = [key for key in title_keys if by_key[key].title]
+        matches = await asyncio.gather(
+            *(self._fetch_title(by_key[key].title, semaphore) for key in title_keys)
+        )
+        for key, match in zip(title_keys, matches, strict=True):
+            if not isinstance(match, EnrichmentAPIError):
+                fetched[key] = CitationRecord.from_api(match)
+
+        self.cache.put_many((key, record.model_dump()) for key, record in fetched.items())
+        results.update(fetched)
+
+        self.stats.found = sum(r.found for r in results.values())
+        self.stats.not_found = len(results) - self.stats.found
+        self.stats.failed = len(by_key) - len(results)
+        return [results.get(lookup.key) for lookup in lookups]
+
+    async def enrich_corpus(self, corpus: Corpus, column: str = "citation_count") -> None:
+        """
+        Attach citation counts to every corpus row as a nullable integer column.
+
+        Args:
+            corpus: Corpus to enrich in place
+            column: Name of the added column
+        """
+        frame = corpus.frame
+        lookups = [
+            PaperLookup(s2_id=lookup_id(pdf, forum), title=title if isinstance(title, str) else "")
+            for pdf, forum, title in zip(frame["pdf"], frame["forum"], frame["title"], strict=True)
+        ]
+        records = await self.enrich(lookups)
+        frame[column] = pd.array(
+            [record.citation_count if record is not None else None for record in records],
+            dtype="Int64",
+        )
@@ -0,0 +1,172 @@
+"""
+Local fake Semantic Scholar server for offline enrichment tests.
+本地模拟 Semantic Scholar 服务（离线测试）
+
+Implements ``POST /graph/v1/paper/batch`` and
+``GET /graph/v1/paper/search/match`` with deterministic citation counts,
+simulated latency, rate limiting (429 + Retry-After) and server errors.
+"""
+
+import hashlib
+import json
+import time
+from http.server import BaseHTTPRequestHandler
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel, Field
+
+from src.utils.http import FakeHTTPServer, FakeServerConfig, JSONRequestHandler
+
+# IDs / titles containing this marker are never found
+MISSING_MARKER = "missing"
+
+
+def fake_citation_count(key: str) -> int:
+    """
+    Deterministic citation count for a paper ID or title.
+
+    Args:
+        key: External ID or title (case-insensitive)
+
+    Returns:
+        Integer in [0, 5000)
+    """
+    digest = hashlib.sha256(" ".join(key.lower().split()).encode()).digest()
+    return int.from_bytes(digest[:4], "big") % 5000
+
+
+class FakeS2Config(FakeServerConfig):
+    """
+    Behavior of the fake Semantic Scholar server.
+    模拟服务行为配置
+    """
+
+    latency_ms: float = Field(default=0.0, ge=0, description="Fixed response latency")
+    error_rate: float = Field(default=0.0, ge=0, le=1, description="Fraction of 500 responses")
+    api_key: str | None = Field(default=None, description="Required x-api-key (None: any)")
+
+
+class FakeS2Stats(BaseModel):
+    """
+    Request counters collected by the fake server.
+    模拟服务请求统计
+    """
+
+    requests: int = 0
+    batch_requests: int = 0
+    title_requests: int = 0
+    ids_requested: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+
+
+class FakeSemanticScholarServer(FakeHTTPServer[FakeS2Stats]):
+    """
+    Threaded local HTTP server imitating the Semantic Scholar Graph API.
+    本地多线程模拟 Semantic Scholar 服务
+
+    Usage::
+
+        with FakeSemanticScholarServer() as server:
+            client = SemanticScholarClient(base_url=server.graph_base_url)
+    """
+
+    config: FakeS2Config
+
+    def __init__(self, config: FakeS2Config | None = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (not started).
+
+        Args:
+            config: Server behavior; defaults to zero latency and no faults
+            host: Bind address
+            port: Bind port (0 picks a free port)
+        """
+        super().__init__(config or FakeS2Config(), FakeS2Stats(), host, port)
+
+    @property
+    def graph_base_url(self) -> str:
+        """Base URL for SemanticScholarClient."""
+        return f"{self.base_url}/graph/v1"
+
+    @staticmethod
+    def build_paper(key: str, title: str | None = None) -> dict[str, Any] | None:
+        """
+        Deterministic Graph API paper object for an ID or title.
+
+        Args:
+            key: External ID or title
+            title: Title reported for the paper (defaults to ``key``)
+
+        Returns:
+            Paper dict, or None for keys containing ``MISSING_MARKER``
+        """
+        if MISSING_MARKER in key.lower():
+            return None
+        count = fake_citation_count(key)
+        return {
+            "paperId": hashlib.sha1(key.lower().encode()).hexdigest(),
+            "title": title or key,
+            "citationCount": count,
+            "influentialCitationCount": count // 10,
+        }
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(JSONRequestHandler):
+            def _admit(self) -> bool:
+                """Apply auth, rate limiting, latency and errors; False if already replied."""
+                server._count(requests=1)
+                if server.config.api_key and self.headers.get("x-api-key") != server.config.api_key:
+                    self._reply(403, {"message": "Forbidden"})
+                    return False
+                wait = server._rate_limit_wait()
+                if wait > 0:
+                    server._count(rate_limited=1)
+                    self._reply(
+                        429, {"message": "Too Many Requests"}, server._retry_after_headers(wait)
+                    )
+                    return False
+                time.sleep(server.config.latency_ms / 1000)
+                if server._should_fail():
+                    server._count(errors=1)
+                    self._reply(500, {"message": "Internal Server Error"})
+                    return False
+                return True
+
+            def do_POST(self) -> None:  # noqa: N802
+                body = self._read_body()
+                if urlsplit(self.path).path.rstrip("/") != "/graph/v1/paper/batch":
+                    self._reply(404, {"error": f"unknown path {self.path}"})
+                    return
+                try:
+                    ids = json.loads(body or b"{}")["ids"]
+                except (ValueError, KeyError):
+                    self._reply(400, {"error": 'expected {"ids": [...]}'})
+                    return
+                if len(ids) > 500:
+                    self._reply(400, {"error": "Cannot process more than 500 ids"})
+                    return
+                if not self._admit():
+                    return
+                server._count(batch_requests=1, ids_requested=len(ids))
+                self._reply(200, [server.build_paper(str(i)) for i in ids])
+
+            def do_GET(self) -> None:  # noqa: N802
+                url = urlsplit(self.path)
+                if url.path.rstrip("/") != "/graph/v1/paper/search/match":
+                    self._reply(404, {"error": f"unknown path {self.path}"})
+                    return
+                if not self._admit():
+                    return
+                server._count(title_requests=1)
+                title = parse_qs(url.query).get("query", [""])[0]
+                paper = server.build_paper(title, title=title) if title else None
+                if paper is None:
+                    self._reply(404, {"error": "Title match not found"})
+                    return
+                self._reply(200, {"data": [{**paper, "matchScore": 100.0}]})
+
+        return Handler
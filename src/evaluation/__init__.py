@@ -3,9 +3,33 @@ P-F-C Evaluation Engine.
 P-F-C 评估引擎模块
 """
 
-from typing import TYPE_CHECKING
+from src.evaluation.engine import BATCH_MODES, EngineUsage, EvaluationEngine
+from src.evaluation.schema import (
+    DIMENSIONS,
+    INDICATORS,
+    Decision,
+    EvaluationResult,
+    IndicatorAssessment,
+    IndicatorScores,
+)
+from src.evaluation.scoring import FUSE_THRESHOLD, classify_decision, compute_roi
+from src.evaluation.sensitivity import IndicatorMatrix, Scenarios, SensitivityReport, analyze
 
-if TYPE_CHECKING:
-    pass
-
-__all__ = []
+__all__ = [
+    "EvaluationEngine",
+    "EngineUsage",
+    "BATCH_MODES",
+    "INDICATORS",
+    "DIMENSIONS",
+    "Decision",
+    "IndicatorAssessment",
+    "IndicatorScores",
+    "EvaluationResult",
+    "FUSE_THRESHOLD",
+    "compute_roi",
+    "classify_decision",
+    "IndicatorMatrix",
+    "Scenarios",
+    "SensitivityReport",
+    "analyze",
+]
@@ -0,0 +1,264 @@
+"""
+P-F-C evaluation engine.
+P-F-C 评估引擎
+"""
+
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel
+
+from src.evaluation.parsing import (
+    batch_response_format,
+    parse_assessment,
+    parse_batch_assessments,
+)
+from src.evaluation.prompts import build_batch_messages, build_indicator_messages
+from src.evaluation.schema import (
+    DIMENSIONS,
+    INDICATORS,
+    EvaluationResult,
+    IndicatorAssessment,
+    IndicatorScores,
+)
+from src.llm.base import BaseLLMClient, LLMResponse
+from src.utils.exceptions import ConfigurationError, LLMAPIError, LLMResponseParseError
+
+if TYPE_CHECKING:
+    from src.retrieval.memory import EvaluationMemory
+
+# none: one call per indicator; dimension: one call per P/F/C; all: one call per direction
+BatchMode = Literal["none", "dimension", "all"]
+
+BATCH_MODES: tuple[str, ...] = ("none", "dimension", "all")
+
+
+def indicator_groups(batch_mode: str) -> list[tuple[str, ...]]:
+    """
+    Return the indicator groups scored together in one call.
+
+    Args:
+        batch_mode: none / dimension / all
+
+    Returns:
+        List of indicator key tuples covering all indicators
+    """
+    if batch_mode == "none":
+        return [(key,) for key in INDICATORS]
+    if batch_mode == "dimension":
+        return list(DIMENSIONS.values())
+    if batch_mode == "all":
+        return [INDICATORS]
+    raise ConfigurationError(
+        f"Unsupported batch mode: {batch_mode}. Supported: {list(BATCH_MODES)}"
+    )
+
+
+class EngineUsage(BaseModel):
+    """
+    LLM usage accumulated by an engine.
+    引擎累计 LLM 用量
+    """
+
+    llm_calls: int = 0
+    fallback_calls: int = 0
+    reused_results: int = 0
+    failed_directions: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class EvaluationEngine:
+    """
+    Score research directions on the P-F-C indicators with an LLM.
+    使用 LLM 对研究方向进行 P-F-C 评分
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLMClient,
+        compute_budget: str | None = None,
+        batch_mode: BatchMode = "none",
+        memory: "EvaluationMemory | None" = None,
+        reuse_threshold: float = 0.95,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            llm: LLM client used for indicator scoring
+            compute_budget: Optional compute budget passed to the prompts
+            batch_mode: How many indicators to ask for per call
+                (none / dimension / all); batched fields that fail validation
+                are re-asked individually
+            memory: Optional store of past results; new results are added to
+                it and a direction whose nearest stored direction, scored under
+                the same ``compute_budget``, reaches ``reuse_threshold`` cosine
+                similarity reuses that result
+            reuse_threshold: Minimum similarity for reusing a past result
+        """
+        self.llm = llm
+        self.compute_budget = compute_budget
+        self.batch_mode = batch_mode
+        self.memory = memory
+        self.reuse_threshold = reuse_threshold
+        self.groups = indicator_groups(batch_mode)
+        self._usage = EngineUsage()
+        self._failures: dict[str, str] = {}
+        self._usage_lock = threading.Lock()
+
+    @property
+    def usage(self) -> EngineUsage:
+        """Snapshot of accumulated LLM usage."""
+        with self._usage_lock:
+            return self._usage.model_copy()
+
+    @property
+    def failures(self) -> dict[str, str]:
+        """Directions skipped by ``evaluate_batch``, mapped to their error message."""
+        with self._usage_lock:
+            return dict(self._failures)
+
+    def _chat(
+        self,
+        messages: list[dict[str, str]],
+        response_format: dict[str, Any] | None = None,
+        fallback: bool = False,
+    ) -> LLMResponse:
+        response = self.llm.chat(messages, response_format=response_format)
+        with self._usage_lock:
+            self._usage.llm_calls += 1
+            self._usage.fallback_calls += int(fallback)
+            self._usage.input_tokens += response.input_tokens
+            self._usage.output_tokens += response.output_tokens
+        return response
+
+    def assess_indicator(
+        self, direction: str, indicator: str, fallback: bool = False
+    ) -> IndicatorAssessment:
+        """
+        Score a single indicator with one LLM call.
+
+        Args:
+            direction: Research direction
+            indicator: Indicator key (e.g., 'p1')
+            fallback: Whether this call re-asks a field of a failed batch
+
+        Returns:
+            IndicatorAssessment
+
+        Raises:
+            LLMAPIError: If the LLM call fails
+            LLMResponseParseError: If the response is malformed
+        """
+        messages = build_indicator_messages(direction, indicator, self.compute_budget)
+        response = self._chat(messages, fallback=fallback)
+        return parse_assessment(response.content)
+
+    def assess_group(
+        self, direction: str, indicators: Sequence[str]
+    ) -> dict[str, IndicatorAssessment]:
+        """
+        Score several indicators in one call, re-asking only invalid fields.
+
+        Args:
+            direction: Research direction
+            indicators: Indicator keys scored together
+
+        Returns:
+            Assessments keyed by indicator
+        """
+        if len(indicators) == 1:
+            return {indicators[0]: self.assess_indicator(direction, indicators[0])}
+
+        messages = build_batch_messages(direction, indicators, self.compute_budget)
+        response = self._chat(messages, response_format=batch_response_format(indicators))
+        assessments, failed = parse_batch_assessments(response.content, indicators)
+        for key in failed:
+            assessments[key] = self.assess_indicator(direction, key, fallback=True)
+        return assessments
+
+    def evaluate(self, direction: str) -> EvaluationResult:
+        """
+        Evaluate a research direction on all indicators.
+
+        Args:
+            direction: Research direction (e.g., 'Video Generation')
+
+        Returns:
+            EvaluationResult
+        """
+        if self.memory is not None:
+            similar = self.memory.find_similar(
+                direction,
+                k=1,
+                min_similarity=self.reuse_threshold,
+                compute_budget=self.compute_budget,
+            )
+            if similar:
+                with self._usage_lock:
+                    self._usage.reused_results += 1
+                return similar[0].result.model_copy(update={"direction": direction})
+
+        assessments: dict[str, IndicatorAssessment] = {}
+        for group in self.groups:
+            assessments.update(self.assess_group(direction, group))
+        result = EvaluationResult(
+            direction=direction,
+            scores=IndicatorScores(**{k: assessments[k].score for k in INDICATORS}),
+            reasons={k: assessments[k].reason for k in INDICATORS},
+        )
+        if self.memory is not None:
+            self.memory.add(result, compute_budget=self.compute_budget)
+        return result
+
+    def _evaluate_or_record(self, direction: str) -> EvaluationResult | None:
+        """Evaluate one batch direction; record and swallow LLM failures."""
+        try:
+            return self.evaluate(direction)
+        except (LLMAPIError, LLMResponseParseError) as e:
+            with self._usage_lock:
+                self._usage.failed_directions += 1
+                self._failures[direction] = str(e)
+            return None
+
+    def evaluate_batch(
+        self,
+        directions: Iterable[str],
+        max_workers: int = 8,
+    ) -> Iterator[EvaluationResult]:
+        """
+        Evaluate many directions concurrently, yielding results as they finish.
+
+        At most ``max_workers`` directions are in flight, so the input may be a
+        lazy iterable and the output can be streamed straight into
+        ``BatchReportWriter.write_batch``. A direction whose LLM calls still
+        fail after retries, or whose replies cannot be parsed, is skipped
+        rather than aborting the batch; it is counted in
+        ``usage.failed_directions`` and listed in ``failures``.
+
+        Args:
+            directions: Research directions
+            max_workers: Number of directions evaluated concurrently
+
+        Yields:
+            EvaluationResult in completion order (failed directions omitted)
+        """
+        source = iter(directions)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: set[Future[EvaluationResult | None]] = set()
+            for direction in source:
+                pending.add(executor.submit(self._evaluate_or_record, direction))
+                if len(pending) >= max_workers:
+                    break
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result is not None:
+                        yield result
+                    next_direction = next(source, None)
+                    if next_direction is not None:
+                        pending.add(executor.submit(self._evaluate_or_record, next_direction))
@@ -0,0 +1,275 @@
+"""
+Deterministic load generator for the evaluation engine.
+评估引擎的确定性压测工具
+"""
+
+import math
+import random
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel, Field
+
+from src.evaluation.engine import EngineUsage, EvaluationEngine
+from src.evaluation.schema import INDICATORS, EvaluationResult
+from src.llm.base import BaseLLMClient
+
+_TOPICS = (
+    "Video Generation",
+    "Retrieval-Augmented Generation",
+    "Multimodal Alignment",
+    "Mixture-of-Experts",
+    "Sparse Autoencoders",
+    "Offline RL",
+    "Federated Learning",
+    "3D Vision-Language Navigation",
+    "Diffusion Models",
+    "Speech Synthesis",
+    "Graph Neural Networks",
+    "Code Generation",
+    "Model Editing",
+    "Continual Learning",
+)
+_QUALIFIERS = (
+    "Efficient",
+    "Robust",
+    "Scalable",
+    "Interpretable",
+    "Low-Resource",
+    "Long-Context",
+    "Privacy-Preserving",
+    "Self-Supervised",
+    "Compositional",
+    "Test-Time",
+)
+
+
+def synthetic_directions(count: int, seed: int = 0) -> list[str]:
+    """
+    Generate a deterministic list of research direction names.
+
+    Args:
+        count: Number of directions
+        seed: Random seed
+
+    Returns:
+        Direction names (same seed gives the same list)
+    """
+    rng = random.Random(seed)
+    return [f"{rng.choice(_QUALIFIERS)} {rng.choice(_TOPICS)} #{i}" for i in range(count)]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Linear-interpolated percentile.
+
+    Args:
+        values: Sample values
+        q: Percentile in [0, 100]
+
+    Returns:
+        Percentile value (0.0 for an empty sample)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class LoadTestReport(BaseModel):
+    """
+    Throughput and latency summary of a load test.
+    压测吞吐与延迟汇总
+    """
+
+    directions: int = Field(..., description="Directions submitted")
+    succeeded: int = Field(default=0, description="Directions evaluated successfully")
+    failed: int = Field(default=0, description="Directions that raised an error")
+    concurrency: int = Field(..., description="Concurrent directions")
+    duration_s: float = Field(default=0.0, description="Wall time of the run")
+    throughput_per_s: float = Field(default=0.0, description="Successful directions per second")
+    latency_ms: dict[str, float] = Field(
+        default_factory=dict, description="Per-direction latency percentiles (p50/p90/p99/...)"
+    )
+    errors: dict[str, int] = Field(default_factory=dict, description="Error counts by type")
+
+
+def run_load_test(
+    evaluate: Callable[[str], EvaluationResult],
+    directions: Sequence[str],
+    concurrency: int = 8,
+) -> LoadTestReport:
+    """
+    Drive an evaluation function over many directions and measure it.
+
+    Args:
+        evaluate: Function evaluating one direction (e.g., ``engine.evaluate``)
+        directions: Directions to evaluate
+        concurrency: Number of concurrent directions
+
+    Returns:
+        LoadTestReport
+    """
+    latencies: list[float] = []
+    errors: Counter[str] = Counter()
+
+    def timed(direction: str) -> tuple[float, str | None]:
+        start = time.perf_counter()
+        try:
+            evaluate(direction)
+            error = None
+        except Exception as e:  # noqa: BLE001 - every failure is counted, not raised
+            error = type(e).__name__
+        return time.perf_counter() - start, error
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for elapsed, error in executor.map(timed, directions):
+            if error is None:
+                latencies.append(elapsed * 1000)
+            else:
+                errors[error] += 1
+    duration = time.perf_counter() - start
+
+    return LoadTestReport(
+        directions=len(directions),
+        succeeded=len(latencies),
+        failed=sum(errors.values()),
+        concurrency=concurrency,
+        duration_s=duration,
+        throughput_per_s=len(latencies) / duration if duration else 0.0,
+        latency_ms={
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies, default=0.0),
+        },
+        errors=dict(errors),
+    )
+
+
+class AgreementReport(BaseModel):
+    """
+    Score agreement between two evaluation runs.
+    两次评估之间的评分一致性
+    """
+
+    directions: int = Field(default=0, description="Directions present in both runs")
+    exact_match_rate: float = Field(default=0.0, description="Indicator scores that are equal")
+    within_one_rate: float = Field(default=0.0, description="Indicator scores within ±1")
+    mean_abs_diff: float = Field(default=0.0, description="Mean absolute indicator difference")
+    roi_mean_abs_diff: float = Field(default=0.0, description="Mean absolute ROI difference")
+    decision_agreement_rate: float = Field(default=0.0, description="Identical decisions")
+
+
+def score_agreement(
+    baseline: Sequence[EvaluationResult],
+    candidate: Sequence[EvaluationResult],
+) -> AgreementReport:
+    """
+    Compare indicator scores, ROI and decisions of two runs by direction.
+
+    Args:
+        baseline: Reference results (e.g., unbatched mode)
+        candidate: Results to compare (e.g., batched mode)
+
+    Returns:
+        AgreementReport
+    """
+    reference = {r.direction: r for r in baseline}
+    pairs = [(reference[r.direction], r) for r in candidate if r.direction in reference]
+    if not pairs:
+        return AgreementReport()
+
+    diffs = [
+        abs(getattr(a.scores, key) - getattr(b.scores, key)) for a, b in pairs for key in INDICATORS
+    ]
+    return AgreementReport(
+        directions=len(pairs),
+        exact_match_rate=sum(d == 0 for d in diffs) / len(diffs),
+        within_one_rate=sum(d <= 1 for d in diffs) / len(diffs),
+        mean_abs_diff=sum(diffs) / len(diffs),
+        roi_mean_abs_diff=sum(abs(a.roi_score - b.roi_score) for a, b in pairs) / len(pairs),
+        decision_agreement_rate=sum(a.decision == b.decision for a, b in pairs) / len(pairs),
+    )
+
+
+class ModeComparison(BaseModel):
+    """
+    Load, usage and agreement of one batch mode.
+    单一批量模式的压测、用量与一致性
+    """
+
+    batch_mode: str = Field(..., description="Engine batch mode")
+    load: LoadTestReport = Field(..., description="Throughput and latency")
+    usage: EngineUsage = Field(..., description="LLM calls and tokens")
+    calls_per_direction: float = Field(default=0.0, description="LLM round trips per direction")
+    input_tokens_per_direction: float = Field(
+        default=0.0, description="Prompt tokens per direction"
+    )
+    agreement: AgreementReport | None = Field(
+        default=None, description="Agreement with the first (baseline) mode"
+    )
+
+
+def compare_batch_modes(
+    llm: BaseLLMClient,
+    directions: Sequence[str],
+    modes: Sequence[str] = ("none", "dimension", "all"),
+    concurrency: int = 8,
+    compute_budget: str | None = None,
+) -> list[ModeComparison]:
+    """
+    Run the same directions under several batch modes and compare them.
+
+    The first mode is the baseline for score agreement.
+
+    Args:
+        llm: LLM client shared by all runs
+        directions: Directions to evaluate
+        modes: Engine batch modes to compare
+        concurrency: Concurrent directions
+        compute_budget: Optional compute budget
+
+    Returns:
+        One ModeComparison per mode, in the given order
+    """
+    comparisons: list[ModeComparison] = []
+    baseline: list[EvaluationResult] | None = None
+
+    for mode in modes:
+        engine = EvaluationEngine(llm=llm, compute_budget=compute_budget, batch_mode=mode)  # type: ignore[arg-type]
+        results: list[EvaluationResult] = []
+
+        def evaluate(
+            direction: str,
+            engine: EvaluationEngine = engine,
+            results: list[EvaluationResult] = results,
+        ) -> EvaluationResult:
+            result = engine.evaluate(direction)
+            results.append(result)
+            return result
+
+        load = run_load_test(evaluate, directions, concurrency=concurrency)
+        usage = engine.usage
+        evaluated = max(load.succeeded, 1)
+        comparisons.append(
+            ModeComparison(
+                batch_mode=mode,
+                load=load,
+                usage=usage,
+                calls_per_direction=usage.llm_calls / evaluated,
+                input_tokens_per_direction=usage.input_tokens / evaluated,
+                agreement=score_agreement(baseline, results) if baseline is not None else None,
+            )
+        )
+        if baseline is None:
+            baseline = results
+
+    return comparisons
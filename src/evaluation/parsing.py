@@ -0,0 +1,144 @@
+"""
+Parsing of structured LLM output.
+LLM 结构化输出解析
+"""
+
+import copy
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.evaluation.schema import IndicatorAssessment
+from src.utils.exceptions import LLMResponseParseError
+
+
+def extract_json_object(content: str) -> dict[str, Any]:
+    """
+    Extract the first JSON object from LLM output.
+
+    Tolerates Markdown code fences and text around the object.
+
+    Args:
+        content: Raw assistant message
+
+    Returns:
+        Parsed JSON object
+
+    Raises:
+        LLMResponseParseError: If no JSON object can be parsed
+    """
+    start = content.find("{")
+    end = content.rfind("}")
+    if start == -1 or end < start:
+        raise LLMResponseParseError("no JSON object found", content)
+    try:
+        parsed = json.loads(content[start : end + 1])
+    except json.JSONDecodeError as e:
+        raise LLMResponseParseError(f"invalid JSON: {e}", content) from e
+    if not isinstance(parsed, dict):
+        raise LLMResponseParseError("top-level JSON is not an object", content)
+    return parsed
+
+
+def parse_assessment(content: str) -> IndicatorAssessment:
+    """
+    Parse a single-indicator response into an IndicatorAssessment.
+
+    Args:
+        content: Raw assistant message
+
+    Returns:
+        IndicatorAssessment
+
+    Raises:
+        LLMResponseParseError: If the response is malformed or out of range
+    """
+    data = extract_json_object(content)
+    try:
+        return IndicatorAssessment.model_validate(data)
+    except ValidationError as e:
+        raise LLMResponseParseError(str(e), content) from e
+
+
+def batch_json_schema(indicators: Sequence[str]) -> dict[str, Any]:
+    """
+    Strict JSON schema for a multi-indicator response.
+
+    Built from IndicatorAssessment, with every property required and no
+    additional properties, as required by OpenAI strict structured outputs.
+
+    Args:
+        indicators: Indicator keys in the response (e.g., ['p1', 'p2', 'p3'])
+
+    Returns:
+        JSON schema of ``{"p1": {"score": ..., "reason": ...}, ...}``
+    """
+    item = copy.deepcopy(IndicatorAssessment.model_json_schema())
+    item.pop("title", None)
+    item.pop("description", None)
+    item["required"] = list(item["properties"])
+    item["additionalProperties"] = False
+    for prop in item["properties"].values():
+        prop.pop("default", None)
+    return {
+        "type": "object",
+        "properties": {key: copy.deepcopy(item) for key in indicators},
+        "required": list(indicators),
+        "additionalProperties": False,
+    }
+
+
+def batch_response_format(indicators: Sequence[str]) -> dict[str, Any]:
+    """
+    OpenAI ``response_format`` payload for a multi-indicator request.
+
+    Anthropic-compatible clients send the same schema as a forced tool call.
+
+    Args:
+        indicators: Indicator keys in the response
+
+    Returns:
+        ``{"type": "json_schema", "json_schema": {...}}``
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "pfc_" + "_".join(indicators),
+            "strict": True,
+            "schema": batch_json_schema(indicators),
+        },
+    }
+
+
+def parse_batch_assessments(
+    content: str,
+    indicators: Sequence[str],
+) -> tuple[dict[str, IndicatorAssessment], list[str]]:
+    """
+    Parse a multi-indicator response, validating each field independently.
+
+    A malformed field does not invalidate the others, so callers can re-ask
+    only for the failed indicators.
+
+    Args:
+        content: Raw assistant message
+        indicators: Requested indicator keys
+
+    Returns:
+        (valid assessments keyed by indicator, keys that failed validation)
+    """
+    try:
+        data = extract_json_object(content)
+    except LLMResponseParseError:
+        return {}, list(indicators)
+
+    valid: dict[str, IndicatorAssessment] = {}
+    failed: list[str] = []
+    for key in indicators:
+        try:
+            valid[key] = IndicatorAssessment.model_validate(data.get(key))
+        except ValidationError:
+            failed.append(key)
+    return valid, failed
@@ -0,0 +1,156 @@
+"""
+Prompt templates for P-F-C indicator scoring.
+P-F-C 指标评分提示词
+"""
+
+from collections.abc import Sequence
+
+from src.evaluation.schema import INDICATOR_NAMES
+
+SYSTEM_PROMPT = (
+    "You are an experienced AI research strategist. You score research directions "
+    "on the P-F-C model (Potential, Feasibility, Competition). Every indicator is "
+    "scored from 1 to 10. Reply with a single JSON object and nothing else."
+)
+
+# Scoring rubric per indicator: (question, 8-10, 5-7, 1-4)
+RUBRICS = {
+    "p1": (
+        "How hot is this direction at top venues? Exploding or declining?",
+        "exponential growth, >50% more papers per year",
+        "steady mainstream growth",
+        "declining, considered outdated",
+    ),
+    "p2": (
+        "Is this a real scientific question linked to first principles, or an engineering trick?",
+        "connects to scaling laws or first principles",
+        "some theoretical contribution, mostly engineering",
+        "pure engineering trick tied to a dataset",
+    ),
+    "p3": (
+        "How saturated are the leaderboards? How much gain is needed to be recognized?",
+        "new area, simple improvements reach SOTA",
+        "moderate difficulty, needs significant innovation",
+        "saturated leaderboards, gains are extremely hard",
+    ),
+    "f1": (
+        "Can the given compute support mainstream experiments in this direction?",
+        "a single RTX 4090 / Colab is enough",
+        "needs 4-8 A100s, rentable",
+        "needs an H100 cluster for pretraining from scratch",
+    ),
+    "f2": (
+        "Where does the data come from? Is it accessible?",
+        "high-quality public datasets (e.g., HuggingFace)",
+        "needs processing or small-scale annotation",
+        "private data or expensive expert annotation",
+    ),
+    "f3": (
+        "How long does one full experiment take?",
+        "under 12 hours",
+        "1-3 days",
+        "more than a week",
+    ),
+    "c1": (
+        "Are OpenAI, Google, Meta or Anthropic investing heavily here? (reverse indicator)",
+        "niche or cross-disciplinary, giants absent",
+        "giants present but not a main battlefield",
+        "main battlefield, dozens of arXiv papers per day",
+    ),
+    "c2": (
+        "Is there room to innovate or define new problems?",
+        "virgin territory, new tasks/benchmarks possible",
+        "room exists but needs differentiation",
+        "tiny gaps, only A+B combinations",
+    ),
+}
+
+
+def _rubric_block(key: str) -> str:
+    zh, en = INDICATOR_NAMES[key]
+    question, high, mid, low = RUBRICS[key]
+    return (
+        f"{key.upper()} {en} ({zh}): {question}\n"
+        f"  8-10: {high}\n"
+        f"  5-7: {mid}\n"
+        f"  1-4: {low}"
+    )
+
+
+def direction_context(direction: str, compute_budget: str | None = None) -> str:
+    """
+    Build the direction header shared by all indicator prompts.
+
+    Args:
+        direction: Research direction
+        compute_budget: Optional compute budget (e.g., 'single-4090')
+
+    Returns:
+        Header text
+    """
+    lines = [f"Research direction: {direction}"]
+    if compute_budget:
+        lines.append(f"Compute budget: {compute_budget}")
+    return "\n".join(lines)
+
+
+def build_indicator_messages(
+    direction: str,
+    indicator: str,
+    compute_budget: str | None = None,
+) -> list[dict[str, str]]:
+    """
+    Build chat messages asking for a single indicator score.
+
+    Args:
+        direction: Research direction
+        indicator: Indicator key (e.g., 'p1')
+        compute_budget: Optional compute budget
+
+    Returns:
+        Chat messages
+    """
+    user = (
+        f"{direction_context(direction, compute_budget)}\n"
+        f"Indicators: {indicator.upper()}\n\n"
+        f"{_rubric_block(indicator)}\n\n"
+        'Respond as JSON: {"score": <1-10>, "reason": "<one sentence>"}'
+    )
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user},
+    ]
+
+
+def build_batch_messages(
+    direction: str,
+    indicators: Sequence[str],
+    compute_budget: str | None = None,
+) -> list[dict[str, str]]:
+    """
+    Build chat messages asking for several indicator scores in one call.
+
+    The direction context is sent once for all requested indicators.
+
+    Args:
+        direction: Research direction
+        indicators: Indicator keys (e.g., ['f1', 'f2', 'f3'])
+        compute_budget: Optional compute budget
+
+    Returns:
+        Chat messages
+    """
+    rubrics = "\n\n".join(_rubric_block(key) for key in indicators)
+    shape = ", ".join(
+        f'"{key}": {{"score": <1-10>, "reason": "<one sentence>"}}' for key in indicators
+    )
+    user = (
+        f"{direction_context(direction, compute_budget)}\n"
+        f"Indicators: {', '.join(key.upper() for key in indicators)}\n\n"
+        f"{rubrics}\n\n"
+        f"Score every indicator independently. Respond as JSON: {{{shape}}}"
+    )
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user},
+    ]
@@ -0,0 +1,139 @@
+"""
+Data models for P-F-C evaluation results.
+P-F-C 评估结果数据模型
+"""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from src.evaluation.scoring import (
+    classify_decision,
+    compute_c_avg,
+    compute_f_min,
+    compute_p_avg,
+    compute_roi,
+    is_fused,
+)
+
+# Indicator keys in canonical order: P1-P3, F1-F3, C1-C2
+INDICATORS = ("p1", "p2", "p3", "f1", "f2", "f3", "c1", "c2")
+
+# Indicators grouped by P-F-C dimension
+DIMENSIONS = {
+    "p": ("p1", "p2", "p3"),
+    "f": ("f1", "f2", "f3"),
+    "c": ("c1", "c2"),
+}
+
+INDICATOR_NAMES = {
+    "p1": ("趋势红利", "Trend Momentum"),
+    "p2": ("叙事深度", "Narrative Depth"),
+    "p3": ("SOTA 渗透率", "SOTA Saturation"),
+    "f1": ("算力匹配度", "Compute Match"),
+    "f2": ("数据获取", "Data Accessibility"),
+    "f3": ("迭代周期", "Iteration Time"),
+    "c1": ("巨头避让度", "Giant Avoidance"),
+    "c2": ("研究空白区", "Research Whitespace"),
+}
+
+
+class Decision(str, Enum):
+    """
+    Four-level decision output.
+    4 级决策分类
+    """
+
+    STRATEGIC_FOCUS = "战略重点"
+    DIFFERENTIATED_BREAKTHROUGH = "差异化突围"
+    QUICK_WIN = "快速捡漏"
+    CAUTIOUS_AVOID = "审慎避开"
+
+    @property
+    def english(self) -> str:
+        """Return the English label of the decision."""
+        return _DECISION_ENGLISH[self]
+
+
+_DECISION_ENGLISH = {
+    Decision.STRATEGIC_FOCUS: "Strategic Focus",
+    Decision.DIFFERENTIATED_BREAKTHROUGH: "Differentiated Breakthrough",
+    Decision.QUICK_WIN: "Quick Win",
+    Decision.CAUTIOUS_AVOID: "Cautious Avoid",
+}
+
+
+class IndicatorAssessment(BaseModel):
+    """
+    LLM assessment of a single indicator.
+    单项指标的 LLM 评估
+    """
+
+    score: float = Field(..., ge=1, le=10, description="Indicator score (1-10)")
+    reason: str = Field(default="", description="Short rationale")
+
+
+class IndicatorScores(BaseModel):
+    """
+    Scores of the P-F-C indicators (1-10 each).
+    P-F-C 各项指标评分
+    """
+
+    p1: float = Field(..., ge=1, le=10, description="P1 Trend Momentum")
+    p2: float = Field(..., ge=1, le=10, description="P2 Narrative Depth")
+    p3: float = Field(..., ge=1, le=10, description="P3 SOTA Saturation")
+    f1: float = Field(..., ge=1, le=10, description="F1 Compute Match")
+    f2: float = Field(..., ge=1, le=10, description="F2 Data Accessibility")
+    f3: float = Field(..., ge=1, le=10, description="F3 Iteration Time")
+    c1: float = Field(..., ge=1, le=10, description="C1 Giant Avoidance")
+    c2: float = Field(..., ge=1, le=10, description="C2 Research Whitespace")
+
+    def as_list(self) -> list[float]:
+        """Return the scores in canonical indicator order."""
+        return [getattr(self, key) for key in INDICATORS]
+
+
+class EvaluationResult(BaseModel):
+    """
+    Evaluation result for a single research direction.
+    单个研究方向的评估结果
+    """
+
+    direction: str = Field(..., description="Evaluated research direction")
+    scores: IndicatorScores = Field(..., description="Indicator scores")
+    reasons: dict[str, str] = Field(
+        default_factory=dict, description="Per-indicator rationale keyed by indicator"
+    )
+    risks: list[str] = Field(default_factory=list, description="Potential risks")
+    created_at: datetime = Field(default_factory=datetime.now, description="Evaluation time")
+
+    @property
+    def p_avg(self) -> float:
+        """Average of P1-P3."""
+        return compute_p_avg(self.scores.p1, self.scores.p2, self.scores.p3)
+
+    @property
+    def f_min(self) -> float:
+        """Minimum of F1-F3 (short-board scoring)."""
+        return compute_f_min(self.scores.f1, self.scores.f2, self.scores.f3)
+
+    @property
+    def c_avg(self) -> float:
+        """Average of C1-C2."""
+        return compute_c_avg(self.scores.c1, self.scores.c2)
+
+    @property
+    def roi_score(self) -> float:
+        """Composite ROI score."""
+        return compute_roi(self.p_avg, self.f_min, self.c_avg)
+
+    @property
+    def fused(self) -> bool:
+        """Whether the fuse mechanism is triggered (F_min < 3)."""
+        return is_fused(self.f_min)
+
+    @property
+    def decision(self) -> Decision:
+        """Four-level decision for this direction."""
+        return Decision(classify_decision(self.roi_score, self.p_avg, self.f_min))
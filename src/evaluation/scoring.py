@@ -0,0 +1,92 @@
+"""
+P-F-C scoring formula, fuse mechanism and decision rules.
+P-F-C 评分公式、熔断机制与决策规则
+"""
+
+# ROI = 0.35 × P_avg + 0.40 × F_min + 0.25 × C_avg
+P_WEIGHT = 0.35
+F_WEIGHT = 0.40
+C_WEIGHT = 0.25
+
+# Fuse: F_min below this threshold means "infeasible" regardless of ROI
+FUSE_THRESHOLD = 3.0
+
+# Decision thresholds
+STRATEGIC_ROI = 7.0
+VIABLE_ROI = 5.5
+HIGH_POTENTIAL = 8.0
+HIGH_FEASIBILITY = 8.0
+
+
+def compute_p_avg(p1: float, p2: float, p3: float) -> float:
+    """Return P_avg = (P1 + P2 + P3) / 3."""
+    return (p1 + p2 + p3) / 3
+
+
+def compute_f_min(f1: float, f2: float, f3: float) -> float:
+    """Return F_min = min(F1, F2, F3)."""
+    return min(f1, f2, f3)
+
+
+def compute_c_avg(c1: float, c2: float) -> float:
+    """Return C_avg = (C1 + C2) / 2."""
+    return (c1 + c2) / 2
+
+
+def compute_roi(
+    p_avg: float,
+    f_min: float,
+    c_avg: float,
+    weights: tuple[float, float, float] = (P_WEIGHT, F_WEIGHT, C_WEIGHT),
+) -> float:
+    """
+    Compute the composite ROI score.
+
+    Args:
+        p_avg: Average potential score
+        f_min: Minimum feasibility score
+        c_avg: Average competition score
+        weights: (P, F, C) weights
+
+    Returns:
+        ROI score
+    """
+    p_weight, f_weight, c_weight = weights
+    return p_weight * p_avg + f_weight * f_min + c_weight * c_avg
+
+
+def is_fused(f_min: float, threshold: float = FUSE_THRESHOLD) -> bool:
+    """Return True if the fuse mechanism is triggered."""
+    return f_min < threshold
+
+
+def classify_decision(
+    roi: float,
+    p_avg: float,
+    f_min: float,
+    fuse_threshold: float = FUSE_THRESHOLD,
+) -> str:
+    """
+    Classify a direction into the 4-level decision.
+
+    Mid-range ROI directions without a standout P or F strength fall back
+    to "审慎避开", since neither the breakthrough nor the quick-win rule applies.
+
+    Args:
+        roi: ROI score
+        p_avg: Average potential score
+        f_min: Minimum feasibility score
+        fuse_threshold: F_min threshold of the fuse mechanism
+
+    Returns:
+        Decision value (see ``src.evaluation.schema.Decision``)
+    """
+    if is_fused(f_min, fuse_threshold) or roi < VIABLE_ROI:
+        return "审慎避开"
+    if roi >= STRATEGIC_ROI:
+        return "战略重点"
+    if p_avg > HIGH_POTENTIAL:
+        return "差异化突围"
+    if f_min > HIGH_FEASIBILITY:
+        return "快速捡漏"
+    return "审慎避开"
@@ -0,0 +1,385 @@
+"""
+Sensitivity analysis of rankings under alternative weights and thresholds.
+权重与阈值敏感性分析（向量化重评分）
+
+Re-scores a batch run's raw indicator matrix (directions × indicators) for
+many (P, F, C weights, fuse threshold, F1 shift) scenarios at once with
+NumPy, without any new LLM calls. An F1 shift approximates a different
+compute budget (e.g., +2 when moving from a single 4090 to rented A100s).
+"""
+
+import itertools
+import math
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from src.evaluation.schema import INDICATORS, Decision, EvaluationResult
+from src.evaluation.scoring import (
+    C_WEIGHT,
+    F_WEIGHT,
+    FUSE_THRESHOLD,
+    HIGH_FEASIBILITY,
+    HIGH_POTENTIAL,
+    P_WEIGHT,
+    STRATEGIC_ROI,
+    VIABLE_ROI,
+)
+from src.utils.exceptions import ConfigurationError, DataLoadError
+
+# Integer codes used in decision arrays
+DECISION_CODES: tuple[Decision, ...] = (
+    Decision.STRATEGIC_FOCUS,
+    Decision.DIFFERENTIATED_BREAKTHROUGH,
+    Decision.QUICK_WIN,
+    Decision.CAUTIOUS_AVOID,
+)
+
+_P = [INDICATORS.index(k) for k in ("p1", "p2", "p3")]
+_F = [INDICATORS.index(k) for k in ("f1", "f2", "f3")]
+_C = [INDICATORS.index(k) for k in ("c1", "c2")]
+_F1 = INDICATORS.index("f1")
+
+
+class IndicatorMatrix:
+    """
+    Raw indicator scores of a batch run (directions × indicators).
+    批量评估的原始指标矩阵
+    """
+
+    def __init__(self, directions: Sequence[str], scores: np.ndarray):
+        """
+        Initialize the matrix.
+
+        Args:
+            directions: Direction names, one per row
+            scores: Array of shape (len(directions), len(INDICATORS))
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        if scores.ndim != 2 or scores.shape != (len(directions), len(INDICATORS)):
+            raise ConfigurationError(
+                f"Indicator matrix must have shape ({len(directions)}, {len(INDICATORS)}), "
+                f"got {scores.shape}"
+            )
+        self.directions = list(directions)
+        self.scores = scores
+
+    def __len__(self) -> int:
+        return len(self.directions)
+
+    @classmethod
+    def from_results(cls, results: Iterable[EvaluationResult]) -> "IndicatorMatrix":
+        """Build the matrix from evaluation results."""
+        results = list(results)
+        scores = np.array([r.scores.as_list() for r in results], dtype=np.float64)
+        return cls([r.direction for r in results], scores.reshape(len(results), len(INDICATORS)))
+
+    def save(self, path: Path) -> None:
+        """Save the matrix as a ``.npz`` file."""
+        np.savez(Path(path), directions=np.array(self.directions, dtype=str), scores=self.scores)
+
+    @classmethod
+    def load(cls, path: Path) -> "IndicatorMatrix":
+        """
+        Load a matrix saved with ``save``.
+
+        Raises:
+            DataLoadError: If the file is missing or malformed
+        """
+        path = Path(path)
+        if not path.exists():
+            raise DataLoadError(f"Indicator matrix not found: {path}", str(path))
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return cls(data["directions"].tolist(), data["scores"])
+        except (KeyError, ValueError) as e:
+            raise DataLoadError(f"Invalid indicator matrix: {e}", str(path)) from e
+
+
+class Scenarios:
+    """
+    Set of re-scoring scenarios as parallel arrays.
+    重评分情景集合
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        fuse_thresholds: np.ndarray,
+        f1_shifts: np.ndarray,
+    ):
+        """
+        Initialize scenarios; all arrays share the first dimension.
+
+        Args:
+            weights: (k, 3) P/F/C weights
+            fuse_thresholds: (k,) F_min fuse thresholds
+            f1_shifts: (k,) offsets added to F1 (clipped to 1-10)
+        """
+        self.weights = np.asarray(weights, dtype=np.float64).reshape(-1, 3)
+        self.fuse_thresholds = np.asarray(fuse_thresholds, dtype=np.float64).reshape(-1)
+        self.f1_shifts = np.asarray(f1_shifts, dtype=np.float64).reshape(-1)
+        k = len(self.weights)
+        if len(self.fuse_thresholds) != k or len(self.f1_shifts) != k:
+            raise ConfigurationError("Scenario arrays must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    @classmethod
+    def baseline(cls) -> "Scenarios":
+        """The default formula: 0.35 / 0.40 / 0.25, fuse at 3, no F1 shift."""
+        return cls(
+            np.array([[P_WEIGHT, F_WEIGHT, C_WEIGHT]]), np.array([FUSE_THRESHOLD]), np.zeros(1)
+        )
+
+    @classmethod
+    def grid(
+        cls,
+        weights: np.ndarray,
+        fuse_thresholds: Sequence[float] = (FUSE_THRESHOLD,),
+        f1_shifts: Sequence[float] = (0.0,),
+    ) -> "Scenarios":
+        """
+        Cartesian product of weight vectors, fuse thresholds and F1 shifts.
+
+        Args:
+            weights: (m, 3) candidate weight vectors
+            fuse_thresholds: Candidate fuse thresholds
+            f1_shifts: Candidate F1 offsets (compute budget proxy)
+
+        Returns:
+            Scenarios with m × len(fuse_thresholds) × len(f1_shifts) rows
+        """
+        weights = np.asarray(weights, dtype=np.float64).reshape(-1, 3)
+        w_idx, t_idx, s_idx = np.meshgrid(
+            np.arange(len(weights)),
+            np.arange(len(fuse_thresholds)),
+            np.arange(len(f1_shifts)),
+            indexing="ij",
+        )
+        return cls(
+            weights[w_idx.ravel()],
+            np.asarray(fuse_thresholds, dtype=np.float64)[t_idx.ravel()],
+            np.asarray(f1_shifts, dtype=np.float64)[s_idx.ravel()],
+        )
+
+
+def simplex_weights(step: float = 0.05, min_weight: float = 0.05) -> np.ndarray:
+    """
+    All (P, F, C) weight vectors on a regular grid that sum to 1.
+
+    The grid spacing is ``1 / round(1 / step)``, i.e. ``step`` rounded to the
+    nearest value that divides 1 (0.3 becomes 1/3), so every row sums to 1.
+
+    Args:
+        step: Approximate grid spacing, in (0, 1]
+        min_weight: Minimum weight of each dimension
+
+    Returns:
+        (m, 3) array of weight vectors
+
+    Raises:
+        ConfigurationError: If ``step`` is out of range or no grid point
+            satisfies ``min_weight``
+    """
+    if not 0 < step <= 1:
+        raise ConfigurationError(f"Weight step must be in (0, 1], got {step}")
+    ticks = max(1, int(round(1 / step)))
+    low = max(0, math.ceil(min_weight * ticks - 1e-9))
+    rows = [
+        (p / ticks, f / ticks, (ticks - p - f) / ticks)
+        for p, f in itertools.product(range(low, ticks + 1), repeat=2)
+        if ticks - p - f >= low
+    ]
+    if not rows:
+        raise ConfigurationError(
+            f"No weight vector with spacing 1/{ticks} has every weight >= {min_weight}"
+        )
+    return np.array(rows, dtype=np.float64)
+
+
+def dirichlet_weights(
+    count: int,
+    center: Sequence[float] = (P_WEIGHT, F_WEIGHT, C_WEIGHT),
+    concentration: float = 50.0,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Random weight vectors concentrated around ``center``.
+
+    Args:
+        count: Number of weight vectors
+        center: Mean weights
+        concentration: Higher values stay closer to ``center``
+        seed: Random seed
+
+    Returns:
+        (count, 3) array of weight vectors
+    """
+    rng = np.random.default_rng(seed)
+    return rng.dirichlet(np.asarray(center) * concentration, size=count)
+
+
+class ScenarioScores:
+    """
+    Re-scored outputs for every (scenario, direction) pair.
+    每个情景下各方向的重评分结果
+    """
+
+    def __init__(self, roi: np.ndarray, fused: np.ndarray, decisions: np.ndarray):
+        self.roi = roi
+        self.fused = fused
+        self.decisions = decisions
+
+    def ranks(self) -> np.ndarray:
+        """(k, n) 1-based ranks by ROI descending; ties keep input order."""
+        order = np.argsort(-self.roi, axis=1, kind="stable")
+        ranks = np.empty_like(order)
+        rows = np.arange(order.shape[0])[:, None]
+        ranks[rows, order] = np.arange(1, order.shape[1] + 1)
+        return ranks
+
+
+def rescore(matrix: IndicatorMatrix, scenarios: Scenarios) -> ScenarioScores:
+    """
+    Vectorized ROI, fuse status and 4-level decision for all scenarios.
+
+    Mirrors ``src.evaluation.scoring.classify_decision``.
+
+    Args:
+        matrix: Raw indicator matrix (n directions)
+        scenarios: k scenarios
+
+    Returns:
+        ScenarioScores with (k, n) arrays
+    """
+    scores = matrix.scores
+    p_avg = scores[:, _P].mean(axis=1)
+    c_avg = scores[:, _C].mean(axis=1)
+    f23_min = scores[:, _F[1:]].min(axis=1)
+
+    f1 = np.clip(scores[None, :, _F1] + scenarios.f1_shifts[:, None], 1.0, 10.0)
+    f_min = np.minimum(f1, f23_min[None, :])
+
+    w = scenarios.weights
+    roi = w[:, 0:1] * p_avg[None, :] + w[:, 1:2] * f_min + w[:, 2:3] * c_avg[None, :]
+    fused = f_min < scenarios.fuse_thresholds[:, None]
+
+    avoid = fused | (roi < VIABLE_ROI)
+    decisions = np.select(
+        [
+            avoid,
+            roi >= STRATEGIC_ROI,
+            np.broadcast_to(p_avg > HIGH_POTENTIAL, roi.shape),
+            f_min > HIGH_FEASIBILITY,
+        ],
+        [3, 0, 1, 2],
+        default=3,
+    ).astype(np.int8)
+    return ScenarioScores(roi=roi, fused=fused, decisions=decisions)
+
+
+class DirectionStability(BaseModel):
+    """
+    Rank stability of one direction across scenarios.
+    单个方向在各情景下的排名稳定性
+    """
+
+    direction: str
+    baseline_rank: int = Field(..., description="Rank under the default formula")
+    mean_rank: float
+    std_rank: float
+    best_rank: int
+    worst_rank: int
+    top_k_rate: float = Field(..., description="Fraction of scenarios ranked within top-k")
+    fuse_rate: float = Field(..., description="Fraction of scenarios where the fuse triggers")
+    decision_rates: dict[str, float] = Field(
+        default_factory=dict, description="Fraction of scenarios per decision"
+    )
+
+
+class SensitivityReport(BaseModel):
+    """
+    Rank-stability statistics of a sensitivity run.
+    敏感性分析报告
+    """
+
+    scenarios: int
+    directions: int
+    top_k: int
+    mean_spearman: float = Field(..., description="Mean Spearman rho vs baseline ranking")
+    min_spearman: float = Field(..., description="Worst-case Spearman rho vs baseline")
+    mean_top_k_overlap: float = Field(..., description="Mean share of baseline top-k kept")
+    stability: list[DirectionStability] = Field(
+        default_factory=list, description="Per-direction statistics, by baseline rank"
+    )
+
+
+def analyze(matrix: IndicatorMatrix, scenarios: Scenarios, top_k: int = 10) -> SensitivityReport:
+    """
+    Compute rank-stability statistics of all directions across scenarios.
+
+    Args:
+        matrix: Raw indicator matrix
+        scenarios: Re-scoring scenarios
+        top_k: Size of the "top" set for top-k statistics
+
+    Returns:
+        SensitivityReport
+    """
+    n = len(matrix)
+    if n == 0 or len(scenarios) == 0:
+        raise ConfigurationError("Sensitivity analysis needs at least one direction and scenario")
+    top_k = min(top_k, n)
+
+    scored = rescore(matrix, scenarios)
+    ranks = scored.ranks()
+    baseline_ranks = rescore(matrix, Scenarios.baseline()).ranks()[0]
+
+    if n > 1:
+        d2 = ((ranks - baseline_ranks[None, :]) ** 2).sum(axis=1)
+        spearman = 1 - 6 * d2 / (n * (n * n - 1))
+    else:
+        spearman = np.ones(len(scenarios))
+
+    in_top = ranks <= top_k
+    baseline_top = baseline_ranks <= top_k
+    overlap = (in_top & baseline_top[None, :]).sum(axis=1) / top_k
+
+    decision_counts = np.stack([(scored.decisions == code).mean(axis=0) for code in range(4)])
+    mean_rank = ranks.mean(axis=0)
+    std_rank = ranks.std(axis=0)
+    best_rank = ranks.min(axis=0)
+    worst_rank = ranks.max(axis=0)
+    top_k_rate = in_top.mean(axis=0)
+    fuse_rate = scored.fused.mean(axis=0)
+
+    stability = [
+        DirectionStability(
+            direction=matrix.directions[i],
+            baseline_rank=int(baseline_ranks[i]),
+            mean_rank=float(mean_rank[i]),
+            std_rank=float(std_rank[i]),
+            best_rank=int(best_rank[i]),
+            worst_rank=int(worst_rank[i]),
+            top_k_rate=float(top_k_rate[i]),
+            fuse_rate=float(fuse_rate[i]),
+            decision_rates={
+                DECISION_CODES[code].value: float(decision_counts[code, i]) for code in range(4)
+            },
+        )
+        for i in np.argsort(baseline_ranks)
+    ]
+
+    return SensitivityReport(
+        scenarios=len(scenarios),
+        directions=n,
+        top_k=top_k,
+        mean_spearman=float(spearman.mean()),
+        min_spearman=float(spearman.min()),
+        mean_top_k_overlap=float(overlap.mean()),
+        stability=stability,
+    )
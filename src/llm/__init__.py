@@ -3,9 +3,19 @@ LLM abstraction layer.
 LLM 抽象层模块，支持多提供商
 """
 
-from typing import TYPE_CHECKING
+from src.llm.base import BaseLLMClient, LLMResponse
+from src.llm.clients import AnthropicCompatibleClient, OpenAICompatibleClient
+from src.llm.factory import SUPPORTED_PROVIDERS, LLMClientFactory
+from src.llm.fake_server import FakeLLMConfig, FakeLLMServer, FakeServerStats
 
-if TYPE_CHECKING:
-    pass
-
-__all__ = []
+__all__ = [
+    "BaseLLMClient",
+    "LLMResponse",
+    "OpenAICompatibleClient",
+    "AnthropicCompatibleClient",
+    "LLMClientFactory",
+    "SUPPORTED_PROVIDERS",
+    "FakeLLMConfig",
+    "FakeLLMServer",
+    "FakeServerStats",
+]
@@ -0,0 +1,134 @@
+"""
+Base LLM client abstraction.
+LLM 客户端基类
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from types import TracebackType
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, Field
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from src.utils.http import is_retryable, wait_retry_after
+
+T = TypeVar("T")
+
+
+class LLMResponse(BaseModel):
+    """
+    Normalized chat completion response.
+    统一的对话补全响应
+    """
+
+    content: str = Field(..., description="Assistant message text")
+    model: str = Field(default="", description="Model that produced the response")
+    input_tokens: int = Field(default=0, description="Prompt tokens billed")
+    output_tokens: int = Field(default=0, description="Completion tokens billed")
+    latency_s: float = Field(default=0.0, description="Wall time including retries")
+    attempts: int = Field(default=1, description="Number of HTTP attempts")
+
+
+class BaseLLMClient(ABC):
+    """
+    Abstract base class for chat LLM clients.
+    对话式 LLM 客户端抽象基类
+    """
+
+    provider: str = "base"
+
+    def __init__(self, model: str, max_retries: int = 3, backoff_max: float = 30.0):
+        """
+        Initialize the client.
+
+        Args:
+            model: Model name
+            max_retries: Retries after the first attempt for transient errors
+            backoff_max: Upper bound of any wait between attempts, including
+                server Retry-After hints (seconds)
+        """
+        self.model = model
+        self.max_retries = max_retries
+        self.backoff_max = backoff_max
+
+    @abstractmethod
+    def _send(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: dict[str, Any] | None,
+    ) -> LLMResponse:
+        """Perform a single HTTP call. Raise LLMAPIError on failure."""
+
+    def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: int = 1024,
+        response_format: dict[str, Any] | None = None,
+    ) -> LLMResponse:
+        """
+        Send a chat request, retrying transient failures.
+
+        Args:
+            messages: Chat messages ({"role": ..., "content": ...})
+            temperature: Sampling temperature
+            max_tokens: Max completion tokens
+            response_format: Optional structured output spec (JSON schema)
+
+        Returns:
+            LLMResponse
+
+        Raises:
+            LLMAPIError: If the call fails after all retries
+        """
+        start = time.perf_counter()
+        response, attempts = self.with_retries(
+            lambda: self._send(messages, temperature, max_tokens, response_format)
+        )
+        response.latency_s = time.perf_counter() - start
+        response.attempts = attempts
+        return response
+
+    def with_retries(self, call: Callable[[], T]) -> tuple[T, int]:
+        """
+        Run an HTTP call, retrying transient LLMAPIErrors.
+
+        Args:
+            call: Zero-argument function performing one attempt
+
+        Returns:
+            (result, number of attempts)
+        """
+        retrying = Retrying(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=wait_retry_after(
+                wait_random_exponential(multiplier=0.5, max=self.backoff_max),
+                max_wait=self.backoff_max,
+            ),
+            retry=retry_if_exception(is_retryable),
+            reraise=True,
+        )
+        attempts = 0
+        for attempt in retrying:
+            with attempt:
+                attempts += 1
+                result = call()
+        return result, attempts
+
+    def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release underlying connections."""
+
+    def __enter__(self) -> "BaseLLMClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,255 @@
+"""
+HTTP clients for OpenAI- and Anthropic-compatible chat endpoints.
+OpenAI / Anthropic 兼容接口的 HTTP 客户端
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+import httpx
+
+from src.llm.base import BaseLLMClient, LLMResponse
+from src.utils.exceptions import ConfigurationError, LLMAPIError
+from src.utils.http import parse_retry_after
+
+
+def anthropic_tool_for(response_format: dict[str, Any]) -> dict[str, Any]:
+    """
+    Translate an OpenAI ``json_schema`` response format into an Anthropic tool.
+
+    Anthropic has no ``response_format``; forcing a call to a tool whose
+    ``input_schema`` is the schema makes the model reply with matching JSON.
+
+    Args:
+        response_format: ``{"type": "json_schema", "json_schema": {...}}``
+
+    Returns:
+        Tool definition for the ``tools`` field
+
+    Raises:
+        ConfigurationError: If the format is not a JSON schema format
+    """
+    spec = (
+        response_format.get("json_schema") if response_format.get("type") == "json_schema" else None
+    )
+    if not isinstance(spec, dict) or "schema" not in spec:
+        raise ConfigurationError(
+            f"Anthropic client supports only json_schema response formats, got {response_format}"
+        )
+    return {
+        "name": spec.get("name", "structured_output"),
+        "description": "Report the result in the required structure.",
+        "input_schema": spec["schema"],
+    }
+
+
+class _HTTPChatClient(BaseLLMClient):
+    """Shared pooled-HTTP plumbing for the concrete clients."""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: str,
+        timeout: float = 60.0,
+        max_retries: int = 3,
+        max_connections: int = 32,
+        headers: dict[str, str] | None = None,
+    ):
+        super().__init__(model=model, max_retries=max_retries)
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self._http = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=headers or {},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        try:
+            resp = self._http.post(path, json=payload)
+        except httpx.HTTPError as e:
+            raise LLMAPIError(self.provider, f"HTTP transport error: {e}") from e
+
+        if resp.status_code != 200:
+            raise LLMAPIError(
+                self.provider,
+                f"HTTP {resp.status_code}: {resp.text[:200]}",
+                retry_after=parse_retry_after(resp.headers),
+                status_code=resp.status_code,
+            )
+        try:
+            data: dict[str, Any] = resp.json()
+        except ValueError as e:
+            raise LLMAPIError(
+                self.provider, f"Invalid JSON body: {e}", status_code=resp.status_code
+            ) from e
+        return data
+
+    def close(self) -> None:
+        self._http.close()
+
+
+class OpenAICompatibleClient(_HTTPChatClient):
+    """
+    Client for OpenAI-compatible ``/chat/completions`` endpoints.
+    OpenAI 兼容接口客户端（OpenAI、Ollama、vLLM 等）
+    """
+
+    provider = "openai"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        base_url: str = "https://api.openai.com/v1",
+        **kwargs: Any,
+    ):
+        super().__init__(
+            api_key=api_key,
+            model=model,
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            **kwargs,
+        )
+
+    def _send(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: dict[str, Any] | None,
+    ) -> LLMResponse:
+        payload: dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if response_format is not None:
+            payload["response_format"] = response_format
+
+        data = self._post("/chat/completions", payload)
+        try:
+            content = data["choices"][0]["message"]["content"] or ""
+        except (KeyError, IndexError, TypeError) as e:
+            raise LLMAPIError(
+                self.provider, f"Unexpected response shape: {e}", status_code=200
+            ) from e
+
+        usage = data.get("usage") or {}
+        return LLMResponse(
+            content=content,
+            model=data.get("model", self.model),
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+        )
+
+    def embed(
+        self, texts: Sequence[str], model: str, dimensions: int | None = None
+    ) -> list[list[float]]:
+        """
+        Embed texts with the ``/embeddings`` endpoint.
+
+        Args:
+            texts: Input texts (one request)
+            model: Embedding model name
+            dimensions: Requested output dimension (models that support it)
+
+        Returns:
+            One vector per text, in input order
+
+        Raises:
+            LLMAPIError: If the call fails after all retries
+        """
+        payload: dict[str, Any] = {"model": model, "input": list(texts)}
+        if dimensions is not None:
+            payload["dimensions"] = dimensions
+        data, _ = self.with_retries(lambda: self._post("/embeddings", payload))
+        try:
+            items = sorted(data["data"], key=lambda item: item["index"])
+            return [item["embedding"] for item in items]
+        except (KeyError, TypeError) as e:
+            raise LLMAPIError(
+                self.provider, f"Unexpected response shape: {e}", status_code=200
+            ) from e
+
+
+class AnthropicCompatibleClient(_HTTPChatClient):
+    """
+    Client for Anthropic-compatible ``/v1/messages`` endpoints.
+    Anthropic 兼容接口客户端
+    """
+
+    provider = "anthropic"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-3-5-sonnet-latest",
+        base_url: str = "https://api.anthropic.com",
+        **kwargs: Any,
+    ):
+        super().__init__(
+            api_key=api_key,
+            model=model,
+            base_url=base_url,
+            headers={"x-api-key": api_key, "anthropic-version": "2023-06-01"},
+            **kwargs,
+        )
+
+    def _send(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: dict[str, Any] | None,
+    ) -> LLMResponse:
+        # Anthropic takes the system prompt as a top-level field
+        system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+        payload: dict[str, Any] = {
+            "model": self.model,
+            "messages": [m for m in messages if m["role"] != "system"],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if system:
+            payload["system"] = system
+        tool = anthropic_tool_for(response_format) if response_format is not None else None
+        if tool is not None:
+            payload["tools"] = [tool]
+            payload["tool_choice"] = {"type": "tool", "name": tool["name"]}
+
+        data = self._post("/v1/messages", payload)
+        try:
+            if tool is not None:
+                # The forced tool call carries the structured reply as its input
+                tool_input = next(
+                    block["input"]
+                    for block in data["content"]
+                    if block.get("type") == "tool_use" and block.get("name") == tool["name"]
+                )
+                content = json.dumps(tool_input)
+            else:
+                content = "".join(
+                    block.get("text", "")
+                    for block in data["content"]
+                    if block.get("type") == "text"
+                )
+        except (KeyError, TypeError, StopIteration) as e:
+            raise LLMAPIError(
+                self.provider, f"Unexpected response shape: {e}", status_code=200
+            ) from e
+
+        usage = data.get("usage") or {}
+        return LLMResponse(
+            content=content,
+            model=data.get("model", self.model),
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+        )
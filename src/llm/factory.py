@@ -0,0 +1,82 @@
+"""
+Factory for creating LLM clients from provider names or environment.
+LLM 客户端工厂
+"""
+
+import os
+from typing import Any
+
+from src.llm.base import BaseLLMClient
+from src.llm.clients import AnthropicCompatibleClient, OpenAICompatibleClient
+from src.utils.exceptions import ConfigurationError
+
+SUPPORTED_PROVIDERS = ("openai", "anthropic", "local")
+
+
+class LLMClientFactory:
+    """
+    Create LLM clients for the supported providers.
+    按提供商创建 LLM 客户端
+    """
+
+    @staticmethod
+    def create(provider: str, **kwargs: Any) -> BaseLLMClient:
+        """
+        Create a client for the given provider.
+
+        Args:
+            provider: openai / anthropic / local
+            **kwargs: Client options (api_key, model, base_url, timeout, ...)
+
+        Returns:
+            LLM client instance
+
+        Raises:
+            ConfigurationError: If the provider is unsupported
+        """
+        provider = provider.lower()
+        if provider == "openai":
+            return OpenAICompatibleClient(**{"api_key": "", **kwargs})
+        if provider == "anthropic":
+            return AnthropicCompatibleClient(**{"api_key": "", **kwargs})
+        if provider == "local":
+            # Ollama and similar servers expose an OpenAI-compatible API under /v1
+            kwargs.setdefault("base_url", "http://localhost:11434/v1")
+            kwargs.setdefault("model", "llama3")
+            return OpenAICompatibleClient(**{"api_key": "local", **kwargs})
+        raise ConfigurationError(
+            f"Unsupported LLM provider: {provider}. Supported: {list(SUPPORTED_PROVIDERS)}"
+        )
+
+    @classmethod
+    def create_from_env(cls) -> BaseLLMClient:
+        """
+        Create a client from environment variables.
+
+        Reads LLM_PROVIDER, the provider API key, and the optional
+        LLM_BASE_URL / LLM_MODEL overrides (e.g., to target the fake server).
+
+        Returns:
+            LLM client instance
+        """
+        provider = os.environ.get("LLM_PROVIDER", "openai").lower()
+        kwargs: dict[str, Any] = {}
+
+        if provider == "openai":
+            kwargs["api_key"] = os.environ.get("OPENAI_API_KEY", "")
+        elif provider == "anthropic":
+            kwargs["api_key"] = os.environ.get("ANTHROPIC_API_KEY", "")
+        elif provider == "local":
+            endpoint = os.environ.get("LOCAL_MODEL_ENDPOINT", "http://localhost:11434")
+            kwargs["base_url"] = endpoint.rstrip("/") + "/v1"
+            kwargs["model"] = os.environ.get("LOCAL_MODEL_NAME", "llama3")
+
+        if os.environ.get("LLM_BASE_URL"):
+            kwargs["base_url"] = os.environ["LLM_BASE_URL"]
+        if os.environ.get("LLM_MODEL"):
+            kwargs["model"] = os.environ["LLM_MODEL"]
+
+        if provider in ("openai", "anthropic") and not kwargs["api_key"]:
+            raise ConfigurationError(f"API key for provider '{provider}' is not set")
+
+        return cls.create(provider, **kwargs)
@@ -0,0 +1,340 @@
+"""
+Local fake LLM server for offline end-to-end and performance testing.
+本地模拟 LLM 服务（离线端到端与性能测试）
+
+Speaks the OpenAI ``/v1/chat/completions`` / ``/v1/embeddings`` and Anthropic
+``/v1/messages`` protocols, returns deterministic P-F-C indicator scores, and simulates
+latency distributions, rate limiting (429 + Retry-After) and server errors.
+
+The server reads the direction and requested indicators from the prompt
+lines ``Research direction: <name>`` and ``Indicators: P1, P2, ...``
+(see ``src.evaluation.prompts``).
+"""
+
+import hashlib
+import json
+import math
+import re
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from src.utils.feature_hashing import hash_vectors
+from src.utils.http import FakeHTTPServer, FakeServerConfig, JSONRequestHandler
+
+LatencyDistribution = Literal["fixed", "uniform", "normal", "lognormal", "exponential"]
+
+_DIRECTION_RE = re.compile(r"^Research direction:\s*(.+?)\s*$", re.MULTILINE)
+_INDICATORS_RE = re.compile(r"^Indicators?:\s*(.+?)\s*$", re.MULTILINE)
+_INDICATOR_KEY_RE = re.compile(r"\b([PFC][1-3])\b", re.IGNORECASE)
+
+
+def fake_score(direction: str, indicator: str) -> int:
+    """
+    Deterministic 1-10 score for a (direction, indicator) pair.
+
+    Args:
+        direction: Research direction (case-insensitive)
+        indicator: Indicator key (e.g., 'p1')
+
+    Returns:
+        Integer score in [1, 10]
+    """
+    key = f"{direction.strip().lower()}|{indicator.lower()}".encode()
+    return 1 + int.from_bytes(hashlib.sha256(key).digest()[:4], "big") % 10
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class FakeLLMConfig(FakeServerConfig):
+    """
+    Behavior of the fake LLM server.
+    模拟服务行为配置
+    """
+
+    latency_distribution: LatencyDistribution = Field(
+        default="fixed", description="Shape of the simulated response latency"
+    )
+    latency_ms: float = Field(default=0.0, ge=0, description="Mean latency")
+    latency_jitter_ms: float = Field(
+        default=0.0,
+        ge=0,
+        description="Spread: half-width (uniform), standard deviation (normal, lognormal)",
+    )
+    max_latency_ms: float = Field(
+        default=60_000.0,
+        gt=0,
+        description="Cap on any sampled latency (default: the clients' 60 s timeout)",
+    )
+    error_rate: float = Field(default=0.0, ge=0, le=1, description="Fraction of 503 responses")
+    batch_field_error_rate: float = Field(
+        default=0.0, ge=0, le=1, description="Fraction of invalid fields in multi-indicator replies"
+    )
+    batch_score_drift: int = Field(
+        default=0,
+        ge=0,
+        le=9,
+        description="Max deterministic score offset in multi-indicator replies",
+    )
+    model: str = Field(default="fake-pfc-1", description="Model name reported in responses")
+
+
+class FakeServerStats(BaseModel):
+    """
+    Request counters collected by the fake server.
+    模拟服务请求统计
+    """
+
+    requests: int = 0
+    completed: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class FakeLLMServer(FakeHTTPServer[FakeServerStats]):
+    """
+    Threaded local HTTP server imitating OpenAI/Anthropic chat APIs.
+    本地多线程模拟 LLM 服务
+
+    Usage::
+
+        with FakeLLMServer(FakeLLMConfig(latency_ms=50)) as server:
+            client = LLMClientFactory.create("openai", base_url=server.openai_base_url)
+    """
+
+    config: FakeLLMConfig
+
+    def __init__(self, config: FakeLLMConfig | None = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (not started).
+
+        Args:
+            config: Server behavior; defaults to zero latency and no faults
+            host: Bind address
+            port: Bind port (0 picks a free port)
+        """
+        super().__init__(config or FakeLLMConfig(), FakeServerStats(), host, port)
+
+    @property
+    def openai_base_url(self) -> str:
+        """Base URL for OpenAI-compatible clients."""
+        return f"{self.base_url}/v1"
+
+    @property
+    def anthropic_base_url(self) -> str:
+        """Base URL for Anthropic-compatible clients."""
+        return self.base_url
+
+    def _sample_latency(self) -> float:
+        """Sample a latency in seconds from the configured distribution."""
+        cfg = self.config
+        mean, jitter = cfg.latency_ms, cfg.latency_jitter_ms
+        with self._rng_lock:
+            if cfg.latency_distribution == "uniform":
+                value = self._rng.uniform(mean - jitter, mean + jitter)
+            elif cfg.latency_distribution == "normal":
+                value = self._rng.gauss(mean, jitter)
+            elif cfg.latency_distribution == "lognormal":
+                # Moment-matched so the samples have mean ``mean`` and stddev ``jitter``
+                value = 0.0
+                if mean:
+                    sigma = math.sqrt(math.log1p((jitter / mean) ** 2))
+                    value = math.exp(self._rng.gauss(math.log(mean) - sigma**2 / 2, sigma))
+            elif cfg.latency_distribution == "exponential":
+                value = self._rng.expovariate(1 / mean) if mean else 0.0
+            else:
+                value = mean
+        return min(max(0.0, value), cfg.max_latency_ms) / 1000
+
+    def build_reply(self, prompt: str) -> str:
+        """
+        Build the deterministic JSON reply for a prompt.
+
+        A single requested indicator yields ``{"score": int, "reason": str}``;
+        several yield ``{"p1": {"score": ..., "reason": ...}, ...}``, where
+        ``batch_score_drift`` and ``batch_field_error_rate`` simulate the
+        score shifts and malformed fields of batched prompting.
+
+        Args:
+            prompt: Concatenated message contents
+
+        Returns:
+            JSON string
+        """
+        direction_match = _DIRECTION_RE.search(prompt)
+        direction = direction_match.group(1) if direction_match else ""
+        indicators_match = _INDICATORS_RE.search(prompt)
+        keys = (
+            [k.lower() for k in _INDICATOR_KEY_RE.findall(indicators_match.group(1))]
+            if indicators_match
+            else []
+        )
+
+        if len(keys) <= 1:
+            indicator = keys[0] if keys else "p1"
+            return json.dumps(
+                {
+                    "score": fake_score(direction, indicator),
+                    "reason": f"Deterministic {indicator.upper()} score for {direction}.",
+                }
+            )
+
+        drift = self.config.batch_score_drift
+        reply: dict[str, Any] = {}
+        for key in keys:
+            score = fake_score(direction, key)
+            if drift:
+                offset = fake_score(f"{direction}|batch", key) % (2 * drift + 1) - drift
+                score = min(10, max(1, score + offset))
+            with self._rng_lock:
+                invalid = self._rng.random() < self.config.batch_field_error_rate
+            if invalid:
+                reply[key] = {"score": 0, "reason": "invalid"}
+            else:
+                reply[key] = {
+                    "score": score,
+                    "reason": f"Deterministic {key.upper()} score for {direction}.",
+                }
+        return json.dumps(reply)
+
+    def build_embeddings(self, texts: list[str], dim: int) -> list[list[float]]:
+        """
+        Deterministic embeddings for ``/v1/embeddings`` (signed feature hashing).
+
+        Args:
+            texts: Input texts
+            dim: Embedding dimension
+
+        Returns:
+            One unit-norm vector per text
+        """
+        vectors: list[list[float]] = hash_vectors(texts, dim).tolist()
+        return vectors
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(JSONRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                try:
+                    payload = json.loads(self._read_body() or b"{}")
+                except ValueError:
+                    self._reply(400, {"error": {"message": "invalid JSON"}})
+                    return
+
+                if self.path.rstrip("/").endswith("/chat/completions"):
+                    api = "openai"
+                elif self.path.rstrip("/").endswith("/messages"):
+                    api = "anthropic"
+                elif self.path.rstrip("/").endswith("/embeddings"):
+                    api = "embeddings"
+                else:
+                    self._reply(404, {"error": {"message": f"unknown path {self.path}"}})
+                    return
+
+                server._count(requests=1)
+
+                wait = server._rate_limit_wait()
+                if wait > 0:
+                    server._count(rate_limited=1)
+                    self._reply(
+                        429,
+                        {"error": {"type": "rate_limit_error", "message": "Rate limit exceeded"}},
+                        server._retry_after_headers(wait),
+                    )
+                    return
+
+                time.sleep(server._sample_latency())
+
+                if server._should_fail():
+                    server._count(errors=1)
+                    self._reply(
+                        503, {"error": {"type": "overloaded_error", "message": "Overloaded"}}
+                    )
+                    return
+
+                model = payload.get("model") or server.config.model
+                if api == "embeddings":
+                    texts = payload.get("input", [])
+                    texts = [texts] if isinstance(texts, str) else list(texts)
+                    vectors = server.build_embeddings(texts, int(payload.get("dimensions", 256)))
+                    input_tokens = sum(estimate_tokens(t) for t in texts)
+                    server._count(completed=1, input_tokens=input_tokens)
+                    self._reply(
+                        200,
+                        {
+                            "object": "list",
+                            "model": model,
+                            "data": [
+                                {"object": "embedding", "index": i, "embedding": vector}
+                                for i, vector in enumerate(vectors)
+                            ],
+                            "usage": {"prompt_tokens": input_tokens, "total_tokens": input_tokens},
+                        },
+                    )
+                    return
+
+                messages = payload.get("messages", [])
+                prompt = "\n".join(
+                    [str(payload.get("system", ""))] + [str(m.get("content", "")) for m in messages]
+                )
+                content = server.build_reply(prompt)
+                input_tokens = estimate_tokens(prompt)
+                output_tokens = estimate_tokens(content)
+                server._count(completed=1, input_tokens=input_tokens, output_tokens=output_tokens)
+
+                if api == "openai":
+                    body: dict[str, Any] = {
+                        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": content},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": input_tokens,
+                            "completion_tokens": output_tokens,
+                            "total_tokens": input_tokens + output_tokens,
+                        },
+                    }
+                else:
+                    tool_choice = payload.get("tool_choice") or {}
+                    if tool_choice.get("type") == "tool":
+                        # Forced tool call: the structured reply is the tool input
+                        blocks: list[dict[str, Any]] = [
+                            {
+                                "type": "tool_use",
+                                "id": f"toolu_{uuid.uuid4().hex[:12]}",
+                                "name": tool_choice.get("name", ""),
+                                "input": json.loads(content),
+                            }
+                        ]
+                        stop_reason = "tool_use"
+                    else:
+                        blocks = [{"type": "text", "text": content}]
+                        stop_reason = "end_turn"
+                    body = {
+                        "id": f"msg_{uuid.uuid4().hex[:12]}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": model,
+                        "content": blocks,
+                        "stop_reason": stop_reason,
+                        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+                    }
+                self._reply(200, body)
+
+        return Handler
@@ -3,9 +3,12 @@ Report generation module.
 报告生成模块
 """
 
-from typing import TYPE_CHECKING
+from src.report.renderer import ReportRenderer
+from src.report.writer import BatchReportSummary, BatchReportWriter, slugify
 
-if TYPE_CHECKING:
-    pass
-
-__all__ = []
+__all__ = [
+    "ReportRenderer",
+    "BatchReportWriter",
+    "BatchReportSummary",
+    "slugify",
+]
@@ -0,0 +1,221 @@
+"""
+Jinja2-based report renderer with compiled template caching.
+基于 Jinja2 的报告渲染器（模板编译缓存）
+"""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Literal, TextIO
+
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
+from src.evaluation.schema import INDICATOR_NAMES, INDICATORS, Decision, EvaluationResult
+from src.utils.exceptions import ConfigurationError
+
+Language = Literal["zh", "en", "both"]
+ReportFormat = Literal["md", "html"]
+
+SUPPORTED_FORMATS: tuple[str, ...] = ("md", "html")
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# UI labels: key -> (zh, en)
+LABELS = {
+    "report_title": ("研究方向评估报告", "Research Direction Evaluation"),
+    "index_title": ("研究方向评估汇总", "Research Direction Evaluation Index"),
+    "roi": ("ROI 分数", "ROI Score"),
+    "decision": ("决策建议", "Decision"),
+    "fused": ("触发熔断：F_min < 3，判定不可行", "Fuse triggered: F_min < 3, infeasible"),
+    "indicators": ("指标评分", "Indicator Scores"),
+    "indicator": ("指标", "Indicator"),
+    "score": ("分数", "Score"),
+    "reason": ("理由", "Rationale"),
+    "risks": ("潜在风险", "Potential Risks"),
+    "direction": ("研究方向", "Direction"),
+    "report": ("报告", "Report"),
+    "total": ("方向总数", "Total directions"),
+}
+
+
+def _localize(zh: str, en: str, language: str) -> str:
+    """Pick the label for the given language ("both" joins zh and en)."""
+    if language == "zh":
+        return zh
+    if language == "en":
+        return en
+    return f"{zh} / {en}"
+
+
+@lru_cache(maxsize=8)
+def get_environment(templates_dir: str = str(TEMPLATES_DIR)) -> Environment:
+    """
+    Return a shared Jinja2 environment for a template directory.
+
+    Environments are cached per directory (and per process), so templates
+    are loaded and compiled only once no matter how many renderers exist.
+    ``auto_reload`` is disabled to skip the mtime check on every lookup.
+
+    Args:
+        templates_dir: Directory containing ``*.j2`` templates
+
+    Returns:
+        Jinja2 Environment
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(enabled_extensions=("html.j2",), default=False),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
+def result_context(result: EvaluationResult) -> dict[str, Any]:
+    """
+    Flatten an EvaluationResult into a plain, picklable template context.
+
+    Derived scores are computed once here rather than on every template access.
+
+    Args:
+        result: Evaluation result
+
+    Returns:
+        Dictionary consumed by the direction templates
+    """
+    return {
+        "direction": result.direction,
+        "scores": result.scores.model_dump(),
+        "reasons": dict(result.reasons),
+        "risks": list(result.risks),
+        "p_avg": result.p_avg,
+        "f_min": result.f_min,
+        "c_avg": result.c_avg,
+        "roi_score": result.roi_score,
+        "fused": result.fused,
+        "decision": result.decision.value,
+    }
+
+
+class ReportRenderer:
+    """
+    Render evaluation results to Markdown/HTML.
+    评估结果渲染器（Markdown / HTML）
+    """
+
+    def __init__(
+        self,
+        language: Language = "both",
+        templates_dir: Path | None = None,
+    ):
+        """
+        Initialize the renderer.
+
+        Args:
+            language: Output language (zh / en / both)
+            templates_dir: Custom template directory (defaults to bundled templates)
+        """
+        if language not in ("zh", "en", "both"):
+            raise ConfigurationError(f"Unsupported report language: {language}")
+
+        self.language = language
+        self.templates_dir = Path(templates_dir) if templates_dir else TEMPLATES_DIR
+        self._env = get_environment(str(self.templates_dir))
+        self._templates: dict[str, Template] = {}
+        # Passed per render call: compiled templates are shared across languages
+        self._helpers = {
+            "label": self._label,
+            "indicator_label": self._indicator_label,
+            "decision_label": self._decision_label,
+            "indicators": INDICATORS,
+        }
+
+    def _label(self, key: str) -> str:
+        zh, en = LABELS[key]
+        return _localize(zh, en, self.language)
+
+    def _indicator_label(self, key: str) -> str:
+        zh, en = INDICATOR_NAMES[key]
+        return _localize(zh, en, self.language)
+
+    def _decision_label(self, value: str) -> str:
+        decision = Decision(value)
+        return _localize(decision.value, decision.english, self.language)
+
+    def get_template(self, name: str) -> Template:
+        """
+        Return a compiled template, compiling it on first use.
+
+        Args:
+            name: Template file name (e.g., 'direction.md.j2')
+
+        Returns:
+            Compiled Jinja2 Template (shared by all renderers of the directory)
+        """
+        template = self._templates.get(name)
+        if template is None:
+            template = self._env.get_template(name)
+            self._templates[name] = template
+        return template
+
+    def warm_up(self, formats: Iterable[str] = SUPPORTED_FORMATS) -> None:
+        """Compile the direction and index templates for the given formats."""
+        for fmt in formats:
+            self.get_template(self._template_name("direction", fmt))
+            self.get_template(self._template_name("index", fmt))
+
+    @staticmethod
+    def _template_name(kind: str, fmt: str) -> str:
+        if fmt not in SUPPORTED_FORMATS:
+            raise ConfigurationError(
+                f"Unsupported report format: {fmt}. Supported: {list(SUPPORTED_FORMATS)}"
+            )
+        return f"{kind}.{fmt}.j2"
+
+    def render_context(self, context: dict[str, Any], fmt: ReportFormat = "md") -> str:
+        """
+        Render a direction report from a pre-built context.
+
+        Args:
+            context: Output of ``result_context``
+            fmt: Output format (md / html)
+
+        Returns:
+            Rendered report text
+        """
+        return self.get_template(self._template_name("direction", fmt)).render(
+            result=context, **self._helpers
+        )
+
+    def render(self, result: EvaluationResult, fmt: ReportFormat = "md") -> str:
+        """
+        Render a single evaluation result.
+
+        Args:
+            result: Evaluation result
+            fmt: Output format (md / html)
+
+        Returns:
+            Rendered report text
+        """
+        return self.render_context(result_context(result), fmt)
+
+    def stream_index(
+        self,
+        entries: Iterable[dict[str, Any]],
+        out: TextIO,
+        fmt: ReportFormat = "md",
+    ) -> None:
+        """
+        Stream the combined index report to a file object chunk by chunk.
+
+        Args:
+            entries: Index rows (direction, roi_score, decision, fused, paths)
+            out: Writable text stream
+            fmt: Output format (md / html)
+        """
+        template = self.get_template(self._template_name("index", fmt))
+        for chunk in template.generate(entries=list(entries), **self._helpers):
+            out.write(chunk)
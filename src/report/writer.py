@@ -0,0 +1,226 @@
+"""
+Streaming batch report writer.
+批量报告流式写入器
+"""
+
+import hashlib
+import re
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from src.evaluation.schema import INDICATORS, EvaluationResult
+from src.evaluation.sensitivity import IndicatorMatrix
+from src.report.renderer import (
+    SUPPORTED_FORMATS,
+    Language,
+    ReportRenderer,
+    result_context,
+)
+from src.utils.exceptions import ConfigurationError
+
+# Longest slug in UTF-8 bytes; file systems commonly cap names at 255 bytes
+SLUG_MAX_BYTES = 80
+
+# One renderer per (process, language, templates_dir); templates compile once per worker
+_WORKER_RENDERERS: dict[tuple[str, str], ReportRenderer] = {}
+
+
+def _worker_renderer(language: str, templates_dir: str) -> ReportRenderer:
+    key = (language, templates_dir)
+    renderer = _WORKER_RENDERERS.get(key)
+    if renderer is None:
+        renderer = ReportRenderer(language=language, templates_dir=Path(templates_dir))  # type: ignore[arg-type]
+        _WORKER_RENDERERS[key] = renderer
+    return renderer
+
+
+def _render_to_files(
+    context: dict[str, Any],
+    targets: dict[str, str],
+    language: str,
+    templates_dir: str,
+) -> None:
+    """Render one direction in every requested format and write it to disk."""
+    renderer = _worker_renderer(language, templates_dir)
+    for fmt, path in targets.items():
+        Path(path).write_text(renderer.render_context(context, fmt), encoding="utf-8")  # type: ignore[arg-type]
+
+
+def slugify(text: str, max_bytes: int = SLUG_MAX_BYTES) -> str:
+    """
+    Convert a direction name into a file-system friendly slug.
+
+    Slugs longer than ``max_bytes`` UTF-8 bytes are truncated and suffixed
+    with a short hash of the full slug, so long names stay distinct.
+
+    Args:
+        text: Direction name (may contain non-ASCII characters)
+        max_bytes: Maximum slug length in UTF-8 bytes
+
+    Returns:
+        Lowercase slug, e.g. 'Video Generation' -> 'video-generation'
+    """
+    slug = re.sub(r"[^\w]+", "-", text.strip().lower()).strip("-_") or "direction"
+    raw = slug.encode("utf-8")
+    if len(raw) <= max_bytes:
+        return slug
+    digest = hashlib.sha1(raw).hexdigest()[:8]
+    head = raw[: max_bytes - len(digest) - 1].decode("utf-8", errors="ignore").rstrip("-_")
+    return f"{head}-{digest}"
+
+
+class BatchReportSummary(BaseModel):
+    """
+    Summary of a batch report run.
+    批量报告生成结果摘要
+    """
+
+    output_dir: str = Field(..., description="Output root directory")
+    index_paths: dict[str, str] = Field(default_factory=dict, description="Index file per format")
+    direction_count: int = Field(default=0, description="Number of rendered directions")
+    matrix_path: str | None = Field(
+        default=None, description="Raw indicator matrix (.npz) for sensitivity analysis"
+    )
+
+
+class BatchReportWriter:
+    """
+    Render many evaluation results concurrently and stream them to disk.
+    并发渲染评估结果并流式写入磁盘
+
+    Results are consumed lazily from any iterable (e.g., a generator yielding
+    results as evaluations finish). Each direction is rendered and written by a
+    worker as soon as it arrives; only a small index row is kept per direction,
+    and at most ``max_in_flight`` rendered jobs are pending at any time.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        language: Language = "both",
+        formats: Iterable[str] = ("md",),
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        max_in_flight: int | None = None,
+        templates_dir: Path | None = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            output_dir: Directory receiving index and per-direction files
+            language: Output language (zh / en / both)
+            formats: Output formats (md / html)
+            max_workers: Number of render workers (defaults to executor default)
+            use_processes: Render in a process pool (True) or thread pool (False)
+            max_in_flight: Max pending render jobs (defaults to 4 × workers)
+            templates_dir: Custom template directory
+        """
+        self.formats = tuple(formats)
+        for fmt in self.formats:
+            if fmt not in SUPPORTED_FORMATS:
+                raise ConfigurationError(
+                    f"Unsupported report format: {fmt}. Supported: {list(SUPPORTED_FORMATS)}"
+                )
+
+        self.output_dir = Path(output_dir)
+        self.renderer = ReportRenderer(language=language, templates_dir=templates_dir)
+        self.renderer.warm_up(self.formats)
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.max_in_flight = max_in_flight or 4 * (max_workers or 4)
+
+    def _make_executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def write_batch(self, results: Iterable[EvaluationResult]) -> BatchReportSummary:
+        """
+        Render per-direction reports and a combined index report.
+
+        Layout::
+
+            output_dir/
+            ├── index.md
+            ├── indicator_matrix.npz
+            └── directions/
+                └── video-generation.md
+
+        Args:
+            results: Evaluation results, consumed as they arrive
+
+        Returns:
+            BatchReportSummary with written index paths
+        """
+        directions_dir = self.output_dir / "directions"
+        directions_dir.mkdir(parents=True, exist_ok=True)
+
+        language = self.renderer.language
+        templates_dir = str(self.renderer.templates_dir)
+        entries: list[dict[str, Any]] = []
+        score_rows: list[list[float]] = []
+        used_slugs: set[str] = set()
+        pending: deque[Future[None]] = deque()
+
+        with self._make_executor() as executor:
+            for result in results:
+                context = result_context(result)
+
+                slug = slugify(result.direction)
+                base, suffix = slug, 2
+                while slug in used_slugs:
+                    slug = f"{base}-{suffix}"
+                    suffix += 1
+                used_slugs.add(slug)
+
+                targets = {fmt: str(directions_dir / f"{slug}.{fmt}") for fmt in self.formats}
+                pending.append(
+                    executor.submit(_render_to_files, context, targets, language, templates_dir)
+                )
+                entries.append(
+                    {
+                        "direction": context["direction"],
+                        "roi_score": context["roi_score"],
+                        "decision": context["decision"],
+                        "fused": context["fused"],
+                        "paths": {fmt: f"directions/{slug}.{fmt}" for fmt in self.formats},
+                    }
+                )
+
+                score_rows.append([context["scores"][key] for key in INDICATORS])
+
+                # Backpressure: never hold more than max_in_flight pending jobs
+                while len(pending) >= self.max_in_flight:
+                    pending.popleft().result()
+
+            while pending:
+                pending.popleft().result()
+
+        matrix_path = self.output_dir / "indicator_matrix.npz"
+        IndicatorMatrix(
+            [e["direction"] for e in entries],
+            np.array(score_rows, dtype=np.float64).reshape(len(entries), len(INDICATORS)),
+        ).save(matrix_path)
+
+        entries.sort(key=lambda e: e["roi_score"], reverse=True)
+
+        index_paths: dict[str, str] = {}
+        for fmt in self.formats:
+            index_path = self.output_dir / f"index.{fmt}"
+            with open(index_path, "w", encoding="utf-8") as f:
+                self.renderer.stream_index(entries, f, fmt)  # type: ignore[arg-type]
+            index_paths[fmt] = str(index_path)
+
+        return BatchReportSummary(
+            output_dir=str(self.output_dir),
+            index_paths=index_paths,
+            direction_count=len(entries),
+            matrix_path=str(matrix_path),
+        )
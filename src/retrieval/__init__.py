@@ -0,0 +1,28 @@
+"""
+Embedding-based retrieval of papers and past evaluations.
+基于向量的论文与历史评估检索模块
+"""
+
+from src.retrieval.embedder import (
+    BaseEmbedder,
+    CachedEmbedder,
+    HashingEmbedder,
+    ProviderEmbedder,
+)
+from src.retrieval.index import IVFIndex
+from src.retrieval.memory import EvaluationMemory, SimilarEvaluation
+from src.retrieval.papers import PaperHit, PaperRetriever
+from src.retrieval.store import EmbeddingStore
+
+__all__ = [
+    "BaseEmbedder",
+    "HashingEmbedder",
+    "ProviderEmbedder",
+    "CachedEmbedder",
+    "EmbeddingStore",
+    "IVFIndex",
+    "EvaluationMemory",
+    "SimilarEvaluation",
+    "PaperRetriever",
+    "PaperHit",
+]
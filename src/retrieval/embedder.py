@@ -0,0 +1,151 @@
+"""
+Text embedders: local CPU feature hashing or the configured provider.
+文本向量化：本地 CPU 特征哈希或 LLM 提供商接口
+"""
+
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.llm.clients import OpenAICompatibleClient
+from src.utils.feature_hashing import hash_vectors, normalize_rows
+
+
+class BaseEmbedder(ABC):
+    """
+    Abstract text embedder producing L2-normalized float32 vectors.
+    文本向量化抽象基类
+    """
+
+    dim: int
+    model: str
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            (len(texts), dim) float32 array with unit-norm rows
+        """
+
+    def embed_one(self, text: str) -> np.ndarray:
+        """Embed a single text into a (dim,) vector."""
+        vector: np.ndarray = self.embed([text])[0]
+        return vector
+
+
+class HashingEmbedder(BaseEmbedder):
+    """
+    Local CPU embedder based on signed feature hashing.
+    基于特征哈希的本地 CPU 向量化
+
+    Features are word unigrams, word bigrams and character trigrams, so
+    spelling variants ("Multimodal Alignment" / "multi-modal alignment")
+    land close together. No model download and fully deterministic.
+    """
+
+    def __init__(self, dim: int = 512):
+        """
+        Initialize the embedder.
+
+        Args:
+            dim: Embedding dimension
+        """
+        self.dim = dim
+        self.model = f"hashing-{dim}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        return hash_vectors(texts, self.dim)
+
+
+class ProviderEmbedder(BaseEmbedder):
+    """
+    Embedder backed by an OpenAI-compatible ``/embeddings`` endpoint.
+    基于提供商 embeddings 接口的向量化
+    """
+
+    def __init__(
+        self,
+        client: OpenAICompatibleClient,
+        model: str = "text-embedding-3-small",
+        dim: int = 1536,
+        batch_size: int = 256,
+    ):
+        """
+        Initialize the embedder.
+
+        Args:
+            client: OpenAI-compatible client (also works with local servers)
+            model: Embedding model name
+            dim: Embedding dimension returned by the model
+            batch_size: Texts per HTTP request
+        """
+        self.client = client
+        self.model = model
+        self.dim = dim
+        self.batch_size = batch_size
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: list[list[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start : start + self.batch_size]
+            rows.extend(self.client.embed(batch, model=self.model, dimensions=self.dim))
+        vectors = np.array(rows, dtype=np.float32).reshape(len(texts), self.dim)
+        return normalize_rows(vectors).astype(np.float32)
+
+
+class CachedEmbedder(BaseEmbedder):
+    """
+    In-memory cache in front of another embedder, keyed by text hash.
+    带缓存的向量化（按文本哈希）
+
+    Repeated directions and papers are embedded once per process, which
+    matters most for provider embedders billed per call.
+    """
+
+    def __init__(self, inner: BaseEmbedder, max_entries: int = 100_000):
+        """
+        Initialize the cache.
+
+        Args:
+            inner: Embedder used on cache misses
+            max_entries: Entries kept before the cache is cleared
+        """
+        self.inner = inner
+        self.dim = inner.dim
+        self.model = inner.model
+        self.max_entries = max_entries
+        self._cache: dict[bytes, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.dim), dtype=np.float32)
+        keys = [self._key(t) for t in texts]
+        found: dict[int, np.ndarray] = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    found[i] = cached
+        missing = [i for i in range(len(texts)) if i not in found]
+        if missing:
+            vectors = self.inner.embed([texts[i] for i in missing])
+            with self._lock:
+                if len(self._cache) + len(missing) > self.max_entries:
+                    self._cache.clear()
+                for i, vector in zip(missing, vectors, strict=True):
+                    self._cache[keys[i]] = vector
+                    found[i] = vector
+        return np.stack([found[i] for i in range(len(texts))])
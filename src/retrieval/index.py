@@ -0,0 +1,174 @@
+"""
+Inverted-file (IVF) approximate nearest-neighbor index in NumPy.
+基于 NumPy 的 IVF 近似最近邻索引
+
+Vectors are clustered with spherical k-means; a query only scans the
+``nprobe`` lists whose centroids are closest to it. The index stores row
+ids only and scores against the caller's (memory-mapped) vector matrix,
+so it stays small on disk.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from src.utils.exceptions import DataLoadError
+
+
+def exact_search(vectors: np.ndarray, query: np.ndarray, k: int) -> list[tuple[int, float]]:
+    """
+    Brute-force cosine search over unit-norm rows.
+
+    Args:
+        vectors: (n, dim) unit-norm matrix
+        query: (dim,) unit-norm vector
+        k: Number of results
+
+    Returns:
+        (row, similarity) pairs, most similar first
+    """
+    if len(vectors) == 0 or k <= 0:
+        return []
+    scores = np.asarray(vectors @ query, dtype=np.float32)
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return [(int(row), float(scores[row])) for row in top]
+
+
+def spherical_kmeans(
+    vectors: np.ndarray, nlist: int, iterations: int = 10, seed: int = 0
+) -> np.ndarray:
+    """
+    Cluster unit-norm vectors by cosine similarity.
+
+    Args:
+        vectors: (n, dim) unit-norm matrix
+        nlist: Number of clusters
+        iterations: Lloyd iterations
+        seed: Random seed for the initial centroids
+
+    Returns:
+        (nlist, dim) unit-norm centroids
+    """
+    rng = np.random.default_rng(seed)
+    nlist = min(nlist, len(vectors))
+    centroids = np.array(vectors[rng.choice(len(vectors), nlist, replace=False)], dtype=np.float32)
+    for _ in range(iterations):
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Empty clusters keep their previous centroid
+        centroids = np.where(norms > 0, sums / np.where(norms == 0, 1.0, norms), centroids)
+    return centroids.astype(np.float32)
+
+
+class IVFIndex:
+    """
+    IVF index over the first ``size`` rows of a vector matrix.
+    IVF 倒排索引
+    """
+
+    def __init__(self, centroids: np.ndarray, offsets: np.ndarray, rows: np.ndarray):
+        """
+        Initialize from built arrays (use ``build`` or ``load``).
+
+        Args:
+            centroids: (nlist, dim) unit-norm centroids
+            offsets: (nlist + 1,) start offset of each list in ``rows``
+            rows: Row ids grouped by list
+        """
+        self.centroids = centroids
+        self.offsets = offsets
+        self.rows = rows
+
+    @property
+    def size(self) -> int:
+        """Number of indexed rows."""
+        return len(self.rows)
+
+    @property
+    def nlist(self) -> int:
+        """Number of inverted lists."""
+        return len(self.centroids)
+
+    @classmethod
+    def build(
+        cls, vectors: np.ndarray, nlist: int, iterations: int = 10, seed: int = 0
+    ) -> "IVFIndex":
+        """
+        Cluster the vectors and build the inverted lists.
+
+        Args:
+            vectors: (n, dim) unit-norm matrix (may be a memmap)
+            nlist: Number of inverted lists
+            iterations: k-means iterations
+            seed: Random seed
+
+        Returns:
+            IVFIndex
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if len(vectors) == 0:
+            dim = vectors.shape[1] if vectors.ndim == 2 else 0
+            return cls(
+                np.empty((0, dim), dtype=np.float32),
+                np.zeros(1, dtype=np.int64),
+                np.empty(0, dtype=np.int64),
+            )
+        centroids = spherical_kmeans(vectors, nlist, iterations=iterations, seed=seed)
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        rows = np.argsort(assign, kind="stable").astype(np.int64)
+        counts = np.bincount(assign, minlength=len(centroids))
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        return cls(centroids, offsets, rows)
+
+    def search(
+        self, vectors: np.ndarray, query: np.ndarray, k: int = 10, nprobe: int = 8
+    ) -> list[tuple[int, float]]:
+        """
+        Approximate cosine search.
+
+        Args:
+            vectors: The matrix the index was built on (rows beyond ``size``
+                are ignored)
+            query: (dim,) unit-norm vector
+            k: Number of results
+            nprobe: Number of closest lists to scan
+
+        Returns:
+            (row, similarity) pairs, most similar first
+        """
+        if self.size == 0:
+            return []
+        nprobe = min(nprobe, self.nlist)
+        probe = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        candidates = np.concatenate(
+            [self.rows[self.offsets[i] : self.offsets[i + 1]] for i in probe]
+        )
+        if len(candidates) == 0:
+            return []
+        candidates.sort()
+        hits = exact_search(vectors[candidates], query, k)
+        return [(int(candidates[row]), score) for row, score in hits]
+
+    def save(self, path: Path) -> None:
+        """Persist the index as an ``.npz`` archive."""
+        tmp = Path(path).with_suffix(".tmp.npz")
+        np.savez(tmp, centroids=self.centroids, offsets=self.offsets, rows=self.rows)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "IVFIndex":
+        """
+        Load an index saved with ``save``.
+
+        Raises:
+            DataLoadError: If the file is missing or malformed
+        """
+        try:
+            with np.load(path) as data:
+                return cls(data["centroids"], data["offsets"], data["rows"])
+        except (OSError, KeyError, ValueError) as e:
+            raise DataLoadError(f"Failed to load IVF index: {e}", str(path)) from e
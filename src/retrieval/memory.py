@@ -0,0 +1,115 @@
+"""
+Similar-past-evaluation lookup over embedded research directions.
+相似历史评估检索
+"""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from src.evaluation.schema import EvaluationResult
+from src.retrieval.embedder import BaseEmbedder, HashingEmbedder
+from src.retrieval.store import EmbeddingStore
+
+
+class SimilarEvaluation(BaseModel):
+    """
+    A past evaluation close to a queried direction.
+    相似的历史评估
+    """
+
+    similarity: float = Field(..., description="Cosine similarity to the query")
+    result: EvaluationResult = Field(..., description="Stored evaluation result")
+    compute_budget: str | None = Field(
+        default=None, description="Compute budget the result was scored under"
+    )
+
+
+class EvaluationMemory:
+    """
+    Persistent store of evaluation results searchable by direction.
+    可按研究方向语义检索的评估结果库
+
+    Pass it to ``EvaluationEngine(memory=...)`` so a direction already
+    evaluated under the same compute budget reuses the prior result instead
+    of spending another round of LLM calls.
+
+    With the default ``HashingEmbedder`` and the engine's default
+    ``reuse_threshold`` of 0.95, only variants differing in case, whitespace
+    or surrounding punctuation are reused ("Video Generation" /
+    "video  generation"). Hyphenation (0.68 for "Multimodal Alignment" /
+    "multi-modal alignment") and acronyms (0.29 for "RAG" /
+    "Retrieval-Augmented Generation") fall well below it.
+    """
+
+    def __init__(self, root: Path, embedder: BaseEmbedder | None = None):
+        """
+        Open or create the memory.
+
+        Args:
+            root: Store directory
+            embedder: Direction embedder (default: local HashingEmbedder)
+        """
+        self.embedder = embedder or HashingEmbedder()
+        self.store = EmbeddingStore(root, dim=self.embedder.dim, model=self.embedder.model)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def add(self, result: EvaluationResult, compute_budget: str | None = None) -> None:
+        """
+        Store an evaluation result.
+
+        Args:
+            result: Result to remember
+            compute_budget: Compute budget the result was scored under
+        """
+        vector = self.embedder.embed([result.direction])
+        payload = {"compute_budget": compute_budget, "result": result.model_dump(mode="json")}
+        self.store.add([result.direction], vector, [payload])
+
+    def find_similar(
+        self,
+        direction: str,
+        k: int = 5,
+        min_similarity: float = 0.0,
+        compute_budget: str | None = None,
+    ) -> list[SimilarEvaluation]:
+        """
+        Find past evaluations of directions similar to ``direction``.
+
+        Only results scored under the same compute budget are returned, since
+        F1 (and with it F_min, the fuse and the decision) depends on it.
+
+        Args:
+            direction: Research direction
+            k: Maximum number of results
+            min_similarity: Drop results below this cosine similarity
+            compute_budget: Compute budget the results must have been scored under
+
+        Returns:
+            SimilarEvaluation list, most similar first
+        """
+        query = self.embedder.embed_one(direction)
+        fetch = max(1, k)
+        while True:
+            hits = self.store.search(query, k=fetch)
+            matches = [
+                (row, score)
+                for row, score in hits
+                if score >= min_similarity
+                and self.store.payloads[row].get("compute_budget") == compute_budget
+            ]
+            # Widen the search while other budgets crowd out matches above the threshold
+            exhausted = len(hits) < fetch or (hits and hits[-1][1] < min_similarity)
+            if len(matches) >= k or exhausted:
+                break
+            fetch *= 4
+        return [
+            SimilarEvaluation(
+                similarity=score,
+                result=EvaluationResult.model_validate(self.store.payloads[row]["result"]),
+                compute_budget=compute_budget,
+            )
+            for row, score in matches[:k]
+        ]
@@ -0,0 +1,108 @@
+"""
+Semantic paper retrieval for evaluation evidence.
+面向评估证据的论文语义检索
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from src.data.schema import Paper
+from src.retrieval.embedder import BaseEmbedder, HashingEmbedder
+from src.retrieval.store import EmbeddingStore
+
+
+def paper_text(paper: Paper) -> str:
+    """Text embedded for a paper: title, keywords and abstract."""
+    return "\n".join(
+        part for part in (paper.title, ", ".join(paper.keywords), paper.abstract) if part
+    )
+
+
+class PaperHit(BaseModel):
+    """
+    A paper retrieved for a query.
+    检索到的论文
+    """
+
+    similarity: float = Field(..., description="Cosine similarity to the query")
+    paper: Paper = Field(..., description="Retrieved paper")
+
+
+class PaperRetriever:
+    """
+    Embed papers once into a persistent store and search them by meaning.
+    论文向量检索器
+    """
+
+    def __init__(self, root: Path, embedder: BaseEmbedder | None = None):
+        """
+        Open or create the paper store.
+
+        Args:
+            root: Store directory
+            embedder: Paper embedder (default: local HashingEmbedder)
+        """
+        self.embedder = embedder or HashingEmbedder()
+        self.store = EmbeddingStore(root, dim=self.embedder.dim, model=self.embedder.model)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def add_papers(self, papers: Iterable[Paper], batch_size: int = 1024) -> int:
+        """
+        Embed and store papers not yet in the store.
+
+        Args:
+            papers: Papers to index
+            batch_size: Papers embedded per batch
+
+        Returns:
+            Number of papers added
+        """
+        known = set(self.store.ids)
+        added = 0
+        batch: list[Paper] = []
+
+        def flush() -> None:
+            vectors = self.embedder.embed([paper_text(p) for p in batch])
+            self.store.add(
+                [p.id for p in batch], vectors, [p.model_dump(mode="json") for p in batch]
+            )
+
+        for paper in papers:
+            if paper.id in known:
+                continue
+            known.add(paper.id)
+            batch.append(paper)
+            if len(batch) >= batch_size:
+                flush()
+                added += len(batch)
+                batch = []
+        if batch:
+            flush()
+            added += len(batch)
+        return added
+
+    def build_index(self, nlist: int | None = None) -> None:
+        """Build the ANN index over the stored papers."""
+        self.store.build_index(nlist=nlist)
+
+    def search(self, query: str, k: int = 10, nprobe: int = 8) -> list[PaperHit]:
+        """
+        Find the papers most relevant to a query.
+
+        Args:
+            query: Free text (e.g., a research direction)
+            k: Number of results
+            nprobe: Inverted lists probed when an index exists
+
+        Returns:
+            PaperHit list, most similar first
+        """
+        hits = self.store.search(self.embedder.embed_one(query), k=k, nprobe=nprobe)
+        return [
+            PaperHit(similarity=score, paper=Paper.model_validate(self.store.payloads[row]))
+            for row, score in hits
+        ]
@@ -0,0 +1,204 @@
+"""
+Append-only embedding store backed by a memory-mapped float32 matrix.
+基于内存映射 float32 矩阵的向量存储
+
+Layout of a store directory::
+
+    store/
+    ├── manifest.json   # {"dim": 512, "count": 1200, "model": "hashing-512"}
+    ├── vectors.f32     # count × dim float32, row-major
+    ├── items.jsonl     # one {"id": ..., "payload": {...}} per row
+    └── ivf.npz         # optional ANN index (see src.retrieval.index)
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.retrieval.index import IVFIndex, exact_search
+from src.utils.exceptions import ConfigurationError, DataLoadError
+
+
+class EmbeddingStore:
+    """
+    Persistent vector store with exact and IVF approximate search.
+    持久化向量存储（精确检索与 IVF 近似检索）
+
+    Vectors are read through ``np.memmap``, so opening a store with millions
+    of rows costs no RAM up front. Rows appended after the ANN index was
+    built are searched exactly and merged with the index results.
+    """
+
+    def __init__(self, root: Path, dim: int, model: str = ""):
+        """
+        Open or create a store.
+
+        Args:
+            root: Store directory
+            dim: Embedding dimension
+            model: Embedding model name (must match an existing store)
+
+        Raises:
+            ConfigurationError: If the existing store has another dim/model
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._vectors: np.ndarray | None = None
+        self.index: IVFIndex | None = None
+
+        manifest = self._read_manifest()
+        if manifest is None:
+            self.dim, self.model, self.count = dim, model, 0
+            self._write_manifest()
+        else:
+            if manifest["dim"] != dim or (model and manifest.get("model") not in ("", model)):
+                raise ConfigurationError(
+                    f"Embedding store {self.root} holds {manifest.get('model')} "
+                    f"(dim {manifest['dim']}), not {model} (dim {dim})"
+                )
+            self.dim, self.model, self.count = dim, manifest.get("model", model), manifest["count"]
+
+        self.ids: list[str] = []
+        self.payloads: list[dict[str, Any]] = []
+        items_path = self.root / "items.jsonl"
+        if items_path.exists():
+            with open(items_path, encoding="utf-8") as f:
+                for line in f:
+                    item = json.loads(line)
+                    self.ids.append(item["id"])
+                    self.payloads.append(item.get("payload", {}))
+        if len(self.ids) != self.count:
+            raise DataLoadError(
+                f"Embedding store is inconsistent: {len(self.ids)} items, {self.count} vectors",
+                str(self.root),
+            )
+
+        index_path = self.root / "ivf.npz"
+        if index_path.exists():
+            self.index = IVFIndex.load(index_path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        path = self.root / "manifest.json"
+        if not path.exists():
+            return None
+        manifest: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        return manifest
+
+    def _write_manifest(self) -> None:
+        tmp = self.root / "manifest.json.tmp"
+        tmp.write_text(
+            json.dumps({"dim": self.dim, "count": self.count, "model": self.model}),
+            encoding="utf-8",
+        )
+        tmp.replace(self.root / "manifest.json")
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Read-only (count, dim) memory-mapped matrix."""
+        with self._lock:
+            if self._vectors is None or len(self._vectors) != self.count:
+                if self.count == 0:
+                    self._vectors = np.empty((0, self.dim), dtype=np.float32)
+                else:
+                    self._vectors = np.memmap(
+                        self.root / "vectors.f32",
+                        dtype=np.float32,
+                        mode="r",
+                        shape=(self.count, self.dim),
+                    )
+            return self._vectors
+
+    def add(
+        self,
+        ids: list[str],
+        vectors: np.ndarray,
+        payloads: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Append rows to the store.
+
+        Args:
+            ids: Row identifiers
+            vectors: (len(ids), dim) unit-norm vectors
+            payloads: Optional JSON-serializable metadata per row
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        payloads = payloads or [{} for _ in ids]
+        if not (len(ids) == len(vectors) == len(payloads)):
+            raise ConfigurationError("ids, vectors and payloads must have the same length")
+        if not ids:
+            return
+
+        with self._lock:
+            with open(self.root / "vectors.f32", "ab") as f:
+                f.write(vectors.tobytes())
+            with open(self.root / "items.jsonl", "a", encoding="utf-8") as f:
+                for item_id, payload in zip(ids, payloads, strict=True):
+                    f.write(json.dumps({"id": item_id, "payload": payload}, ensure_ascii=False))
+                    f.write("\n")
+            self.ids.extend(ids)
+            self.payloads.extend(payloads)
+            self.count += len(ids)
+            self._vectors = None
+            self._write_manifest()
+
+    def build_index(self, nlist: int | None = None, seed: int = 0) -> IVFIndex:
+        """
+        Build (or rebuild) the IVF index over all rows and persist it.
+
+        Args:
+            nlist: Number of inverted lists (default: ~sqrt(count))
+            seed: Random seed for k-means
+
+        Returns:
+            The built index
+        """
+        with self._lock:
+            nlist = nlist or max(1, int(np.sqrt(self.count)))
+            self.index = IVFIndex.build(self.vectors, nlist=nlist, seed=seed)
+            self.index.save(self.root / "ivf.npz")
+            return self.index
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        nprobe: int = 8,
+    ) -> list[tuple[int, float]]:
+        """
+        Find the rows most similar (cosine) to a query vector.
+
+        Uses the IVF index when present and exact search for rows added
+        after it was built (or for everything when no index exists).
+
+        Args:
+            query: (dim,) unit-norm query vector
+            k: Number of results
+            nprobe: Inverted lists probed by the IVF index
+
+        Returns:
+            (row, similarity) pairs, most similar first
+        """
+        vectors = self.vectors
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        if self.count == 0:
+            return []
+
+        index = self.index
+        covered = index.size if index is not None and index.size <= self.count else 0
+        hits: list[tuple[int, float]] = []
+        if index is not None and covered:
+            hits.extend(index.search(vectors, query, k=k, nprobe=nprobe))
+        if covered < self.count:
+            tail = exact_search(vectors[covered:], query, k=k)
+            hits.extend((row + covered, score) for row, score in tail)
+
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return hits[:k]
@@ -6,15 +6,21 @@ Utility functions and common tools.
 from src.utils.exceptions import (
     ConfigurationError,
     DataLoadError,
+    EnrichmentAPIError,
     EvaluatorException,
     FuseTriggerError,
     LLMAPIError,
+    LLMResponseParseError,
+    RemoteAPIError,
 )
 
 __all__ = [
     "EvaluatorException",
     "DataLoadError",
+    "RemoteAPIError",
     "LLMAPIError",
+    "LLMResponseParseError",
     "ConfigurationError",
     "FuseTriggerError",
+    "EnrichmentAPIError",
 ]
@@ -18,13 +18,55 @@ class DataLoadError(EvaluatorException):
         super().__init__(f"Data load error: {message}" + (f" (path: {path})" if path else ""))
 
 
-class LLMAPIError(EvaluatorException):
+class RemoteAPIError(EvaluatorException):
+    """Base class for failed calls to a remote HTTP API (carries retry hints)."""
+
+    def __init__(
+        self,
+        source: str,
+        message: str,
+        retry_after: float | None = None,
+        status_code: int | None = None,
+    ):
+        self.retry_after = retry_after
+        self.status_code = status_code
+        super().__init__(f"[{source}] {message}")
+
+
+class LLMAPIError(RemoteAPIError):
     """Raised when LLM API call fails."""
 
-    def __init__(self, provider: str, message: str, retry_after: int | None = None):
+    def __init__(
+        self,
+        provider: str,
+        message: str,
+        retry_after: float | None = None,
+        status_code: int | None = None,
+    ):
         self.provider = provider
-        self.retry_after = retry_after
-        super().__init__(f"[{provider}] {message}")
+        super().__init__(provider, message, retry_after, status_code)
+
+
+class LLMResponseParseError(EvaluatorException):
+    """Raised when an LLM response cannot be parsed into the expected structure."""
+
+    def __init__(self, message: str, content: str | None = None):
+        self.content = content
+        super().__init__(f"LLM response parse error: {message}")
+
+
+class EnrichmentAPIError(RemoteAPIError):
+    """Raised when a metadata enrichment API (e.g. Semantic Scholar) call fails."""
+
+    def __init__(
+        self,
+        service: str,
+        message: str,
+        retry_after: float | None = None,
+        status_code: int | None = None,
+    ):
+        self.service = service
+        super().__init__(service, message, retry_after, status_code)
 
 
 class ConfigurationError(EvaluatorException):
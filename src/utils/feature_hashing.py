@@ -0,0 +1,71 @@
+"""
+Deterministic text vectors from signed feature hashing.
+基于特征哈希的确定性文本向量
+
+Shared by the local retrieval embedder and the fake LLM server's
+``/embeddings`` endpoint, so neither package imports the other.
+"""
+
+import re
+import zlib
+from collections.abc import Sequence
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"\w+")
+_HYPHEN_RE = re.compile(r"(?<=\w)-(?=\w)")
+_MAX_ACRONYM_TOKENS = 6
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def hashing_features(text: str) -> list[tuple[str, float]]:
+    """
+    Weighted features of a text.
+
+    Word unigrams, de-hyphenated unigrams, the acronym of short phrases,
+    word bigrams and character trigrams.
+
+    Args:
+        text: Input text
+
+    Returns:
+        (feature, weight) pairs
+    """
+    text = text.lower()
+    tokens = _TOKEN_RE.findall(text)
+    features = [(tok, 1.0) for tok in tokens]
+    # "multi-modal" also contributes "multimodal"
+    features += [(tok, 1.0) for tok in _TOKEN_RE.findall(_HYPHEN_RE.sub("", text))]
+    # Short phrases also contribute their acronym ("retrieval augmented generation" -> "rag")
+    if 2 <= len(tokens) <= _MAX_ACRONYM_TOKENS:
+        features.append(("".join(tok[0] for tok in tokens), 1.0))
+    features += [(f"{a}_{b}", 0.7) for a, b in zip(tokens, tokens[1:], strict=False)]
+    for tok in tokens:
+        padded = f"#{tok}#"
+        features += [(f"3:{padded[i:i + 3]}", 0.3) for i in range(len(padded) - 2)]
+    return features
+
+
+def hash_vectors(texts: Sequence[str], dim: int) -> np.ndarray:
+    """
+    Embed texts by signed feature hashing.
+
+    Args:
+        texts: Input texts
+        dim: Vector dimension
+
+    Returns:
+        (len(texts), dim) float32 array with unit-norm rows (zero for empty texts)
+    """
+    out = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for feature, weight in hashing_features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if (h >> 31) & 1 else -1.0
+            out[row, h % dim] += sign * weight
+    return normalize_rows(out).astype(np.float32)
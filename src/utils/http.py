@@ -0,0 +1,251 @@
+"""
+HTTP plumbing shared by the API clients and the local fake servers.
+API 客户端与本地模拟服务共用的 HTTP 组件
+
+Retry policy (retryable status codes, Retry-After parsing and waiting) for
+the LLM and Semantic Scholar clients, plus the token bucket, JSON handler
+and server lifecycle reused by ``FakeLLMServer`` and
+``FakeSemanticScholarServer``.
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, Field
+from tenacity.wait import wait_base
+
+from src.utils.exceptions import RemoteAPIError
+
+# HTTP status codes worth retrying (rate limit, overload, transient server errors)
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504, 529})
+
+StatsT = TypeVar("StatsT", bound=BaseModel)
+ServerT = TypeVar("ServerT", bound="FakeHTTPServer[Any]")
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """
+    Extract the retry delay (seconds) from response headers.
+
+    Prefers the millisecond-precision ``retry-after-ms`` header (sent by
+    OpenAI-compatible servers) over the standard ``retry-after``.
+    """
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value) * scale)
+        except ValueError:
+            continue
+    return None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return True if the error is transient and the call may be retried."""
+    if not isinstance(exc, RemoteAPIError):
+        return False
+    # status_code None means a transport-level failure (timeout, connection reset);
+    # malformed 200 responses carry status 200 and are not retried
+    return exc.status_code is None or exc.status_code in RETRYABLE_STATUS_CODES
+
+
+class wait_retry_after(wait_base):  # noqa: N801 - named like tenacity's wait strategies
+    """
+    Wait at least the server's Retry-After hint, backing off with ``fallback``.
+
+    The hint is only a lower bound: the wait is ``max(hint, fallback)``, so
+    with a jittered, growing fallback (``wait_random_exponential``) clients
+    throttled together do not all wake at the instant the token frees up
+    and burn their retries racing for it.
+    """
+
+    def __init__(self, fallback: wait_base, max_wait: float):
+        """
+        Initialize the wait strategy.
+
+        Args:
+            fallback: Backoff applied on every retry, hint or not
+            max_wait: Upper bound on any wait, so a huge hint cannot block for hours
+        """
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: Any) -> float:
+        wait = float(self.fallback(retry_state))
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, RemoteAPIError) and exc.retry_after is not None:
+            wait = max(wait, float(exc.retry_after))
+        return min(wait, self.max_wait)
+
+
+class TokenBucket:
+    """Thread-safe token bucket returning the wait time when empty."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token; return 0 on success, else seconds until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+class FakeServerConfig(BaseModel):
+    """
+    Fault injection common to the fake servers.
+    模拟服务通用故障注入配置
+    """
+
+    rate_limit_rps: float | None = Field(
+        default=None, gt=0, description="Sustained requests/second before returning 429"
+    )
+    rate_limit_burst: int = Field(default=10, ge=1, description="Token bucket capacity")
+    error_rate: float = Field(default=0.0, ge=0, le=1, description="Fraction of error responses")
+    seed: int = Field(default=0, description="Seed for latency and error sampling")
+
+
+class JSONRequestHandler(BaseHTTPRequestHandler):
+    """Keep-alive request handler replying with JSON bodies."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def _reply(self, status: int, body: Any, headers: Mapping[str, str] | None = None) -> None:
+        raw = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+
+class FakeHTTPServer(ABC, Generic[StatsT]):
+    """
+    Threaded local HTTP server with rate limiting, error injection and counters.
+    本地多线程模拟服务基类
+
+    Subclasses implement ``_make_handler``, usually a ``JSONRequestHandler``
+    subclass closing over the server.
+    """
+
+    def __init__(
+        self, config: FakeServerConfig, stats: StatsT, host: str = "127.0.0.1", port: int = 0
+    ):
+        """
+        Initialize the server (not started).
+
+        Args:
+            config: Fault injection settings
+            stats: Zeroed request counters
+            host: Bind address
+            port: Bind port (0 picks a free port)
+        """
+        self.config = config
+        self.host = host
+        self._rng = random.Random(config.seed)
+        self._rng_lock = threading.Lock()
+        self._bucket = (
+            TokenBucket(config.rate_limit_rps, config.rate_limit_burst)
+            if config.rate_limit_rps
+            else None
+        )
+        self._stats = stats
+        self._stats_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @abstractmethod
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        """Return the request handler class bound to this server."""
+
+    @property
+    def base_url(self) -> str:
+        """Root URL, e.g. http://127.0.0.1:54321."""
+        return f"http://{self.host}:{self._httpd.server_port}"
+
+    def start(self: ServerT) -> ServerT:
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self: ServerT) -> ServerT:
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def stats(self) -> StatsT:
+        """Return a snapshot of the request counters."""
+        with self._stats_lock:
+            return self._stats.model_copy()
+
+    def reset_stats(self) -> None:
+        """Zero the request counters."""
+        with self._stats_lock:
+            self._stats = type(self._stats)()
+
+    def _count(self, **increments: int) -> None:
+        with self._stats_lock:
+            for name, value in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + value)
+
+    def _rate_limit_wait(self) -> float:
+        """Seconds the client must wait before retrying (0 when admitted)."""
+        return self._bucket.try_acquire() if self._bucket is not None else 0.0
+
+    @staticmethod
+    def _retry_after_headers(wait: float) -> dict[str, str]:
+        return {
+            "retry-after": str(math.ceil(wait)),
+            "retry-after-ms": str(math.ceil(wait * 1000)),
+        }
+
+    def _should_fail(self) -> bool:
+        if not self.config.error_rate:
+            return False
+        with self._rng_lock:
+            return self._rng.random() < self.config.error_rate
@@ -3,8 +3,14 @@ Pytest configuration and fixtures.
 pytest 配置与共享 fixtures
 """
 
-import pytest
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.evaluation.schema import INDICATORS, EvaluationResult, IndicatorScores
+from src.llm.fake_server import FakeLLMConfig, FakeLLMServer
 
 
 @pytest.fixture
@@ -23,3 +29,28 @@ def test_data_dir(project_root: Path) -> Path:
 def sample_papers_csv(test_data_dir: Path) -> Path:
     """Return path to sample papers CSV for testing."""
     return test_data_dir / "sample_papers.csv"
+
+
+@pytest.fixture
+def fake_llm_server() -> Iterator[FakeLLMServer]:
+    """Start a zero-latency fake LLM server for the duration of a test."""
+    with FakeLLMServer(FakeLLMConfig()) as server:
+        yield server
+
+
+@pytest.fixture
+def make_result() -> Callable[..., EvaluationResult]:
+    """
+    Factory building an EvaluationResult with uniform indicator scores.
+
+    ``make_result("RAG", 7.0, f1=2.0, risks=[...])`` scores every indicator 7
+    except F1; ``reasons`` / ``risks`` are passed through to the result.
+    """
+
+    def factory(direction: str = "RAG", score: float = 6.0, **overrides: Any) -> EvaluationResult:
+        extra = {key: overrides.pop(key) for key in ("reasons", "risks") if key in overrides}
+        scores = dict.fromkeys(INDICATORS, score)
+        scores.update(overrides)
+        return EvaluationResult(direction=direction, scores=IndicatorScores(**scores), **extra)
+
+    return factory
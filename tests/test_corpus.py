@@ -0,0 +1,153 @@
+"""
+Tests for the bitmap-indexed corpus and composable queries.
+位图索引语料库与组合查询测试
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.data.corpus import (
+    Corpus,
+    all_papers,
+    bitmap_to_rows,
+    conference,
+    keyword,
+    presentation,
+    rows_to_bitmap,
+    term,
+    year,
+    year_range,
+)
+from src.data.loader import PapersLoader
+from src.data.matcher import TermMatcher
+from src.data.schema import ConferenceData, Paper
+from src.utils.exceptions import ConfigurationError, DataLoadError
+
+
+def _paper(pid: str, year: int, ptype: str | None, keywords: list[str], title: str = "") -> Paper:
+    return Paper(id=pid, title=title or pid, keywords=keywords, year=year, presentation_type=ptype)
+
+
+@pytest.fixture
+def corpus() -> Corpus:
+    """Small two-conference corpus."""
+    return Corpus.from_conferences(
+        {
+            "ICLR": ConferenceData(
+                name="ICLR",
+                year=2024,
+                papers=[
+                    _paper("i1", 2023, "Oral", ["Diffusion Models"]),
+                    _paper("i2", 2024, "Poster", ["Diffusion Models", "Video Generation"]),
+                    _paper("i3", 2025, "Oral", ["diffusion models", "RLHF"]),
+                ],
+            ),
+            "NeurIPS": ConferenceData(
+                name="NeurIPS",
+                year=2024,
+                papers=[
+                    _paper("n1", 2022, "Oral", ["Diffusion Models"]),
+                    _paper("n2", 2024, "Oral", ["Diffusion Models", "Video Generation"]),
+                    _paper("n3", 2024, None, [], title="Video generation benchmark"),
+                ],
+            ),
+        }
+    )
+
+
+class TestBitmaps:
+    """Test bitmap helpers."""
+
+    def test_roundtrip(self) -> None:
+        """Test rows survive a bitmap roundtrip."""
+        rows = np.array([0, 3, 64, 99])
+        bitmap = rows_to_bitmap(rows, 100)
+        assert bitmap.bit_count() == 4
+        np.testing.assert_array_equal(bitmap_to_rows(bitmap, 100), rows)
+        assert len(bitmap_to_rows(0, 100)) == 0
+
+
+class TestCorpusQueries:
+    """Test facet queries and boolean composition."""
+
+    def test_single_facets(self, corpus: Corpus) -> None:
+        """Test each facet, case-insensitively."""
+        assert len(corpus) == 6
+        assert corpus.ids(conference("iclr")) == ["i1", "i2", "i3"]
+        assert corpus.count(year(2024)) == 3
+        assert corpus.count(presentation("oral")) == 4
+        assert corpus.count(keyword("DIFFUSION MODELS")) == 5
+        assert corpus.count(keyword("unknown")) == 0
+
+    def test_composed_query(self, corpus: Corpus) -> None:
+        """Test AND / OR / NOT over several facets."""
+        query = (
+            conference("ICLR", "NeurIPS")
+            & year_range(2023, 2025)
+            & presentation("Oral")
+            & keyword("Diffusion Models")
+            & ~keyword("Video Generation")
+        )
+        assert corpus.ids(query) == ["i1", "i3"]
+        assert corpus.ids(year(2022) | keyword("RLHF")) == ["i3", "n1"]
+        assert corpus.count(~all_papers()) == 0
+        assert corpus.count(~presentation("Oral", "Poster")) == 1
+
+    def test_materialization(self, corpus: Corpus) -> None:
+        """Test Paper objects and rows are built only for matches."""
+        papers = corpus.papers(conference("NeurIPS") & year(2024))
+        assert [p.id for p in papers] == ["n2", "n3"]
+        assert papers[0].keywords == ["Diffusion Models", "Video Generation"]
+        assert corpus.paper(0).id == "i1"
+        assert list(corpus.select(keyword("rlhf"))["conference"]) == ["ICLR"]
+
+    def test_facet_counts(self, corpus: Corpus) -> None:
+        """Test per-value counts with and without a restriction."""
+        assert corpus.facet_counts("year") == {2022: 1, 2023: 1, 2024: 3, 2025: 1}
+        assert corpus.facet_counts("conference", where=presentation("Oral")) == {
+            "ICLR": 2,
+            "NEURIPS": 2,
+        }
+        counts = corpus.facet_counts("keyword", where=conference("ICLR"))
+        assert counts["diffusion models"] == 3 and counts["rlhf"] == 1
+
+    def test_term_facet(self, corpus: Corpus) -> None:
+        """Test terms matched over titles and keywords become a facet."""
+        with pytest.raises(ConfigurationError):
+            corpus.count(term("video generation"))
+        corpus.index_terms(TermMatcher(["video generation", "rlhf"]))
+        assert corpus.ids(term("Video Generation")) == ["i2", "n2", "n3"]
+        assert corpus.ids(term("rlhf") | term("video generation") & conference("ICLR")) == [
+            "i2",
+            "i3",
+        ]
+
+    def test_unknown_facet(self, corpus: Corpus) -> None:
+        """Test unknown facet names are rejected."""
+        with pytest.raises(ConfigurationError):
+            corpus.facet_values("venue")
+
+
+class TestCorpusLoading:
+    """Test building corpora from CSV files."""
+
+    def test_from_csv_matches_loader(self, sample_papers_csv: Path) -> None:
+        """Test column-wise cleaning yields the same papers as PapersLoader."""
+        corpus = Corpus.from_csv_files({"iclr": sample_papers_csv})
+        expected = PapersLoader().load_csv(sample_papers_csv)
+        assert corpus.papers(all_papers()) == expected
+        assert corpus.facet_values("conference") == ["ICLR"]
+
+    def test_load_from_data_root(self, sample_papers_csv: Path, tmp_path: Path) -> None:
+        """Test Corpus.load discovers conference directories."""
+        (tmp_path / "ICML").mkdir()
+        (tmp_path / "ICML" / "icml_papers.csv").write_bytes(sample_papers_csv.read_bytes())
+        corpus = Corpus.load(str(tmp_path))
+        assert corpus.count(conference("icml")) == len(corpus) > 0
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing CSV raises DataLoadError."""
+        with pytest.raises(DataLoadError):
+            Corpus.from_csv_files({"ICLR": tmp_path / "missing.csv"})
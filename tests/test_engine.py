@@ -0,0 +1,228 @@
+"""
+Tests for the evaluation engine and load generator.
+评估引擎与压测工具测试
+"""
+
+import argparse
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts.evaluate import run_batch
+from src.evaluation.engine import EvaluationEngine, indicator_groups
+from src.evaluation.loadgen import (
+    compare_batch_modes,
+    percentile,
+    run_load_test,
+    score_agreement,
+    synthetic_directions,
+)
+from src.evaluation.parsing import (
+    batch_json_schema,
+    extract_json_object,
+    parse_assessment,
+    parse_batch_assessments,
+)
+from src.evaluation.schema import INDICATORS, EvaluationResult
+from src.llm.clients import OpenAICompatibleClient
+from src.llm.fake_server import FakeLLMConfig, FakeLLMServer, fake_score
+from src.utils.exceptions import ConfigurationError, LLMAPIError, LLMResponseParseError
+
+
+class FlakyEngine(EvaluationEngine):
+    """Engine whose LLM fails for directions containing 'broken'."""
+
+    def assess_group(self, direction: str, indicators: Sequence[str]) -> dict[str, Any]:
+        if "broken" in direction:
+            raise LLMAPIError("fake", "HTTP 503: Overloaded", status_code=503)
+        return super().assess_group(direction, indicators)
+
+
+class TestParsing:
+    """Test structured output parsing."""
+
+    def test_extract_json_from_code_fence(self) -> None:
+        """Test JSON is extracted from fenced output."""
+        assert extract_json_object('```json\n{"score": 7}\n```') == {"score": 7}
+
+    def test_parse_assessment_out_of_range(self) -> None:
+        """Test out-of-range score raises LLMResponseParseError."""
+        with pytest.raises(LLMResponseParseError):
+            parse_assessment('{"score": 42, "reason": "x"}')
+
+    def test_parse_assessment_no_json(self) -> None:
+        """Test non-JSON output raises LLMResponseParseError."""
+        with pytest.raises(LLMResponseParseError):
+            parse_assessment("I think it deserves a 7.")
+
+    def test_batch_json_schema_is_strict(self) -> None:
+        """Test the batch schema requires every field and forbids extras."""
+        schema = batch_json_schema(["p1", "p2"])
+        assert schema["required"] == ["p1", "p2"]
+        assert schema["additionalProperties"] is False
+        item = schema["properties"]["p1"]
+        assert item["required"] == ["score", "reason"]
+        assert item["additionalProperties"] is False
+
+    def test_parse_batch_isolates_invalid_fields(self) -> None:
+        """Test one bad field does not invalidate the others."""
+        content = '{"f1": {"score": 7, "reason": "ok"}, "f2": {"score": 0, "reason": "bad"}}'
+        valid, failed = parse_batch_assessments(content, ["f1", "f2", "f3"])
+        assert valid["f1"].score == 7
+        assert failed == ["f2", "f3"]
+
+    def test_parse_batch_unparseable(self) -> None:
+        """Test a non-JSON batch reply marks every field as failed."""
+        assert parse_batch_assessments("sorry", ["c1", "c2"]) == ({}, ["c1", "c2"])
+
+
+class TestEvaluationEngine:
+    """Test EvaluationEngine against the fake LLM server."""
+
+    def test_evaluate_scores_all_indicators(self, fake_llm_server: FakeLLMServer) -> None:
+        """Test one call per indicator with deterministic scores."""
+        with OpenAICompatibleClient(api_key="x", base_url=fake_llm_server.openai_base_url) as llm:
+            result = EvaluationEngine(llm=llm).evaluate("Video Generation")
+        for key in INDICATORS:
+            assert getattr(result.scores, key) == fake_score("Video Generation", key)
+        assert set(result.reasons) == set(INDICATORS)
+        assert fake_llm_server.stats().completed == len(INDICATORS)
+
+    def test_evaluate_batch_streams_all(self, fake_llm_server: FakeLLMServer) -> None:
+        """Test batch evaluation yields one result per direction."""
+        directions = synthetic_directions(12, seed=1)
+        with OpenAICompatibleClient(api_key="x", base_url=fake_llm_server.openai_base_url) as llm:
+            results = list(
+                EvaluationEngine(llm=llm).evaluate_batch(iter(directions), max_workers=4)
+            )
+        assert sorted(r.direction for r in results) == sorted(directions)
+
+    def test_evaluate_batch_skips_failed_directions(
+        self, fake_llm_server: FakeLLMServer, tmp_path: Path
+    ) -> None:
+        """Test a failing direction is recorded and the batch report still covers the rest."""
+        directions_file = tmp_path / "directions.txt"
+        directions_file.write_text("RAG\nbroken direction\nVideo Generation\n", encoding="utf-8")
+        args = argparse.Namespace(
+            directions_file=str(directions_file),
+            output=str(tmp_path / "out"),
+            language="en",
+            formats="md",
+            workers=2,
+        )
+        with OpenAICompatibleClient(api_key="x", base_url=fake_llm_server.openai_base_url) as llm:
+            engine = FlakyEngine(llm=llm)
+            exit_code = run_batch(args, engine)
+        assert exit_code == 1
+        assert engine.usage.failed_directions == 1
+        assert list(engine.failures) == ["broken direction"]
+        assert (tmp_path / "out" / "index.md").exists()
+        assert (tmp_path / "out" / "indicator_matrix.npz").exists()
+        assert sorted(p.name for p in (tmp_path / "out" / "directions").iterdir()) == [
+            "rag.md",
+            "video-generation.md",
+        ]
+
+    def test_indicator_groups(self) -> None:
+        """Test batch modes cover all indicators with the expected call counts."""
+        for mode, calls in (("none", 8), ("dimension", 3), ("all", 1)):
+            groups = indicator_groups(mode)
+            assert len(groups) == calls
+            assert sorted(k for g in groups for k in g) == sorted(INDICATORS)
+        with pytest.raises(ConfigurationError):
+            indicator_groups("pairs")
+
+    @pytest.mark.parametrize("mode,calls", [("dimension", 3), ("all", 1)])
+    def test_batched_mode_matches_unbatched(
+        self, fake_llm_server: FakeLLMServer, mode: str, calls: int
+    ) -> None:
+        """Test batched modes return the same scores with fewer calls and tokens."""
+        with OpenAICompatibleClient(api_key="x", base_url=fake_llm_server.openai_base_url) as llm:
+            single = EvaluationEngine(llm=llm)
+            batched = EvaluationEngine(llm=llm, batch_mode=mode)  # type: ignore[arg-type]
+            expected = single.evaluate("RAG")
+            result = batched.evaluate("RAG")
+        assert result.scores == expected.scores
+        assert batched.usage.llm_calls == calls
+        assert batched.usage.input_tokens < single.usage.input_tokens
+
+    def test_batched_mode_falls_back_per_field(self) -> None:
+        """Test only invalid batched fields are re-asked individually."""
+        with FakeLLMServer(FakeLLMConfig(batch_field_error_rate=0.5, seed=3)) as server:
+            with OpenAICompatibleClient(api_key="x", base_url=server.openai_base_url) as llm:
+                engine = EvaluationEngine(llm=llm, batch_mode="all")
+                result = engine.evaluate("Video Generation")
+        usage = engine.usage
+        assert 0 < usage.fallback_calls < len(INDICATORS)
+        assert usage.llm_calls == 1 + usage.fallback_calls
+        for key in INDICATORS:
+            assert getattr(result.scores, key) == fake_score("Video Generation", key)
+
+
+class TestLoadGenerator:
+    """Test the load generator harness."""
+
+    def test_synthetic_directions_deterministic(self) -> None:
+        """Test the same seed yields the same directions."""
+        assert synthetic_directions(20, seed=3) == synthetic_directions(20, seed=3)
+        assert synthetic_directions(20, seed=3) != synthetic_directions(20, seed=4)
+
+    def test_percentile(self) -> None:
+        """Test linear-interpolated percentiles."""
+        assert percentile([1, 2, 3, 4], 50) == pytest.approx(2.5)
+        assert percentile([5], 99) == 5
+        assert percentile([], 50) == 0.0
+
+    def test_run_load_test_with_faults(self) -> None:
+        """Test the harness reports throughput and latency under 429s and 503s."""
+        config = FakeLLMConfig(
+            latency_distribution="exponential",
+            latency_ms=2,
+            rate_limit_rps=400,
+            rate_limit_burst=20,
+            error_rate=0.05,
+            seed=7,
+        )
+        with FakeLLMServer(config) as server:
+            with OpenAICompatibleClient(
+                api_key="x", base_url=server.openai_base_url, max_retries=8
+            ) as llm:
+                llm.backoff_max = 0.05
+                report = run_load_test(
+                    EvaluationEngine(llm=llm).evaluate, synthetic_directions(10), concurrency=4
+                )
+            stats = server.stats()
+
+        assert report.succeeded == 10
+        assert report.failed == 0
+        assert report.throughput_per_s > 0
+        assert report.latency_ms["p50"] <= report.latency_ms["p99"] <= report.latency_ms["max"]
+        assert stats.completed == 10 * len(INDICATORS)
+
+    def test_score_agreement(self, make_result: Callable[..., EvaluationResult]) -> None:
+        """Test agreement metrics between two runs."""
+        report = score_agreement(
+            [make_result("a", 5), make_result("b", 7)], [make_result("a", 5), make_result("b", 6)]
+        )
+        assert report.directions == 2
+        assert report.exact_match_rate == pytest.approx(0.5)
+        assert report.within_one_rate == 1.0
+        assert report.mean_abs_diff == pytest.approx(0.5)
+        assert report.decision_agreement_rate == pytest.approx(0.5)
+
+    def test_compare_batch_modes(self) -> None:
+        """Test the harness reports call reduction and agreement per mode."""
+        with FakeLLMServer(FakeLLMConfig(batch_score_drift=1)) as server:
+            with OpenAICompatibleClient(api_key="x", base_url=server.openai_base_url) as llm:
+                comparisons = compare_batch_modes(llm, synthetic_directions(6), concurrency=3)
+
+        baseline, dimension, combined = comparisons
+        assert baseline.agreement is None
+        assert baseline.calls_per_direction == len(INDICATORS)
+        assert dimension.calls_per_direction == 3
+        assert combined.calls_per_direction == 1
+        assert combined.input_tokens_per_direction < baseline.input_tokens_per_direction
+        assert dimension.agreement is not None
+        assert dimension.agreement.within_one_rate == 1.0
@@ -0,0 +1,198 @@
+"""
+Tests for citation enrichment against the local fake Semantic Scholar server.
+引用数据补全测试（本地模拟服务）
+"""
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.data.corpus import Corpus, year
+from src.data.schema import ConferenceData, Paper
+from src.enrichment.cache import MetadataCache
+from src.enrichment.client import AsyncRateLimiter, SemanticScholarClient, lookup_id
+from src.enrichment.enricher import CitationEnricher, PaperLookup
+from src.enrichment.fake_server import FakeS2Config, FakeSemanticScholarServer, fake_citation_count
+from src.utils.exceptions import EnrichmentAPIError
+
+
+@pytest.fixture
+def s2_server() -> Iterator[FakeSemanticScholarServer]:
+    """Start a fault-free fake Semantic Scholar server."""
+    with FakeSemanticScholarServer() as server:
+        yield server
+
+
+def _client(server: FakeSemanticScholarServer, **kwargs: float) -> SemanticScholarClient:
+    kwargs.setdefault("rate_limit_rps", 1000.0)
+    return SemanticScholarClient(
+        base_url=server.graph_base_url, rate_limit_burst=100, backoff_max=0.05, **kwargs
+    )
+
+
+class TestLookupAndCache:
+    """Test ID derivation and the TTL cache."""
+
+    def test_lookup_id(self) -> None:
+        """Test arXiv / ACL / DOI links map to Semantic Scholar IDs."""
+        assert lookup_id("https://arxiv.org/pdf/2106.09685v2") == "ARXIV:2106.09685"
+        assert lookup_id(None, "https://aclanthology.org/2023.acl-long.1.pdf") == (
+            "ACL:2023.acl-long.1"
+        )
+        assert lookup_id("https://doi.org/10.1145/123.456") == "DOI:10.1145/123.456"
+        assert lookup_id("https://openreview.net/forum?id=abc") is None
+
+    def test_cache_ttl(self, tmp_path: Path) -> None:
+        """Test entries persist across instances and expire after the TTL."""
+        cache = MetadataCache(tmp_path / "c.sqlite", ttl_s=100)
+        cache.put_many([("a", {"n": 1}), ("b", None)], now=1000.0)
+        cache.close()
+
+        reopened = MetadataCache(tmp_path / "c.sqlite", ttl_s=100)
+        assert reopened.get_many(["a", "b", "c"], now=1050.0) == {"a": {"n": 1}, "b": None}
+        assert reopened.get_many(["a"], now=1101.0) == {}
+        assert reopened.purge_expired(now=1101.0) == 2
+        assert len(reopened) == 0
+
+
+class TestSemanticScholarClient:
+    """Test the async client."""
+
+    async def test_batch_and_title_match(self, s2_server: FakeSemanticScholarServer) -> None:
+        """Test both endpoints, including not-found results."""
+        async with _client(s2_server) as client:
+            papers = await client.get_papers(["ARXIV:1", "ARXIV:missing"])
+            match = await client.match_title("Attention Is All You Need")
+            no_match = await client.match_title("a missing paper")
+        assert papers[0] is not None
+        assert papers[0]["citationCount"] == fake_citation_count("ARXIV:1")
+        assert papers[1] is None
+        assert match is not None
+        assert match["citationCount"] == fake_citation_count("Attention Is All You Need")
+        assert no_match is None
+
+    async def test_retries_rate_limited_requests(self) -> None:
+        """Test 429 responses are retried until they succeed."""
+        config = FakeS2Config(rate_limit_rps=20, rate_limit_burst=1)
+        with FakeSemanticScholarServer(config) as server:
+            async with _client(server) as client:
+                for _ in range(5):
+                    assert await client.get_papers(["ARXIV:1"])
+            assert server.stats().rate_limited > 0
+            assert server.stats().batch_requests == 5
+
+    async def test_retry_after_capped_at_backoff_max(self) -> None:
+        """Test a long Retry-After hint is capped at backoff_max instead of blocking."""
+        config = FakeS2Config(rate_limit_rps=0.01, rate_limit_burst=1)
+        with FakeSemanticScholarServer(config) as server:
+            async with _client(server, max_retries=2) as client:
+                assert await client.get_papers(["ARXIV:1"])
+                start = time.monotonic()
+                with pytest.raises(EnrichmentAPIError) as exc_info:
+                    await client.get_papers(["ARXIV:1"])
+                elapsed = time.monotonic() - start
+            assert server.stats().rate_limited == 3
+        assert exc_info.value.retry_after is not None and exc_info.value.retry_after > 60
+        assert elapsed < 5
+
+    async def test_api_key_and_fatal_errors(self) -> None:
+        """Test the API key header is sent and 403 is not retried."""
+        with FakeSemanticScholarServer(FakeS2Config(api_key="secret")) as server:
+            async with SemanticScholarClient(
+                api_key="secret", base_url=server.graph_base_url, rate_limit_rps=1000
+            ) as client:
+                assert await client.get_papers(["ARXIV:1"])
+            async with _client(server) as client:
+                with pytest.raises(EnrichmentAPIError) as exc_info:
+                    await client.get_papers(["ARXIV:1"])
+            assert exc_info.value.status_code == 403
+            assert server.stats().requests == 2
+
+    async def test_rate_limiter_paces_requests(self) -> None:
+        """Test the limiter spaces requests at the configured rate."""
+        limiter = AsyncRateLimiter(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+        assert time.monotonic() - start >= 0.09
+
+
+class TestCitationEnricher:
+    """Test batched enrichment, caching and the corpus column."""
+
+    async def test_enrich_batches_and_falls_back(
+        self, s2_server: FakeSemanticScholarServer
+    ) -> None:
+        """Test IDs go through batches, misses fall back to titles, duplicates once."""
+        lookups = [PaperLookup(s2_id=f"ARXIV:{i}", title=f"Paper {i}") for i in range(7)]
+        lookups += [
+            PaperLookup(s2_id="ARXIV:missing", title="Recovered By Title"),
+            PaperLookup(title="Title Only"),
+            PaperLookup(title="title   only"),
+            PaperLookup(title="missing everywhere"),
+        ]
+        async with _client(s2_server) as client:
+            enricher = CitationEnricher(client, batch_size=3)
+            records = await enricher.enrich(lookups)
+
+        assert [r.citation_count for r in records[:7] if r] == [
+            fake_citation_count(f"ARXIV:{i}") for i in range(7)
+        ]
+        assert records[7] is not None
+        assert records[7].citation_count == fake_citation_count("Recovered By Title")
+        assert records[8] == records[9]
+        assert records[10] is not None and not records[10].found
+        stats = enricher.stats
+        assert stats.batch_requests == 3
+        assert stats.title_requests == 3
+        assert stats.unique_keys == 10 and stats.found == 9 and stats.not_found == 1
+
+    async def test_cache_avoids_refetch(
+        self, s2_server: FakeSemanticScholarServer, tmp_path: Path
+    ) -> None:
+        """Test a second run is served entirely from the cache."""
+        lookups = [PaperLookup(s2_id="ARXIV:1"), PaperLookup(title="missing title")]
+        cache = MetadataCache(tmp_path / "c.sqlite")
+        async with _client(s2_server) as client:
+            first = await CitationEnricher(client, cache).enrich(lookups)
+            requests = s2_server.stats().requests
+            enricher = CitationEnricher(client, cache)
+            second = await enricher.enrich(lookups)
+        assert first == second
+        assert s2_server.stats().requests == requests
+        assert enricher.stats.cache_hits == 2
+
+    async def test_failures_are_not_cached(self) -> None:
+        """Test a failed batch comes back as None without per-title fallbacks."""
+        lookups = [PaperLookup(s2_id=f"ARXIV:{i}", title=f"T{i}") for i in range(5)]
+        with FakeSemanticScholarServer(FakeS2Config(error_rate=1.0)) as server:
+            async with _client(server, max_retries=1) as client:
+                enricher = CitationEnricher(client)
+                records = await enricher.enrich(lookups)
+        assert records == [None] * 5
+        assert enricher.stats.failed == 5
+        assert enricher.stats.batch_requests == 1
+        assert enricher.stats.title_requests == 0
+        assert len(enricher.cache) == 0
+
+    async def test_enrich_corpus_adds_column(self, s2_server: FakeSemanticScholarServer) -> None:
+        """Test citation counts are attached as a nullable column and reach Paper."""
+        papers = [
+            Paper(id="a", title="Alpha", pdf="https://arxiv.org/pdf/2401.00001", year=2024),
+            Paper(id="b", title="Beta", forum="https://openreview.net/forum?id=b", year=2024),
+            Paper(id="c", title="missing Gamma", year=2023),
+        ]
+        corpus = Corpus.from_conferences(
+            {"ICLR": ConferenceData(name="ICLR", year=2024, papers=papers)}
+        )
+        async with _client(s2_server) as client:
+            await CitationEnricher(client).enrich_corpus(corpus)
+
+        assert corpus.frame["citation_count"].tolist()[:2] == [
+            fake_citation_count("ARXIV:2401.00001"),
+            fake_citation_count("Beta"),
+        ]
+        assert corpus.papers(year(2023))[0].citation_count is None
+        assert corpus.paper(1).citation_count == fake_citation_count("Beta")
@@ -0,0 +1,230 @@
+"""
+Tests for LLM abstraction layer and the fake LLM server.
+LLM 抽象层与模拟服务测试
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from src.evaluation.parsing import batch_json_schema, batch_response_format
+from src.llm.clients import AnthropicCompatibleClient, OpenAICompatibleClient, anthropic_tool_for
+from src.llm.factory import LLMClientFactory
+from src.llm.fake_server import FakeLLMConfig, FakeLLMServer, fake_score
+from src.utils.exceptions import ConfigurationError, LLMAPIError
+
+PROMPT = [
+    {"role": "system", "content": "Score it."},
+    {"role": "user", "content": "Research direction: Video Generation\nIndicators: F1"},
+]
+
+
+class TestFakeLLMServer:
+    """Test FakeLLMServer protocol compatibility and fault injection."""
+
+    def test_fake_score_is_deterministic(self) -> None:
+        """Test scores depend only on direction and indicator."""
+        assert fake_score("RAG", "p1") == fake_score("rag ", "P1")
+        assert all(1 <= fake_score(f"d{i}", "c2") <= 10 for i in range(100))
+
+    def test_openai_endpoint(self, fake_llm_server: FakeLLMServer) -> None:
+        """Test OpenAI-compatible chat completions."""
+        with OpenAICompatibleClient(api_key="x", base_url=fake_llm_server.openai_base_url) as llm:
+            response = llm.chat(PROMPT)
+        assert json.loads(response.content)["score"] == fake_score("Video Generation", "f1")
+        assert response.input_tokens > 0
+        assert fake_llm_server.stats().completed == 1
+
+    def test_anthropic_endpoint(self, fake_llm_server: FakeLLMServer) -> None:
+        """Test Anthropic-compatible messages endpoint (system prompt hoisted)."""
+        with AnthropicCompatibleClient(
+            api_key="x", base_url=fake_llm_server.anthropic_base_url
+        ) as llm:
+            response = llm.chat(PROMPT)
+        assert json.loads(response.content)["score"] == fake_score("Video Generation", "f1")
+        assert response.output_tokens > 0
+
+    def test_anthropic_structured_output_forces_tool(self, fake_llm_server: FakeLLMServer) -> None:
+        """Test a JSON schema response format becomes a forced tool call."""
+        prompt = [{"role": "user", "content": "Research direction: RAG\nIndicators: P1, F1"}]
+        response_format = batch_response_format(["p1", "f1"])
+        tool = anthropic_tool_for(response_format)
+        assert tool["input_schema"] == batch_json_schema(["p1", "f1"])
+        with AnthropicCompatibleClient(
+            api_key="x", base_url=fake_llm_server.anthropic_base_url
+        ) as llm:
+            response = llm.chat(prompt, response_format=response_format)
+            with pytest.raises(ConfigurationError):
+                llm.chat(prompt, response_format={"type": "json_object"})
+        reply = json.loads(response.content)
+        assert reply["f1"]["score"] == fake_score("RAG", "f1")
+        assert set(reply) == {"p1", "f1"}
+
+    def test_anthropic_request_carries_tool_choice(self) -> None:
+        """Test the schema is sent as a forced tool and the tool input is returned."""
+        sent: list[dict[str, object]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(json.loads(request.content))
+            tool_use = {"type": "tool_use", "id": "t", "name": "pfc_p1", "input": {"p1": {}}}
+            return httpx.Response(200, json={"content": [tool_use]})
+
+        with AnthropicCompatibleClient(api_key="x") as llm:
+            llm._http = httpx.Client(base_url=llm.base_url, transport=httpx.MockTransport(handler))
+            response = llm.chat(PROMPT, response_format=batch_response_format(["p1"]))
+        assert sent[0]["tool_choice"] == {"type": "tool", "name": "pfc_p1"}
+        assert json.loads(response.content) == {"p1": {}}
+
+    def test_rate_limit_returns_retry_after_and_client_retries(self) -> None:
+        """Test 429s carry Retry-After and the client waits and retries."""
+        config = FakeLLMConfig(rate_limit_rps=20, rate_limit_burst=1)
+        with FakeLLMServer(config) as server:
+            with OpenAICompatibleClient(
+                api_key="x", base_url=server.openai_base_url, max_retries=10
+            ) as llm:
+                responses = [llm.chat(PROMPT) for _ in range(5)]
+            stats = server.stats()
+        assert stats.completed == 5
+        assert stats.rate_limited > 0
+        assert sum(r.attempts for r in responses) == stats.requests
+
+    def test_concurrent_clients_share_tight_rate_limit(self) -> None:
+        """Test jittered backoff lets clients throttled together all get through."""
+        config = FakeLLMConfig(rate_limit_rps=100, rate_limit_burst=1)
+
+        def worker(base_url: str) -> int:
+            with OpenAICompatibleClient(api_key="x", base_url=base_url) as llm:
+                return sum(llm.chat(PROMPT).attempts for _ in range(3))
+
+        with FakeLLMServer(config) as server:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                attempts = list(executor.map(worker, [server.openai_base_url] * 8))
+            stats = server.stats()
+        assert stats.completed == 24
+        assert stats.rate_limited > 0
+        assert sum(attempts) == stats.requests
+
+    def test_rate_limit_error_exposes_retry_after(self) -> None:
+        """Test LLMAPIError carries status code and retry delay when retries run out."""
+        config = FakeLLMConfig(rate_limit_rps=0.5, rate_limit_burst=1)
+        with FakeLLMServer(config) as server:
+            with OpenAICompatibleClient(
+                api_key="x", base_url=server.openai_base_url, max_retries=0
+            ) as llm:
+                llm.chat(PROMPT)
+                with pytest.raises(LLMAPIError) as exc_info:
+                    llm.chat(PROMPT)
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retry_after is not None and exc_info.value.retry_after > 0
+
+    def test_retry_after_capped_at_backoff_max(self) -> None:
+        """Test a long Retry-After hint is capped at backoff_max instead of blocking."""
+        config = FakeLLMConfig(rate_limit_rps=0.01, rate_limit_burst=1)
+        with FakeLLMServer(config) as server:
+            with OpenAICompatibleClient(
+                api_key="x", base_url=server.openai_base_url, max_retries=2
+            ) as llm:
+                llm.backoff_max = 0.05
+                llm.chat(PROMPT)
+                start = time.monotonic()
+                with pytest.raises(LLMAPIError) as exc_info:
+                    llm.chat(PROMPT)
+                elapsed = time.monotonic() - start
+        assert exc_info.value.retry_after is not None and exc_info.value.retry_after > 60
+        assert elapsed < 5
+        assert server.stats().rate_limited == 3
+
+    def test_error_rate(self) -> None:
+        """Test injected 503s are surfaced after retries are exhausted."""
+        with FakeLLMServer(FakeLLMConfig(error_rate=1.0)) as server:
+            with OpenAICompatibleClient(
+                api_key="x", base_url=server.openai_base_url, max_retries=0
+            ) as llm:
+                with pytest.raises(LLMAPIError) as exc_info:
+                    llm.chat(PROMPT)
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.parametrize("body", [b'{"unexpected": true}', b"{"])
+    def test_malformed_response_not_retried(self, body: bytes) -> None:
+        """Test a 200 with an unusable body fails at once instead of being retried."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, content=body)
+
+        with OpenAICompatibleClient(api_key="x", max_retries=3) as llm:
+            llm._http = httpx.Client(base_url=llm.base_url, transport=httpx.MockTransport(handler))
+            with pytest.raises(LLMAPIError) as exc_info:
+                llm.chat(PROMPT)
+        assert exc_info.value.status_code == 200
+        assert len(calls) == 1
+
+    def test_lognormal_latency_moments_and_cap(self) -> None:
+        """Test lognormal latency matches mean/stddev and wide jitter stays capped."""
+        config = FakeLLMConfig(
+            latency_distribution="lognormal", latency_ms=100, latency_jitter_ms=50
+        )
+        with FakeLLMServer(config) as server:
+            samples = [server._sample_latency() for _ in range(20_000)]
+        mean = sum(samples) / len(samples)
+        std = (sum((s - mean) ** 2 for s in samples) / len(samples)) ** 0.5
+        assert mean == pytest.approx(0.1, rel=0.05)
+        assert std == pytest.approx(0.05, rel=0.1)
+
+        config = FakeLLMConfig(
+            latency_distribution="lognormal",
+            latency_ms=5,
+            latency_jitter_ms=100,
+            max_latency_ms=2_000,
+        )
+        with FakeLLMServer(config) as server:
+            samples = sorted(server._sample_latency() for _ in range(20_000))
+        assert samples[-1] <= 2.0
+        assert samples[len(samples) // 2] < 0.005
+
+    def test_latency_distribution_applied(self) -> None:
+        """Test configured latency is reflected in response time."""
+        config = FakeLLMConfig(latency_distribution="uniform", latency_ms=60, latency_jitter_ms=10)
+        with FakeLLMServer(config) as server:
+            with OpenAICompatibleClient(api_key="x", base_url=server.openai_base_url) as llm:
+                response = llm.chat(PROMPT)
+        assert response.latency_s >= 0.05
+
+
+class TestLLMClientFactory:
+    """Test LLMClientFactory."""
+
+    def test_create_providers(self) -> None:
+        """Test provider names map to client classes."""
+        assert isinstance(LLMClientFactory.create("openai", api_key="x"), OpenAICompatibleClient)
+        assert isinstance(
+            LLMClientFactory.create("anthropic", api_key="x"), AnthropicCompatibleClient
+        )
+        local = LLMClientFactory.create("local")
+        assert isinstance(local, OpenAICompatibleClient)
+        assert local.base_url == "http://localhost:11434/v1"
+
+    def test_unsupported_provider(self) -> None:
+        """Test unknown provider raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            LLMClientFactory.create("unknown")
+
+    def test_create_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test environment variables select provider and endpoint."""
+        monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+        monkeypatch.setenv("LLM_BASE_URL", "http://127.0.0.1:9999")
+        client = LLMClientFactory.create_from_env()
+        assert isinstance(client, AnthropicCompatibleClient)
+        assert client.base_url == "http://127.0.0.1:9999"
+
+    def test_create_from_env_missing_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test missing API key raises ConfigurationError."""
+        monkeypatch.setenv("LLM_PROVIDER", "openai")
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        with pytest.raises(ConfigurationError):
+            LLMClientFactory.create_from_env()
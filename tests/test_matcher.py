@@ -0,0 +1,98 @@
+"""
+Tests for the Aho-Corasick term matcher.
+多模式术语匹配测试
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.data.matcher import AhoCorasick, TermMatcher, TermMatches
+from src.data.schema import Paper
+from src.utils.exceptions import ConfigurationError
+
+
+def _paper(pid: str, title: str, abstract: str = "", keywords: list[str] | None = None) -> Paper:
+    return Paper(id=pid, title=title, abstract=abstract, keywords=keywords or [], year=2024)
+
+
+class TestAhoCorasick:
+    """Test the automaton itself."""
+
+    def test_overlapping_matches(self) -> None:
+        """Test the classic he/she/his/hers example over characters."""
+        automaton = AhoCorasick(["he", "she", "his", "hers"])
+        matches = sorted(automaton.iter_matches("ushers"))
+        assert matches == [(4, 0), (4, 1), (6, 3)]
+
+    def test_match_ids(self) -> None:
+        """Test match_ids reports each pattern once."""
+        automaton = AhoCorasick([("video", "generation"), ("generation",)])
+        assert automaton.match_ids(["video", "generation", "generation"]) == {0, 1}
+
+
+class TestTermMatcher:
+    """Test term matching over papers."""
+
+    def test_word_boundaries_and_case(self) -> None:
+        """Test matches are case-insensitive and whole-word."""
+        matcher = TermMatcher(["RAG", "Video Generation"])
+        assert matcher.match_paper(_paper("1", "Storage for VIDEO generation")) == [
+            "Video Generation"
+        ]
+        assert matcher.match_paper(_paper("2", "Scaling RAG pipelines")) == ["RAG"]
+
+    def test_aliases_and_punctuation(self) -> None:
+        """Test aliases map to their term and hyphens act as word breaks."""
+        matcher = TermMatcher({"RAG": ["retrieval augmented generation"]})
+        paper = _paper("1", "Retrieval-Augmented Generation for QA")
+        assert matcher.match_paper(paper) == ["RAG"]
+
+    def test_fields_scanned_and_not_spanned(self) -> None:
+        """Test keywords and abstract are scanned but matches do not cross fields."""
+        matcher = TermMatcher(["diffusion models", "lora", "title abstract"])
+        paper = _paper(
+            "1", "A title", abstract="abstract about LoRA", keywords=["Diffusion Models"]
+        )
+        assert matcher.match_paper(paper) == ["diffusion models", "lora"]
+
+        title_only = TermMatcher(["lora"], fields=("title",))
+        assert title_only.match_paper(paper) == []
+
+    def test_match_papers_counts(self) -> None:
+        """Test per-term hit lists and counts include unmatched terms."""
+        papers = [
+            _paper("1", "Video Generation with Diffusion"),
+            _paper("2", "Diffusion Policies"),
+            _paper("3", "Graph Networks"),
+        ]
+        result = TermMatcher(["diffusion", "video generation", "quantum"]).match_papers(papers)
+        assert result.hits == {"diffusion": ["1", "2"], "video generation": ["1"], "quantum": []}
+        assert result.counts() == {"diffusion": 2, "video generation": 1, "quantum": 0}
+        assert result.papers_scanned == 3
+
+    def test_merge(self) -> None:
+        """Test merging per-file matches."""
+        a = TermMatches(hits={"x": ["1"]}, papers_scanned=1)
+        b = TermMatches(hits={"x": ["2"], "y": ["2"]}, papers_scanned=2)
+        merged = a.merge(b)
+        assert merged.counts() == {"x": 2, "y": 1}
+        assert merged.papers_scanned == 3
+        assert a.hits == {"x": ["1"]}
+
+    def test_match_files_parallel(self, sample_papers_csv: Path, tmp_path: Path) -> None:
+        """Test parallel matching across files equals inline matching."""
+        copy = tmp_path / "copy.csv"
+        copy.write_bytes(sample_papers_csv.read_bytes())
+        matcher = TermMatcher(["video generation", "lora", "diffusion models"])
+        parallel = matcher.match_files([sample_papers_csv, copy], max_workers=2)
+        inline = matcher.match_files([sample_papers_csv, copy], max_workers=1)
+        assert parallel == inline
+        assert parallel[str(copy)].counts()["video generation"] >= 1
+
+    def test_invalid_configuration(self) -> None:
+        """Test unknown fields and empty term lists are rejected."""
+        with pytest.raises(ConfigurationError):
+            TermMatcher(["x"], fields=("body",))
+        with pytest.raises(ConfigurationError):
+            TermMatcher([])
@@ -0,0 +1,130 @@
+"""
+Tests for report rendering module.
+报告生成模块测试
+"""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from src.evaluation.schema import EvaluationResult
+from src.evaluation.sensitivity import IndicatorMatrix
+from src.report.renderer import TEMPLATES_DIR, ReportRenderer, get_environment
+from src.report.writer import BatchReportWriter, slugify
+from src.utils.exceptions import ConfigurationError
+
+ResultFactory = Callable[..., EvaluationResult]
+
+
+class TestReportRenderer:
+    """Test ReportRenderer."""
+
+    def test_render_markdown_english(self, make_result: ResultFactory) -> None:
+        """Test Markdown rendering with English labels."""
+        result = make_result("Video Generation", 8.0, reasons={"p1": "Rapid growth | many orals"})
+        text = ReportRenderer(language="en").render(result)
+        assert "# Research Direction Evaluation: Video Generation" in text
+        assert "8.00" in text
+        assert "Strategic Focus" in text
+        assert "战略重点" not in text
+        assert "Rapid growth \\| many orals" in text
+
+    def test_render_both_languages(self, make_result: ResultFactory) -> None:
+        """Test 'both' renders zh and en labels together."""
+        text = ReportRenderer(language="both").render(make_result("RAG"))
+        assert "决策建议 / Decision" in text
+
+    def test_render_html_escapes(self, make_result: ResultFactory) -> None:
+        """Test HTML output is autoescaped."""
+        text = ReportRenderer(language="en").render(make_result("<script>"), fmt="html")
+        assert "&lt;script&gt;" in text
+        assert "<script>" not in text
+
+    def test_fused_banner(self, make_result: ResultFactory) -> None:
+        """Test fused directions are flagged."""
+        result = make_result("LLM Pretraining")
+        result.scores.f1 = 2.0
+        text = ReportRenderer(language="en").render(result)
+        assert "Fuse triggered" in text
+
+    def test_templates_compiled_once(self, make_result: ResultFactory) -> None:
+        """Test renderers share a cached environment and reuse compiled templates."""
+        first = ReportRenderer(language="en")
+        second = ReportRenderer(language="zh")
+        assert first._env is second._env is get_environment(str(TEMPLATES_DIR))
+        assert first.get_template("direction.md.j2") is second.get_template("direction.md.j2")
+        assert "Decision" in first.render(make_result("RAG"))
+        assert "Decision" not in second.render(make_result("RAG"))
+
+    def test_invalid_language(self) -> None:
+        """Test unsupported language raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            ReportRenderer(language="fr")  # type: ignore[arg-type]
+
+
+class TestBatchReportWriter:
+    """Test BatchReportWriter."""
+
+    def test_slugify(self) -> None:
+        """Test direction names become file-friendly slugs."""
+        assert slugify("Video Generation") == "video-generation"
+        assert slugify("Vision-Language / 3D") == "vision-language-3d"
+        assert slugify("多模态 对齐") == "多模态-对齐"
+        assert slugify("???") == "direction"
+
+    def test_slugify_caps_length(self) -> None:
+        """Test long names are truncated to the byte limit and stay distinct."""
+        first = slugify("多模态" * 32 + "甲")
+        second = slugify("多模态" * 32 + "乙")
+        assert len(first.encode("utf-8")) <= 80
+        assert first != second
+        assert first.startswith("多模态")
+
+    def test_write_batch_long_direction(self, make_result: ResultFactory, tmp_path: Path) -> None:
+        """Test a very long direction name does not exceed file name limits."""
+        writer = BatchReportWriter(tmp_path, language="en", use_processes=False)
+        summary = writer.write_batch([make_result("多模态对齐" * 20)])
+        assert summary.direction_count == 1
+        assert len(list((tmp_path / "directions").glob("*.md"))) == 1
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_write_batch_from_generator(
+        self, make_result: ResultFactory, tmp_path: Path, use_processes: bool
+    ) -> None:
+        """Test streaming a generator of results into per-direction and index files."""
+
+        def results() -> Iterator[EvaluationResult]:
+            for i in range(20):
+                yield make_result(f"Direction {i % 15}", 1.0 + (i % 10))
+
+        writer = BatchReportWriter(
+            tmp_path,
+            language="en",
+            formats=("md", "html"),
+            max_workers=2,
+            use_processes=use_processes,
+            max_in_flight=3,
+        )
+        summary = writer.write_batch(results())
+
+        assert summary.direction_count == 20
+        assert len(list((tmp_path / "directions").glob("*.md"))) == 20
+        assert len(list((tmp_path / "directions").glob("*.html"))) == 20
+        # Duplicate direction names get distinct files
+        assert (tmp_path / "directions" / "direction-0-2.md").exists()
+
+        index = Path(summary.index_paths["md"]).read_text(encoding="utf-8")
+        rows = [line for line in index.splitlines() if line.startswith("| ") and "[md]" in line]
+        assert len(rows) == 20
+        # Index is ordered by ROI descending
+        assert "10.00" in rows[0]
+        assert "html" in summary.index_paths
+        # Raw indicator matrix is kept for sensitivity analysis
+        matrix = IndicatorMatrix.load(Path(summary.matrix_path or ""))
+        assert len(matrix) == 20
+
+    def test_invalid_format(self, tmp_path: Path) -> None:
+        """Test unsupported format raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            BatchReportWriter(tmp_path, formats=("pdf",))
@@ -0,0 +1,180 @@
+"""
+Tests for the embedding store, IVF index and retrieval helpers.
+向量存储、IVF 索引与检索测试
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.data.schema import Paper
+from src.evaluation.engine import EvaluationEngine
+from src.evaluation.schema import EvaluationResult
+from src.llm.clients import OpenAICompatibleClient
+from src.llm.fake_server import FakeLLMServer
+from src.retrieval.embedder import CachedEmbedder, HashingEmbedder, ProviderEmbedder
+from src.retrieval.index import IVFIndex, exact_search
+from src.retrieval.memory import EvaluationMemory
+from src.retrieval.papers import PaperRetriever
+from src.retrieval.store import EmbeddingStore
+from src.utils.exceptions import ConfigurationError
+
+
+def _random_unit(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class TestEmbedders:
+    """Test local and provider embedders."""
+
+    def test_hashing_embedder_unit_norm_and_deterministic(self) -> None:
+        """Test rows are unit-norm and repeatable."""
+        embedder = HashingEmbedder(dim=128)
+        a = embedder.embed(["Video Generation", "RAG"])
+        b = embedder.embed(["Video Generation", "RAG"])
+        assert a.shape == (2, 128) and a.dtype == np.float32
+        np.testing.assert_allclose(np.linalg.norm(a, axis=1), 1.0, rtol=1e-5)
+        np.testing.assert_array_equal(a, b)
+
+    def test_hashing_embedder_similarity(self) -> None:
+        """Test spelling variants are closer than unrelated directions."""
+        embedder = HashingEmbedder()
+        v = embedder.embed(
+            ["Multimodal Alignment", "multi-modal alignment", "Retrieval-Augmented Generation"]
+        )
+        assert v[0] @ v[1] > 0.5
+        assert v[0] @ v[1] > v[0] @ v[2]
+
+    def test_cached_embedder_calls_inner_once(self) -> None:
+        """Test repeated texts are embedded once."""
+        calls: list[int] = []
+
+        class Counting(HashingEmbedder):
+            def embed(self, texts):  # type: ignore[no-untyped-def]
+                calls.append(len(texts))
+                return super().embed(texts)
+
+        embedder = CachedEmbedder(Counting(dim=64))
+        first = embedder.embed(["a", "b"])
+        second = embedder.embed(["b", "a", "c"])
+        assert calls == [2, 1]
+        np.testing.assert_array_equal(first[0], second[1])
+
+    def test_provider_embedder(self, fake_llm_server: FakeLLMServer) -> None:
+        """Test the provider embedder against the fake /v1/embeddings endpoint."""
+        client = OpenAICompatibleClient(api_key="k", base_url=fake_llm_server.openai_base_url)
+        with client:
+            embedder = ProviderEmbedder(client, model="fake-embed", dim=64, batch_size=2)
+            vectors = embedder.embed(["x", "y", "z"])
+        assert vectors.shape == (3, 64)
+        np.testing.assert_allclose(vectors, HashingEmbedder(dim=64).embed(["x", "y", "z"]))
+
+
+class TestIndexAndStore:
+    """Test the IVF index and memory-mapped store."""
+
+    def test_ivf_recall(self) -> None:
+        """Test IVF search finds the exact neighbour for most queries."""
+        vectors = _random_unit(2000, 32)
+        index = IVFIndex.build(vectors, nlist=32)
+        queries = _random_unit(50, 32, seed=1)
+        hits = sum(
+            index.search(vectors, q, k=1, nprobe=8)[0][0] == exact_search(vectors, q, k=1)[0][0]
+            for q in queries
+        )
+        assert hits >= 40
+
+    def test_store_roundtrip_and_tail_search(self, tmp_path: Path) -> None:
+        """Test persistence and exact search over rows added after the index."""
+        vectors = _random_unit(300, 16)
+        store = EmbeddingStore(tmp_path, dim=16, model="m")
+        store.add([f"r{i}" for i in range(200)], vectors[:200], [{"i": i} for i in range(200)])
+        store.build_index(nlist=8)
+        store.add([f"r{i}" for i in range(200, 300)], vectors[200:])
+
+        reopened = EmbeddingStore(tmp_path, dim=16, model="m")
+        assert len(reopened) == 300
+        assert isinstance(reopened.vectors, np.memmap)
+        assert reopened.index is not None and reopened.index.size == 200
+        row, score = reopened.search(vectors[250], k=1)[0]
+        assert row == 250 and score == pytest.approx(1.0, abs=1e-5)
+        assert reopened.payloads[5] == {"i": 5}
+
+    def test_store_rejects_other_model(self, tmp_path: Path) -> None:
+        """Test reopening with a different dimension fails loudly."""
+        EmbeddingStore(tmp_path, dim=16, model="m")
+        with pytest.raises(ConfigurationError):
+            EmbeddingStore(tmp_path, dim=32, model="m")
+
+
+class TestRetrieval:
+    """Test evaluation memory, engine reuse and paper retrieval."""
+
+    def test_memory_find_similar(
+        self, tmp_path: Path, make_result: Callable[..., EvaluationResult]
+    ) -> None:
+        """Test the nearest stored direction comes first."""
+        memory = EvaluationMemory(tmp_path)
+        memory.add(make_result("Video Generation", 8))
+        memory.add(make_result("Graph Neural Networks", 4))
+        similar = memory.find_similar("video generation", k=2)
+        assert similar[0].result.direction == "Video Generation"
+        assert similar[0].similarity == pytest.approx(1.0, abs=1e-5)
+        assert memory.find_similar("video generation", min_similarity=1.1) == []
+
+    def test_engine_reuses_near_duplicates(
+        self, tmp_path: Path, fake_llm_server: FakeLLMServer
+    ) -> None:
+        """Test a near-duplicate direction is served from memory."""
+        client = OpenAICompatibleClient(api_key="k", base_url=fake_llm_server.openai_base_url)
+        with client:
+            engine = EvaluationEngine(
+                client, batch_mode="all", memory=EvaluationMemory(tmp_path), reuse_threshold=0.95
+            )
+            first = engine.evaluate("Video Generation")
+            second = engine.evaluate("video  generation")
+            engine.evaluate("Graph Neural Networks")
+        usage = engine.usage
+        assert usage.llm_calls == 2
+        assert usage.reused_results == 1
+        assert second.direction == "video  generation"
+        assert second.scores == first.scores
+        # Acronyms are not near-duplicates for the hashing embedder
+        assert EvaluationMemory(tmp_path).find_similar("VG", min_similarity=0.95) == []
+
+    def test_engine_reuse_respects_compute_budget(
+        self, tmp_path: Path, fake_llm_server: FakeLLMServer
+    ) -> None:
+        """Test a result scored under one budget is not reused under another."""
+        memory = EvaluationMemory(tmp_path)
+        with OpenAICompatibleClient(api_key="k", base_url=fake_llm_server.openai_base_url) as llm:
+            large = EvaluationEngine(llm, batch_mode="all", memory=memory, compute_budget="8xA100")
+            small = EvaluationEngine(
+                llm, batch_mode="all", memory=memory, compute_budget="single-4090"
+            )
+            large.evaluate("Video Generation")
+            small.evaluate("Video Generation")
+            small.evaluate("video generation")
+        assert large.usage.llm_calls == 1
+        assert small.usage.llm_calls == 1
+        assert small.usage.reused_results == 1
+        hits = memory.find_similar("Video Generation", k=5, compute_budget="8xA100")
+        assert [hit.compute_budget for hit in hits] == ["8xA100"]
+        assert memory.find_similar("Video Generation", compute_budget=None) == []
+
+    def test_paper_retriever(self, tmp_path: Path) -> None:
+        """Test semantic paper search and idempotent indexing."""
+        papers = [
+            Paper(id="1", title="Diffusion Models for Video Generation", year=2024),
+            Paper(id="2", title="Retrieval-Augmented Generation at Scale", year=2024),
+            Paper(id="3", title="Graph Transformers", keywords=["graph", "gnn"], year=2023),
+        ]
+        retriever = PaperRetriever(tmp_path)
+        assert retriever.add_papers(papers) == 3
+        assert retriever.add_papers(papers) == 0
+        hits = retriever.search("video generation", k=2)
+        assert hits[0].paper.id == "1"
+        assert hits[0].similarity > hits[1].similarity
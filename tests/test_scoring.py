@@ -0,0 +1,50 @@
+"""
+Tests for P-F-C scoring and evaluation result models.
+P-F-C 评分与评估结果模型测试
+"""
+
+from collections.abc import Callable
+
+import pytest
+from pydantic import ValidationError
+
+from src.evaluation.schema import Decision, EvaluationResult
+from src.evaluation.scoring import classify_decision, compute_roi
+
+ResultFactory = Callable[..., EvaluationResult]
+
+
+class TestScoring:
+    """Test ROI formula and decision rules."""
+
+    def test_roi_formula(self) -> None:
+        """Test ROI = 0.35 × P_avg + 0.40 × F_min + 0.25 × C_avg."""
+        assert compute_roi(8.0, 5.0, 6.0) == pytest.approx(0.35 * 8 + 0.40 * 5 + 0.25 * 6)
+
+    def test_f_min_uses_short_board(self, make_result: ResultFactory) -> None:
+        """Test F dimension takes the minimum of F1-F3."""
+        result = make_result(f1=2.0, f2=10.0, f3=10.0)
+        assert result.f_min == 2.0
+
+    def test_fuse_forces_avoid(self, make_result: ResultFactory) -> None:
+        """Test fuse mechanism overrides a high ROI."""
+        result = make_result(p1=10, p2=10, p3=10, f1=2.9, f2=10, f3=10, c1=10, c2=10)
+        assert result.fused
+        assert result.decision == Decision.CAUTIOUS_AVOID
+
+    def test_strategic_focus(self, make_result: ResultFactory) -> None:
+        """Test ROI >= 7 gives strategic focus."""
+        result = make_result(score=8.0)
+        assert result.roi_score == pytest.approx(8.0)
+        assert result.decision == Decision.STRATEGIC_FOCUS
+
+    def test_differentiated_and_quick_win(self) -> None:
+        """Test mid-range ROI split by P_avg and F_min."""
+        assert classify_decision(6.0, 8.5, 5.0) == Decision.DIFFERENTIATED_BREAKTHROUGH.value
+        assert classify_decision(6.0, 5.0, 8.5) == Decision.QUICK_WIN.value
+        assert classify_decision(6.0, 5.0, 5.0) == Decision.CAUTIOUS_AVOID.value
+
+    def test_scores_out_of_range_rejected(self, make_result: ResultFactory) -> None:
+        """Test indicator scores must be within 1-10."""
+        with pytest.raises(ValidationError):
+            make_result(p1=11.0)
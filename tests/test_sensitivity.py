@@ -0,0 +1,150 @@
+"""
+Tests for vectorized sensitivity analysis.
+敏感性分析测试
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scripts.sensitivity import parse_args
+from src.evaluation.schema import INDICATORS, EvaluationResult, IndicatorScores
+from src.evaluation.scoring import classify_decision, compute_roi
+from src.evaluation.sensitivity import (
+    DECISION_CODES,
+    IndicatorMatrix,
+    Scenarios,
+    analyze,
+    dirichlet_weights,
+    rescore,
+    simplex_weights,
+)
+from src.utils.exceptions import ConfigurationError, DataLoadError
+
+
+def random_matrix(n: int, seed: int = 0) -> IndicatorMatrix:
+    """Random integer indicator scores in 1-10."""
+    rng = np.random.default_rng(seed)
+    scores = rng.integers(1, 11, size=(n, len(INDICATORS))).astype(float)
+    return IndicatorMatrix([f"d{i}" for i in range(n)], scores)
+
+
+class TestIndicatorMatrix:
+    """Test IndicatorMatrix construction and persistence."""
+
+    def test_from_results_and_roundtrip(self, tmp_path: Path) -> None:
+        """Test building from results and saving/loading .npz."""
+        results = [
+            EvaluationResult(
+                direction=name, scores=IndicatorScores(**{k: float(v) for k in INDICATORS})
+            )
+            for name, v in (("RAG", 5), ("视频生成", 8))
+        ]
+        matrix = IndicatorMatrix.from_results(results)
+        path = tmp_path / "m.npz"
+        matrix.save(path)
+        loaded = IndicatorMatrix.load(path)
+        assert loaded.directions == ["RAG", "视频生成"]
+        np.testing.assert_array_equal(loaded.scores, matrix.scores)
+
+    def test_shape_validation(self) -> None:
+        """Test mismatched shapes raise ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            IndicatorMatrix(["a"], np.ones((1, 3)))
+
+    def test_load_missing(self, tmp_path: Path) -> None:
+        """Test missing file raises DataLoadError."""
+        with pytest.raises(DataLoadError):
+            IndicatorMatrix.load(tmp_path / "missing.npz")
+
+
+class TestRescore:
+    """Test vectorized re-scoring."""
+
+    def test_matches_scalar_rules(self) -> None:
+        """Test vectorized ROI, fuse and decisions equal the scalar implementation."""
+        matrix = random_matrix(200, seed=1)
+        weights = dirichlet_weights(30, seed=2)
+        scenarios = Scenarios.grid(weights, fuse_thresholds=(2.0, 3.0), f1_shifts=(-2.0, 0.0, 3.0))
+        scored = rescore(matrix, scenarios)
+        assert scored.roi.shape == (len(scenarios), 200)
+
+        for k in range(0, len(scenarios), 17):
+            w = tuple(scenarios.weights[k])
+            threshold = scenarios.fuse_thresholds[k]
+            for i in range(0, 200, 13):
+                s = dict(zip(INDICATORS, matrix.scores[i], strict=True))
+                f1 = min(10.0, max(1.0, s["f1"] + scenarios.f1_shifts[k]))
+                p_avg = (s["p1"] + s["p2"] + s["p3"]) / 3
+                f_min = min(f1, s["f2"], s["f3"])
+                c_avg = (s["c1"] + s["c2"]) / 2
+                roi = compute_roi(p_avg, f_min, c_avg, w)  # type: ignore[arg-type]
+                assert scored.roi[k, i] == pytest.approx(roi)
+                assert scored.fused[k, i] == (f_min < threshold)
+                expected = classify_decision(roi, p_avg, f_min, threshold)
+                assert DECISION_CODES[scored.decisions[k, i]].value == expected
+
+    def test_ranks(self) -> None:
+        """Test ranks are 1-based by ROI descending."""
+        scores = np.array([[2.0] * 8, [9.0] * 8, [5.0] * 8])
+        ranks = rescore(IndicatorMatrix(["a", "b", "c"], scores), Scenarios.baseline()).ranks()
+        assert ranks.tolist() == [[3, 1, 2]]
+
+
+class TestAnalyze:
+    """Test rank-stability statistics."""
+
+    def test_simplex_weights_sum_to_one(self) -> None:
+        """Test grid weights lie on the simplex."""
+        weights = simplex_weights(step=0.05)
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+        assert (weights >= 0.05 - 1e-9).all()
+
+    @pytest.mark.parametrize("step", [0.3, 0.15, 0.07])
+    def test_simplex_weights_non_divisor_step(self, step: float) -> None:
+        """Test steps that do not divide 1 still give weights summing to 1."""
+        weights = simplex_weights(step=step, min_weight=0.05)
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+        assert (weights >= 0.05 - 1e-9).all()
+        with pytest.raises(ConfigurationError):
+            simplex_weights(step=0.3, min_weight=0.4)
+
+    def test_baseline_only_is_perfectly_stable(self) -> None:
+        """Test a single baseline scenario gives rho = 1 and zero rank spread."""
+        report = analyze(random_matrix(30), Scenarios.baseline(), top_k=5)
+        assert report.mean_spearman == pytest.approx(1.0)
+        assert report.mean_top_k_overlap == pytest.approx(1.0)
+        assert all(s.std_rank == 0 for s in report.stability)
+        assert [s.baseline_rank for s in report.stability] == list(range(1, 31))
+
+    def test_thousands_of_scenarios(self) -> None:
+        """Test statistics over a large scenario grid."""
+        matrix = random_matrix(100, seed=3)
+        scenarios = Scenarios.grid(simplex_weights(0.05), (2.0, 3.0, 4.0), (-2.0, 0.0, 2.0))
+        assert len(scenarios) > 1000
+        report = analyze(matrix, scenarios, top_k=10)
+
+        assert report.scenarios == len(scenarios)
+        assert -1.0 <= report.min_spearman <= report.mean_spearman <= 1.0
+        for stat in report.stability:
+            assert stat.best_rank <= stat.mean_rank <= stat.worst_rank
+            assert sum(stat.decision_rates.values()) == pytest.approx(1.0)
+
+    def test_empty_matrix_rejected(self) -> None:
+        """Test analysis needs at least one direction."""
+        with pytest.raises(ConfigurationError):
+            analyze(IndicatorMatrix([], np.empty((0, 8))), Scenarios.baseline())
+
+
+class TestCommandLine:
+    """Test the sensitivity script's argument parsing."""
+
+    def test_negative_f1_shifts(self) -> None:
+        """Test negative F1 shifts parse as values rather than options."""
+        args = parse_args(
+            ["--matrix", "m.npz", "--f1-shifts", "-2", "0", "2", "--fuse-thresholds", "2", "3"]
+        )
+        assert args.f1_shifts == [-2.0, 0.0, 2.0]
+        assert args.fuse_thresholds == [2.0, 3.0]
+        assert parse_args(["--matrix", "m.npz"]).f1_shifts == [0.0]